@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Create parents storage usage table."""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy_utils.types import UUIDType
+
+# revision identifiers, used by Alembic.
+revision = "1792195200"
+down_revision = "1780576627"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "rdm_parents_storage_usage",
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.Column("updated", sa.DateTime(), nullable=False),
+        sa.Column("parent_id", UUIDType(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("used_bytes", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["parent_id"],
+            ["rdm_parents_metadata.id"],
+            name=op.f("fk_rdm_parents_storage_usage_parent_id_rdm_parents_metadata"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("parent_id", name=op.f("pk_rdm_parents_storage_usage")),
+    )
+    op.create_index(
+        op.f("ix_rdm_parents_storage_usage_user_id"),
+        "rdm_parents_storage_usage",
+        ["user_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(
+        op.f("ix_rdm_parents_storage_usage_user_id"),
+        table_name="rdm_parents_storage_usage",
+    )
+    op.drop_table("rdm_parents_storage_usage")
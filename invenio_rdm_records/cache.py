@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Process-local caches."""
+
+import threading
+import time
+from collections import OrderedDict
+
+_missing = object()
+
+
+class TTLCache:
+    """Bounded, thread-safe LRU cache whose entries expire after a time-to-live.
+
+    The cache is local to the process, it is meant for small and hot data that
+    is expensive to compute or fetch but that tolerates being slightly stale
+    (for at most ``ttl`` seconds, unless it's invalidated explicitly).
+    """
+
+    def __init__(self, maxsize=128, ttl=300, timer=time.monotonic):
+        """Constructor.
+
+        :param maxsize: maximum number of entries, the least recently used
+            entries are evicted first.
+        :param ttl: number of seconds after which an entry expires. ``None``
+            means that the entries never expire.
+        :param timer: function returning the current time, in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        """Number of (possibly expired) entries in the cache."""
+        return len(self._data)
+
+    def __contains__(self, key):
+        """Check if the cache holds a valid entry for the key."""
+        return self.get(key, _missing, count=False) is not _missing
+
+    def get(self, key, default=None, count=True):
+        """Get the value for the key, or the default if not cached or expired."""
+        with self._lock:
+            expires_at, value = self._data.get(key, (None, _missing))
+            if value is not _missing and expires_at is not None:
+                if expires_at <= self.timer():
+                    del self._data[key]
+                    value = _missing
+
+            if value is _missing:
+                if count:
+                    self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            if count:
+                self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """Set the value for the key, evicting the least recently used entries."""
+        expires_at = self.timer() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key, factory):
+        """Get the value for the key, computing and caching it if needed."""
+        value = self.get(key, _missing)
+        if value is _missing:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def update(self, key, func):
+        """Replace the value of the key with ``func(value)``, keeping its expiry.
+
+        The value is replaced under the lock, so that concurrent updates are not
+        lost. Nothing is done if the key is not cached (or expired).
+        """
+        with self._lock:
+            value = self.get(key, _missing, count=False)
+            if value is not _missing:
+                expires_at, _ = self._data[key]
+                self._data[key] = (expires_at, func(value))
+
+    def delete(self, key):
+        """Remove the entry of the key, if any."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate(self, predicate=None):
+        """Remove the entries whose key matches the predicate, or all of them."""
+        with self._lock:
+            if predicate is None:
+                self._data.clear()
+                return
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def stats(self):
+        """Get the hit/miss counters of the cache."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
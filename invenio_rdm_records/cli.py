@@ -5,11 +5,14 @@
 
 """Command-line tools for demo module."""
 
+import time
+
 import click
 from flask import current_app
 from flask.cli import with_appcontext
 from invenio_access.permissions import system_identity
 from invenio_communities import current_communities
+from invenio_db import db
 from invenio_records_resources.proxies import current_service_registry
 from invenio_records_resources.services.custom_fields.errors import (
     CustomFieldsException,
@@ -18,9 +21,11 @@ from invenio_records_resources.services.custom_fields.mappings import Mapping
 from invenio_records_resources.services.custom_fields.validate import (
     validate_custom_fields,
 )
+from invenio_records_resources.services.uow import RecordCommitOp, UnitOfWork
 from invenio_search import current_search_client
 from invenio_search.engine import dsl, search
 from invenio_search.utils import build_alias_name
+from lxml import etree
 
 from .fixtures import FixturesEngine
 from .fixtures.demo import (
@@ -36,7 +41,15 @@ from .fixtures.tasks import (
     create_demo_record,
     get_authenticated_identity,
 )
-from .proxies import current_rdm_records, current_rdm_records_service
+from .oai import OAI_METADATA_RENDERERS, render_oai_metadata
+from .proxies import (
+    current_rdm_records,
+    current_rdm_records_service,
+    current_rdm_records_storage_service,
+)
+from .records.processors.tiles import TilesProcessor
+from .records.systemfields.deletion_status import RecordDeletionStatusEnum
+from .resources.serializers import DCATSerializer, MARCXMLSerializer
 from .utils import get_or_create_user
 
 COMMUNITY_OWNER_EMAIL = "community@demo.org"
@@ -443,3 +456,215 @@ def custom_field_exists_in_records(field_name):
         click.secho(f"Field {field_name} exists", fg="green")
     else:
         click.secho(f"Field {field_name} does not exist", fg="red")
+
+
+# IIIF TILES
+
+
+@rdm_records.group()
+def tiles():
+    """IIIF tiles commands."""
+
+
+@tiles.command("backfill")
+@click.option(
+    "--recid",
+    "recids",
+    multiple=True,
+    help="Record to generate the tiles for (can be repeated). Defaults to all.",
+)
+@with_appcontext
+def backfill_tiles(recids):
+    """Generate the missing tiles of already published records.
+
+    Only the files without (up-to-date) tiles are converted, in batches of
+    ``IIIF_TILES_BATCH_SIZE`` files per task.
+    """
+    service = current_rdm_records_service
+    record_cls = service.record_cls
+    processors = [
+        processor
+        for processor in service.config.record_file_processors
+        if isinstance(processor, TilesProcessor)
+    ] or [TilesProcessor()]
+
+    if recids:
+        ids = [record_cls.pid.resolve(recid).id for recid in recids]
+    else:
+        model_cls = record_cls.model_cls
+        ids = [
+            id_
+            for (id_,) in db.session.query(model_cls.id).filter(
+                model_cls.is_deleted.is_(False),
+                model_cls.deletion_status == RecordDeletionStatusEnum.PUBLISHED.value,
+            )
+        ]
+
+    start = time.perf_counter()
+    processed = 0
+    for id_ in ids:
+        try:
+            with UnitOfWork() as uow:
+                record = record_cls.get_record(id_)
+                for processor in processors:
+                    processor(None, record, uow=uow)
+                uow.register(RecordCommitOp(record, indexer=service.indexer))
+                uow.commit()
+        except Exception:
+            current_app.logger.exception(
+                "Failed to backfill tiles.", extra={"record_id": str(id_)}
+            )
+            click.secho(f"Failed to backfill the tiles of {id_}.", fg="red")
+            continue
+
+        processed += 1
+        if processed % 100 == 0:
+            elapsed = time.perf_counter() - start
+            click.echo(
+                f"{processed}/{len(ids)} records processed "
+                f"({processed / elapsed:.1f} records/s)"
+            )
+
+    click.secho(
+        f"Sent the tiles generation tasks of {processed} records to celery!",
+        fg="green",
+    )
+
+
+# STORAGE
+
+
+@rdm_records.group()
+def storage():
+    """Storage accounting commands."""
+
+
+@storage.command("rebuild-usage")
+@with_appcontext
+def rebuild_storage_usage():
+    """Recompute the storage usage of all the records.
+
+    The usage is otherwise kept up to date when files are committed or deleted.
+    """
+    current_rdm_records_storage_service.rebuild_usage()
+    click.secho("Storage usage rebuilt!", fg="green")
+
+
+# BENCHMARKS
+
+
+def _benchmark_records(n_records):
+    """Get the search dumps of (up to) the given number of published records."""
+    index = build_alias_name(current_rdm_records_service.record_cls.index.search_alias)
+    search_ = dsl.Search(using=current_search_client, index=index)[:n_records]
+    return [hit.to_dict() for hit in search_.execute()]
+
+
+def _benchmark(label, func, items):
+    """Time the function over all items and print the throughput."""
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    elapsed = time.perf_counter() - start
+    rate = len(items) / elapsed if elapsed else 0
+    click.echo(f"{label:<40} {elapsed:8.3f}s {rate:10.1f} records/s")
+
+
+@rdm_records.group()
+def benchmark():
+    """InvenioRDM benchmark commands."""
+
+
+@benchmark.command("oai-etree")
+@click.option(
+    "--n-records",
+    "-n",
+    default=100,
+    show_default=True,
+    type=int,
+    help="Number of records to render.",
+)
+@with_appcontext
+def benchmark_oai_etree(n_records):
+    """Compare the OAI-PMH etree rendering with and without a string round-trip."""
+    items = [
+        current_rdm_records_service.oai_result_item(system_identity, hit).to_dict()
+        for hit in _benchmark_records(n_records)
+    ]
+    if not items:
+        click.secho("No records to render.", fg="yellow")
+        return
+
+    for serializer_cls in (MARCXMLSerializer, DCATSerializer):
+        serializer = serializer_cls()
+        name = serializer_cls.__name__
+        _benchmark(
+            f"{name} (string round-trip)",
+            lambda item: etree.fromstring(
+                serializer.serialize_object(item).encode("utf-8")
+            ),
+            items,
+        )
+        _benchmark(f"{name} (dump_etree)", serializer.dump_etree, items)
+
+
+@benchmark.command("oai-formats")
+@click.option(
+    "--n-records",
+    "-n",
+    default=100,
+    show_default=True,
+    type=int,
+    help="Number of records to render.",
+)
+@with_appcontext
+def benchmark_oai_formats(n_records):
+    """Report the OAI-PMH rendering throughput of each metadata prefix."""
+    hits = _benchmark_records(n_records)
+    if not hits:
+        click.secho("No records to render.", fg="yellow")
+        return
+
+    for metadata_prefix in OAI_METADATA_RENDERERS:
+        _benchmark(
+            metadata_prefix,
+            lambda hit: render_oai_metadata(metadata_prefix, system_identity, hit),
+            hits,
+        )
+
+
+@benchmark.command("links")
+@click.option(
+    "--n-records",
+    "-n",
+    default=1000,
+    show_default=True,
+    type=int,
+    help="Number of records to expand the links of.",
+)
+@with_appcontext
+def benchmark_links(n_records):
+    """Compare the expansion of the search hits links."""
+    service = current_rdm_records_service
+    records = [service.record_cls.loads(hit) for hit in _benchmark_records(n_records)]
+    if not records:
+        click.secho("No records to expand the links of.", fg="yellow")
+        return
+
+    compiled = current_app.config.get("RDM_LINKS_COMPILED", True)
+    try:
+        current_app.config["RDM_LINKS_COMPILED"] = False
+        tpl = service.links_item_tpl
+        _benchmark("url_for", lambda r: tpl.expand(system_identity, r), records)
+
+        current_app.config["RDM_LINKS_COMPILED"] = True
+        tpl = service.links_item_tpl
+        _benchmark("compiled", lambda r: tpl.expand(system_identity, r), records)
+        keys = service.config.links_item_minimal
+        _benchmark(
+            "compiled (links=minimal)",
+            lambda r: tpl.expand(system_identity, r, keys=keys),
+            records,
+        )
+    finally:
+        current_app.config["RDM_LINKS_COMPILED"] = compiled
@@ -3,25 +3,157 @@
 
 """Collections celery tasks."""
 
+import operator
+from datetime import datetime, timezone
+from functools import reduce
+
+import sqlalchemy as sa
 from celery import shared_task
 from flask import current_app
 from invenio_access.permissions import system_identity
 from invenio_db import db
+from invenio_search.engine import dsl
+from invenio_search.proxies import current_search_client
+from invenio_stats.bookmark import BookmarkAPI
 
 from ..proxies import current_community_collections_service
+from ..records.systemfields.deletion_status import RecordDeletionStatusEnum
+
+
+def _collection_query(collection, collections_by_id):
+    """Get the query of a collection, without fetching its ancestors again."""
+    ancestors = [
+        collections_by_id[id_]
+        for id_ in collection.split_path_to_ids()
+        if id_ in collections_by_id
+    ]
+    queries = [
+        dsl.Q("query_string", query=c.search_query) for c in [*ancestors, collection]
+    ]
+    return reduce(operator.and_, queries)
+
+
+def _count_search(records_service, collection, query):
+    """Build the search counting the records of a (community) collection."""
+    namespace_id = collection.collection_tree.namespace_id
+    if not namespace_id:
+        raise NotImplementedError(
+            "Search for collections without namespace not supported."
+        )
+
+    # same filters as the community records search
+    community_filter = dsl.Q(
+        "term", **{"parent.communities.ids": str(namespace_id)}
+    ) & dsl.Q("term", deletion_status=RecordDeletionStatusEnum.PUBLISHED.value)
+    search = records_service._search(
+        "search",
+        system_identity,
+        {},
+        None,
+        extra_filter=community_filter & query,
+        permission_action="read",
+    )
+    return search.extra(size=0, track_total_hits=True)
+
+
+def _records_changed_since(records_service, since):
+    """Check if any record (or its parent) was updated since the given date."""
+    search = (
+        dsl.Search(
+            using=current_search_client,
+            index=records_service.record_cls.index.search_alias,
+        )
+        .filter(
+            dsl.Q("range", updated={"gte": since})
+            | dsl.Q("range", **{"parent.updated": {"gte": since}})
+        )
+        .extra(size=0, track_total_hits=1)
+    )
+    return search.execute().hits.total.value > 0
 
 
 @shared_task(ignore_result=True)
-def update_collections_size():
-    """Calculate and update the size of all the collections."""
-    res = current_community_collections_service.read_all(system_identity, depth=0)
-    for citem in res:
+def update_collections_size(force=False):
+    """Calculate and update the size of all the collections.
+
+    The sizes are counted with one multi-search request per
+    ``RDM_COLLECTIONS_SIZE_CHUNK_SIZE`` collections, and stored with a single
+    ``UPDATE`` statement. Unless ``force`` is set, the collections are skipped
+    if neither their query (nor the query of their ancestors) nor the records
+    have changed since the last successful run, i.e. a run in which all the
+    collections could be counted.
+    """
+    service = current_community_collections_service
+    records_service = service.records_service
+    chunk_size = current_app.config["RDM_COLLECTIONS_SIZE_CHUNK_SIZE"]
+
+    bm = BookmarkAPI(current_search_client, "collections_size", "day")
+    last_run = None if force else bm.get_bookmark()
+    start_time = datetime.now(timezone.utc)
+
+    res = service.read_all(system_identity, depth=0)
+    collections = [citem._collection for citem in res]
+    collections_by_id = {c.id: c for c in collections}
+
+    def is_modified(collection):
+        ids = [*collection.split_path_to_ids(), collection.id]
+        return any(
+            collections_by_id[id_].model.updated.replace(tzinfo=timezone.utc)
+            >= last_run
+            for id_ in ids
+            if id_ in collections_by_id
+        )
+
+    if last_run and not _records_changed_since(records_service, last_run):
+        collections = [c for c in collections if is_modified(c)]
+
+    failed = 0
+    searches = []
+    for collection in collections:
         try:
-            collection = citem._collection
-            res = current_community_collections_service.search_collection_records(
-                system_identity, collection
+            query = _collection_query(collection, collections_by_id)
+            searches.append(
+                (collection, _count_search(records_service, collection, query))
             )
-            collection.update(num_records=res.total)
-            db.session.commit()
         except Exception as e:
             current_app.logger.exception(str(e))
+            failed += 1
+
+    sizes = {}
+    for i in range(0, len(searches), chunk_size):
+        chunk = searches[i : i + chunk_size]
+        msearch = dsl.MultiSearch(using=current_search_client)
+        for _, search in chunk:
+            msearch = msearch.add(search)
+        responses = msearch.execute(raise_on_error=False)
+        for (collection, _), response in zip(chunk, responses):
+            if response is None:
+                current_app.logger.error(
+                    f"Failed to count the records of collection {collection.id}."
+                )
+                failed += 1
+                continue
+            if collection.model.num_records != response.hits.total.value:
+                sizes[collection.id] = response.hits.total.value
+
+    if sizes:
+        model_cls = service.collection_cls.model_cls
+        db.session.execute(
+            sa.update(model_cls)
+            .where(model_cls.id.in_(sizes))
+            .values(
+                num_records=sa.case(sizes, value=model_cls.id),
+                # keep the modification date, which tells when the query changed
+                updated=model_cls.updated,
+            )
+            .execution_options(synchronize_session=False)
+        )
+    db.session.commit()
+    # the failed collections are counted again by the next run
+    if not failed:
+        bm.set_bookmark(start_time.isoformat())
+
+    current_app.logger.info(
+        f"Collections size: {len(searches)} collections counted, "
+        f"{len(sizes)} updated, {failed} failed."
+    )
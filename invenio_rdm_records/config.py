@@ -19,6 +19,7 @@ from invenio_records_resources.services.records.queryparser.transformer import (
     RestrictedTermValue,
     SearchFieldTransformer,
 )
+from kombu import Exchange, Queue
 
 import invenio_rdm_records.services.communities.moderation as communities_moderation
 from invenio_rdm_records.services.components.pids import validate_optional_doi
@@ -58,6 +59,14 @@ password from ``users.yaml`` will be used. If that is also absent, a password
 will be generated randomly.
 """
 
+RDM_FIXTURES_VOCABULARIES_BATCH_SIZE = 1000
+"""Number of vocabulary fixture entries loaded at once.
+
+The entries of each batch are created or updated in one transaction (and one
+Celery task, when delayed), and bulk indexed. If ``None``, the entries are
+loaded one by one.
+"""
+
 RDM_RECORDS_UI_EDIT_URL = "/uploads/<pid_value>"
 """Default UI URL for the edit page of a Bibliographic Record."""
 
@@ -67,6 +76,61 @@ RDM_ARCHIVE_DOWNLOAD_ENABLED = True
 RDM_STATS_EXCLUDE_PREVIEW_FILE_DOWNLOAD_EVENTS = False
 """Exclude file-download stats events whose Referer is the file's own preview page."""
 
+RDM_STATS_REINDEX_CHUNK_SIZE = 5000
+"""Number of parent records reindexed per task when their statistics changed."""
+
+RDM_STATS_REINDEX_BOOKMARK_INTERVAL = "1m"
+"""Granularity of the bookmark of the statistics reindexing.
+
+Changed statistics are processed in order of this time interval, and an interrupted
+run resumes from the start of the interval it was processing.
+"""
+
+RDM_VOCABULARY_PROPS_CACHE_MAXSIZE = 64
+"""Maximum number of vocabularies whose props are cached by the serializers."""
+
+RDM_VOCABULARY_PROPS_CACHE_TTL = 600
+"""Number of seconds after which the cached vocabulary props are reloaded.
+
+Changes of vocabulary items invalidate the cache of the process doing them right
+away, other processes pick the changes up after this time-to-live.
+"""
+
+RDM_CITATION_STYLES_CACHE_MAXSIZE = 32
+"""Maximum number of parsed CSL (style, locale) pairs cached per process."""
+
+RDM_CITATIONS_CACHE_MAXSIZE = 10000
+"""Maximum number of rendered record citations cached per process."""
+
+RDM_CITATIONS_CACHE_TTL = 3600
+"""Number of seconds after which a cached record citation is rendered again.
+
+The citations are cached per record revision, so an edited record is rendered
+again right away.
+"""
+
+RDM_LINKS_COMPILED = True
+"""Expand the record links from URL templates compiled once per endpoint.
+
+Endpoints whose URLs cannot be built by substituting the values (e.g. with
+converted values) are always built with ``url_for``. Disable to build every link
+with ``url_for``.
+"""
+
+RDM_INDEXER_BULK_CHUNK_SIZE = 500
+"""Number of records for which data is prefetched at once when bulk indexing.
+
+The bulk indexer loads the records of each chunk with a single query and fetches
+e.g. their statistics in one round-trip, instead of once per record.
+"""
+
+RDM_RELATIONS_CACHE_MAXSIZE = 10000
+"""Maximum number of related objects cached per vocabulary type, in bulk indexing.
+
+The related vocabulary entries of the records are dereferenced with a cache
+shared by the whole bulk operation.
+"""
+
 #: Default site URL (used only when not in a context - e.g. like celery tasks).
 THEME_SITEURL = "http://127.0.0.1:5000"
 
@@ -321,6 +385,8 @@ RDM_COMMUNITY_REQUIRED_TO_PUBLISH = False
 """Enforces at least one community per record."""
 RDM_COMMUNITY_INCLUSION_REQUEST_CLS = CommunityInclusion
 """Request type for record inclusion requests."""
+RDM_COMMUNITY_BULK_ADD_CHUNK_SIZE = 500
+"""Number of records fetched and updated at once when bulk adding records."""
 RDM_ALLOW_OWNERS_REMOVE_COMMUNITY_FROM_RECORD = True
 """Allow record owners to remove communities from records.
 
@@ -332,6 +398,20 @@ to community curators, managers, and owners.
 Default: True (backwards compatible - owners can remove communities)
 """
 
+#
+# Collections
+#
+RDM_COLLECTIONS_SIZE_CHUNK_SIZE = 500
+"""Number of collections counted per multi-search request, when updating sizes."""
+
+#
+# Record revisions
+#
+RDM_RECORD_REVISIONS_DEFAULT_SIZE = 25
+"""Default number of revisions per page, when listing the revisions of a record."""
+RDM_RECORD_REVISIONS_MAX_SIZE = 500
+"""Maximum number of revisions per page, when listing the revisions of a record."""
+
 #
 # Search configuration
 #
@@ -555,6 +635,20 @@ RDM_OAI_PMH_SEARCH = {
 }
 """OAI-PMH search configuration."""
 
+RDM_OAI_PMH_CACHED_FORMATS = []
+"""OAI-PMH metadata formats pre-rendered when indexing published records.
+
+The pre-rendered formats are stored (per revision) alongside the record in the
+search index, so that harvesting does not render each record again. Available
+formats are ``oai_dc``, ``marcxml``, ``dcat``, ``datacite`` and ``oai_datacite``.
+Note that ``oai_dc`` is only pre-rendered with the default serializer options.
+
+The formats are stored in the ``oai_cache`` field, added in the records index
+``record-v7.1.0`` mapping. Existing instances must migrate their records to
+an index with this mapping (e.g. recreate the indices and run ``invenio
+rdm-records rebuild-index``) before enabling the cache.
+"""
+
 #
 # Persistent identifiers configuration
 #
@@ -685,6 +779,15 @@ DATACITE_ADDITIONAL_PREFIXES = []
 DATACITE_TEST_MODE = True
 """DataCite test mode enabled."""
 
+DATACITE_URL = None
+"""DataCite REST API base URL, used when the test mode is disabled.
+
+Defaults to the production DataCite API.
+"""
+
+DATACITE_POOL_SIZE = 10
+"""Number of HTTP connections kept open by the pooled DataCite client."""
+
 DATACITE_FORMAT = "{prefix}/{id}"
 """A string used for formatting the DOI or a callable.
 
@@ -707,6 +810,45 @@ This is only required if you want your records to be harvestable (OAI-PMH)
 in DataCite XML format.
 """
 
+# PIDs sync queue
+
+RDM_PIDS_SYNC_QUEUE_ENABLED = False
+"""Sync the PIDs with the remote providers through the coalescing queue.
+
+By default, a task is sent per PID to register or update. When enabled, the
+PIDs are published to a message queue instead, which must be processed
+periodically, e.g.:
+
+.. code-block:: python
+
+    CELERY_BEAT_SCHEDULE = {
+        "pids-sync-queue": {
+            "task": "invenio_rdm_records.services.pids.tasks.process_pids_sync_queue",
+            "schedule": timedelta(minutes=1),
+        },
+    }
+"""
+
+RDM_PIDS_SYNC_MQ_EXCHANGE = Exchange("rdm-pids-sync", type="direct")
+"""Message queue exchange of the PIDs sync queue."""
+
+RDM_PIDS_SYNC_MQ_QUEUE = Queue(
+    "rdm-pids-sync", exchange=RDM_PIDS_SYNC_MQ_EXCHANGE, routing_key="rdm-pids-sync"
+)
+"""Message queue of the PIDs sync queue."""
+
+RDM_PIDS_SYNC_MQ_ROUTING_KEY = "rdm-pids-sync"
+"""Message queue routing key of the PIDs sync queue."""
+
+RDM_PIDS_SYNC_BATCH_SIZE = 500
+"""Number of queued PIDs serialized and synced per batch."""
+
+RDM_PIDS_SYNC_CONCURRENCY = 4
+"""Number of concurrent requests to DataCite when processing the sync queue."""
+
+RDM_PIDS_SYNC_RATE_LIMIT = 10
+"""Maximum number of requests per second to DataCite (``None`` for no limit)."""
+
 # Configuration for the CrossrefClient used by the CrossrefPIDProvider
 
 CROSSREF_ENABLED = False
@@ -869,6 +1011,9 @@ RDM_COMMUNITY_CONTENT_MODERATION_HANDLERS = [
 RDM_USER_MODERATION_ENABLED = False
 """Flag to enable creation of user moderation requests on specific user actions."""
 
+RDM_USER_MODERATION_BATCH_SIZE = 500
+"""Number of records deleted (or restored) in a single transaction on user moderation."""
+
 RDM_RECORDS_MAX_FILES_COUNT = 100
 """Max amount of files allowed to upload in the deposit form."""
 
@@ -890,6 +1035,15 @@ RDM_FILES_DEFAULT_MAX_FILE_SIZE = 10 * (10**9)  # 10 GB
 RDM_FILES_DEFAULT_MAX_ADDITIONAL_QUOTA_SIZE = 0
 """Default additional quota size for a bucket in bytes for files."""
 
+RDM_STORAGE_TOP_CONSUMERS_SIZE = 20
+"""Default number of users listed by the storage top consumers endpoint."""
+
+RDM_STORAGE_TOP_CONSUMERS_MAX_SIZE = 1000
+"""Maximum number of users listed by the storage top consumers endpoint."""
+
+RDM_STORAGE_USAGE_REBUILD_CHUNK_SIZE = 1000
+"""Number of parent records per query when rebuilding the storage usage."""
+
 RDM_DATACITE_FUNDER_IDENTIFIERS_PRIORITY = ("ror", "doi", "grid", "isni", "gnd")
 """Priority of funder identifiers types to be used for DataCite serialization."""
 
@@ -912,6 +1066,13 @@ RDM_IIIF_MANIFEST_FORMATS = [
 ]
 """Formats to be included in the IIIF Manifest."""
 
+RDM_IIIF_RASTERIZE_MAX_MEMORY = 256 * 1024**2  # 256 MB
+"""Memory limit in bytes for rasterizing the first page of documents (e.g. PDFs).
+
+With PyVIPS, bigger pages are rendered at a lower scale. With ImageMagick,
+bigger documents are refused.
+"""
+
 #
 # IIIF Tiles configuration
 #
@@ -944,6 +1105,39 @@ IIIF_TILES_CONVERTER_PARAMS = {
 }
 """Parameters to be passed to the tiles converter."""
 
+IIIF_TILES_BATCH_SIZE = 50
+"""Number of files of a record converted to tiles by a single task."""
+
+IIIF_TILES_CONVERSION_CONCURRENCY = 1
+"""Number of files converted concurrently to tiles, per task."""
+
+#
+# IIIF Image API derivatives cache
+#
+IIIF_DERIVATIVES_CACHE_ENABLED = False
+"""Enable caching the images rendered by the IIIF Image API (e.g. thumbnails)."""
+
+IIIF_DERIVATIVES_CACHE_CLASS = (
+    "invenio_rdm_records.services.iiif.cache:LocalDerivativesCache"
+)
+"""Class (or import path) of the IIIF derivatives cache.
+
+Must implement the interface of
+:class:`invenio_rdm_records.services.iiif.cache.DerivativesCache`.
+"""
+
+IIIF_DERIVATIVES_CACHE_BASE_PATH = "iiif-derivatives/"
+"""Base path for storing the cached IIIF derivatives.
+
+Relative paths are resolved against the application instance path.
+"""
+
+IIIF_DERIVATIVES_CACHE_MAX_SIZE = 10**9  # 1 GB
+"""Maximum size in bytes of the IIIF derivatives cache.
+
+The least recently used derivatives are evicted when the size is exceeded.
+"""
+
 RDM_RECORDS_RESTRICTION_GRACE_PERIOD = timedelta(days=30)
 """Grace period for changing record access to restricted."""
 
@@ -953,8 +1147,30 @@ RDM_RECORDS_ALLOW_RESTRICTION_AFTER_GRACE_PERIOD = False
 RDM_RECORDS_REQUIRE_SECRET_LINKS_EXPIRATION = False
 """Whether share access links require an expiration date to be set or not."""
 
+RDM_SECRET_LINKS_VERIFICATION_CACHE_TTL = 30
+"""Number of seconds the database check of a secret link token is cached.
+
+Revoking a link evicts it right away from the cache of the current process, the
+other processes may accept the link for at most this long.
+"""
+
+RDM_SECRET_LINKS_VERIFICATION_CACHE_MAXSIZE = 10000
+"""Maximum number of secret link tokens in the verification cache."""
+
+RDM_RECORDS_GRANTS_BATCH_MAX_SIZE = 5000
+"""Maximum number of access grants created by a single batch request."""
+
 RDM_RECORDS_CONTAINER_EXTENSIONS = [".zip"]
 """List of file extensions for container files.
 Experimental, this config can later be removed."""
 
 RDM_RECORD_FILE_EXTRACTORS = [ZipExtractor()]
+
+RDM_VCS_ZIPBALL_BUFFER_SIZE = 1024 * 1024
+"""Maximum number of bytes read at once, when transferring a release zipball."""
+
+RDM_VCS_ZIPBALL_MAX_RETRIES = 3
+"""Number of resumes of a release zipball transfer, after transient failures."""
+
+RDM_VCS_ZIPBALL_RETRY_BACKOFF = 1.0
+"""Seconds before the first resume of a zipball transfer, doubled afterwards."""
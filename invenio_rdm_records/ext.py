@@ -10,6 +10,7 @@
 
 from warnings import warn
 
+import sqlalchemy as sa
 from flask import Blueprint, current_app
 from flask_iiif import IIIF
 from flask_menu import current_menu
@@ -20,6 +21,7 @@ from invenio_collections.services.config import CollectionServiceConfig
 from invenio_collections.services.service import CollectionsService
 from invenio_i18n import lazy_gettext as _
 from invenio_records_resources.resources.files import FileResource
+from invenio_vocabularies.records.models import VocabularyMetadata
 
 from . import config
 from .oaiserver.resources.config import OAIPMHServerResourceConfig
@@ -51,6 +53,11 @@ from .resources.config import (
     RDMRecordMediaFilesResourceConfig,
 )
 from .resources.resources import RDMRecordCommunitiesResource, RDMRecordRequestsResource
+from .resources.serializers.csl import CitationsCache
+from .resources.serializers.utils import (
+    VocabularyPropsCache,
+    invalidate_vocabulary_props,
+)
 from .services import (
     CommunityRecordsService,
     IIIFService,
@@ -73,6 +80,7 @@ from .services.config import (
 )
 from .services.files import RDMFileService
 from .services.pids import PIDManager, PIDsService
+from .services.pids.queue import PIDSyncQueue
 from .services.review.service import ReviewService
 from .services.storage.service import StorageService
 from .utils import verify_token
@@ -103,6 +111,7 @@ class InvenioRDMRecords(object):
     def init_app(self, app):
         """Flask application initialization."""
         self.init_config(app)
+        self.init_caches(app)
         self.init_services(app)
         self.init_resource(app)
         app.extensions["invenio-rdm-records"] = self
@@ -128,6 +137,7 @@ class InvenioRDMRecords(object):
                 or k.startswith("CROSSREF_")
                 # TODO: This can likely be moved to a separate module
                 or k.startswith("IIIF_TILES_")
+                or k.startswith("IIIF_DERIVATIVES_")
             ):
                 app.config.setdefault(k, getattr(config, k))
 
@@ -144,6 +154,25 @@ class InvenioRDMRecords(object):
 
         self.fix_datacite_configs(app)
 
+    def init_caches(self, app):
+        """Initialize the process-local caches."""
+        self.vocabulary_props_cache = VocabularyPropsCache(
+            maxsize=app.config["RDM_VOCABULARY_PROPS_CACHE_MAXSIZE"],
+            ttl=app.config["RDM_VOCABULARY_PROPS_CACHE_TTL"],
+        )
+        self.citations_cache = CitationsCache(
+            styles_maxsize=app.config["RDM_CITATION_STYLES_CACHE_MAXSIZE"],
+            maxsize=app.config["RDM_CITATIONS_CACHE_MAXSIZE"],
+            ttl=app.config["RDM_CITATIONS_CACHE_TTL"],
+        )
+        # compiled URL templates of the links, per endpoint and values
+        self.link_templates = {}
+        for event in ("after_insert", "after_update", "after_delete"):
+            if not sa.event.contains(
+                VocabularyMetadata, event, invalidate_vocabulary_props
+            ):
+                sa.event.listen(VocabularyMetadata, event, invalidate_vocabulary_props)
+
     def service_configs(self, app):
         """Customized service configs."""
 
@@ -175,6 +204,7 @@ class InvenioRDMRecords(object):
             review_service=ReviewService(service_configs.record),
         )
         self.storage_service = StorageService(records_service=self.records_service)
+        self.pids_sync_queue = PIDSyncQueue(self.records_service.pids)
 
         self.records_media_files_service = RDMRecordService(
             service_configs.record_with_media_files,
@@ -0,0 +1,189 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Bulk loading of the vocabulary fixtures."""
+
+import time
+from itertools import islice
+
+from flask import current_app
+from invenio_access.permissions import system_identity
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier
+from invenio_records_resources.proxies import current_service_registry
+from invenio_records_resources.records.systemfields import ModelPIDField
+from invenio_records_resources.services.uow import RecordBulkIndexOp, UnitOfWork
+from sqlalchemy import and_, or_
+
+
+def chunked(iterable, size):
+    """Split an iterable in lists of (at most) ``size`` items."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class VocabularyRecordsLoader:
+    """Create or update vocabulary records, one batch at a time.
+
+    Each batch is loaded in a single transaction: the records which already
+    exist are fetched with one query, and the loaded records are sent to the
+    bulk indexer at once, instead of resolving, committing and indexing each
+    entry on its own. Each entry is loaded in its own savepoint, so that an
+    invalid entry is skipped without aborting the rest of the batch.
+    """
+
+    def __init__(self, service_str, identity=system_identity):
+        """Constructor."""
+        self._service = current_service_registry.get(service_str)
+        self._service_str = service_str
+        self._identity = identity
+        self._pid_types = {}
+        self._started = None
+        self.created = 0
+        self.updated = 0
+        self.errors = 0
+
+    @property
+    def rows(self):
+        """Number of entries loaded so far."""
+        return self.created + self.updated + self.errors
+
+    @property
+    def rows_per_second(self):
+        """Loading throughput."""
+        if self._started is None:
+            return 0
+        seconds = time.monotonic() - self._started
+        return self.rows / seconds if seconds else 0
+
+    def _pid_type(self, entry):
+        """PID type of an entry, which depends on its type for generic ones."""
+        pid_field = self._service.record_cls.pid
+        if pid_field.field._pid_type:
+            return pid_field.field._pid_type
+        type_id = entry.get("type")
+        if type_id not in self._pid_types:
+            self._pid_types[type_id] = pid_field.get_pid_type(type_id)
+        return self._pid_types[type_id]
+
+    def _key(self, entry):
+        """Key of the existing record of an entry."""
+        if "id" not in entry:
+            return None
+        pid_field = self._service.record_cls.pid.field
+        if isinstance(pid_field, ModelPIDField):
+            return entry["id"]
+        return (self._pid_type(entry), entry["id"])
+
+    def _existing_records(self, keys):
+        """Fetch the existing records of the entries, with a single query."""
+        record_cls = self._service.record_cls
+        model_cls = record_cls.model_cls
+        keys = [key for key in keys if key is not None]
+        if not keys:
+            return {}
+
+        pid_field = record_cls.pid.field
+        if isinstance(pid_field, ModelPIDField):
+            column = getattr(model_cls, pid_field.model_field_name)
+            models = model_cls.query.filter(column.in_(keys)).all()
+            return {
+                getattr(model, pid_field.model_field_name): record_cls(
+                    model.data, model=model
+                )
+                for model in models
+            }
+
+        values_by_type = {}
+        for pid_type, pid_value in keys:
+            values_by_type.setdefault(pid_type, []).append(pid_value)
+        rows = (
+            db.session.query(
+                model_cls, PersistentIdentifier.pid_type, PersistentIdentifier.pid_value
+            )
+            .join(
+                PersistentIdentifier, PersistentIdentifier.object_uuid == model_cls.id
+            )
+            .filter(
+                or_(
+                    *(
+                        and_(
+                            PersistentIdentifier.pid_type == pid_type,
+                            PersistentIdentifier.pid_value.in_(pid_values),
+                        )
+                        for pid_type, pid_values in values_by_type.items()
+                    )
+                )
+            )
+        )
+        return {
+            (pid_type, pid_value): record_cls(model.data, model=model)
+            for model, pid_type, pid_value in rows
+        }
+
+    def _update(self, entry, record, uow):
+        """Update an existing record with the entry."""
+        data, _ = self._service.schema.load(
+            entry, context=dict(identity=self._identity, pid=record.pid, record=record)
+        )
+        self._service.run_components(
+            "update", self._identity, data=data, record=record, uow=uow
+        )
+        return record
+
+    def _create(self, entry, uow):
+        """Create a record from the entry."""
+        data, _ = self._service.schema.load(entry, context={"identity": self._identity})
+        record = self._service.record_cls.create({})
+        self._service.run_components(
+            "create", self._identity, data=data, record=record, errors=[], uow=uow
+        )
+        return record
+
+    def load(self, entries):
+        """Create or update the records of a batch of entries."""
+        if self._started is None:
+            self._started = time.monotonic()
+        self._service.require_permission(self._identity, "create_or_update_many")
+
+        with UnitOfWork() as uow:
+            keys = [self._key(entry) for entry in entries]
+            existing = self._existing_records(keys)
+
+            loaded = []
+            for entry, key in zip(entries, keys):
+                is_update = key in existing
+                savepoint = db.session.begin_nested()
+                try:
+                    if is_update:
+                        record = self._update(entry, existing[key], uow)
+                    else:
+                        record = self._create(entry, uow)
+                    record.commit()
+                    savepoint.commit()
+                except Exception as e:
+                    savepoint.rollback()
+                    self.errors += 1
+                    current_app.logger.warning(
+                        f"Skipping {self._service_str} fixture {entry}: {e}"
+                    )
+                    continue
+
+                if is_update:
+                    self.updated += 1
+                else:
+                    self.created += 1
+                    if key is not None:
+                        # a later entry with the same id updates this record
+                        existing[key] = record
+                loaded.append(record.id)
+
+            uow.register(RecordBulkIndexOp(loaded, self._service.indexer))
+            uow.commit()
+
+        current_app.logger.info(
+            f"Loaded {self.rows} {self._service_str} fixtures "
+            f"({self.created} created, {self.updated} updated, {self.errors} "
+            f"skipped) at {self.rows_per_second:.0f} rows/s"
+        )
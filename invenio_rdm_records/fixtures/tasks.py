@@ -29,6 +29,7 @@ from invenio_vocabularies.records.api import Vocabulary
 from ..proxies import current_oaipmh_server_service, current_rdm_records_service
 from ..requests import CommunitySubmission
 from ..services.errors import ReviewNotFoundError
+from .bulk import VocabularyRecordsLoader
 from .demo import create_fake_comment
 
 
@@ -60,6 +61,12 @@ def create_vocabulary_record(service_str, data):
         service.create(system_identity, data)
 
 
+@shared_task
+def create_vocabulary_records(service_str, entries):
+    """Create or update a batch of vocabulary records."""
+    VocabularyRecordsLoader(service_str).load(entries)
+
+
 @shared_task
 def create_demo_record(user_id, data, publish=True, create_file=False):
     """Create demo record."""
@@ -22,7 +22,8 @@ from invenio_vocabularies.records.models import VocabularyScheme, VocabularyType
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import load_only
 
-from .tasks import create_vocabulary_record
+from .bulk import VocabularyRecordsLoader, chunked
+from .tasks import create_vocabulary_record, create_vocabulary_records
 
 
 #
@@ -343,10 +344,23 @@ class VocabularyEntry:
         """Template method design pattern for loading entries."""
         ignore = ignore or set()
         self.pre_load(identity, ignore=ignore)
-        for data in self.iterate(ignore=ignore):
-            self.create_record(data, delay=delay)
+        batch_size = current_app.config.get("RDM_FIXTURES_VOCABULARIES_BATCH_SIZE")
+        if batch_size:
+            self.create_records(self.iterate(ignore=ignore), batch_size, delay=delay)
+        else:
+            for data in self.iterate(ignore=ignore):
+                self.create_record(data, delay=delay)
         return self.loaded()
 
+    def create_records(self, entries, batch_size, delay=False):
+        """Create the records, in batches."""
+        loader = VocabularyRecordsLoader(self.service_str)
+        for batch in chunked(entries, batch_size):
+            if delay:
+                create_vocabulary_records.delay(self.service_str, batch)
+            else:  # mostly for tests
+                loader.load(batch)
+
     def create_record(self, data, delay=False):
         """Create the record."""
         if delay:
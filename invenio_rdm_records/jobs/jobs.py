@@ -6,8 +6,12 @@
 
 from invenio_i18n import lazy_gettext as _
 from invenio_jobs.jobs import JobType
+from marshmallow import Schema, fields
 
-from invenio_rdm_records.services.tasks import update_expired_embargos
+from invenio_rdm_records.services.tasks import (
+    bulk_add_to_community,
+    update_expired_embargos,
+)
 
 update_expired_embargos_cls = JobType.create(
     arguments_schema=None,
@@ -17,3 +21,52 @@ update_expired_embargos_cls = JobType.create(
     description=_("Updates expired embargoes"),
     title=_("Update expired embargoes"),
 )
+
+
+class BulkAddToCommunitySchema(Schema):
+    """Arguments of the bulk add to community job."""
+
+    job_arg_schema = fields.String(
+        metadata={"type": "hidden"},
+        dump_default="BulkAddToCommunitySchema",
+        load_default="BulkAddToCommunitySchema",
+    )
+
+    community_id = fields.String(
+        required=True,
+        metadata={"description": _("ID of the community to add the records to.")},
+    )
+
+    record_ids = fields.List(
+        fields.String(),
+        required=True,
+        metadata={"description": _("IDs of the records to add to the community.")},
+    )
+
+    set_default = fields.Boolean(
+        load_default=False,
+        metadata={
+            "description": _("Set the community as default for the added records.")
+        },
+    )
+
+
+class BulkAddToCommunityJob(JobType):
+    """Job adding records to a community."""
+
+    id = "bulk_add_to_community"
+    title = _("Add records to a community")
+    description = _("Adds many records to a community at once")
+    task = bulk_add_to_community
+    arguments_schema = BulkAddToCommunitySchema
+
+    @classmethod
+    def build_task_arguments(
+        cls, job_obj, community_id=None, record_ids=None, set_default=False, **kwargs
+    ):
+        """Build task arguments."""
+        return {
+            "community_id": community_id,
+            "record_ids": record_ids or [],
+            "set_default": set_default,
+        }
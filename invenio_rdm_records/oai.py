@@ -4,6 +4,8 @@
 
 """Invenio-RDM-Records OAI Functionality."""
 
+from functools import lru_cache
+
 from datacite import schema45
 from dcxml import simpledc
 from flask import current_app, g
@@ -23,53 +25,64 @@ from .resources.serializers.marcxml import MARCXMLSerializer
 from .services.pids.providers.oai import OAIPIDProvider
 
 
-def dublincore_etree(pid, record, **serializer_kwargs):
-    """Get DublinCore XML etree for OAI-PMH."""
-    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
+#
+# Serializers registry
+#
+@lru_cache(maxsize=None)
+def _get_serializer(serializer_cls, options):
+    return serializer_cls(**dict(options))
+
+
+def get_serializer(serializer_cls, **options):
+    """Get the shared instance of a serializer class, for the given options.
+
+    The serializers (and their Marshmallow schemas) are stateless, so a single
+    instance per class and options is reused across the rendered records.
+    """
+    try:
+        return _get_serializer(serializer_cls, tuple(sorted(options.items())))
+    except TypeError:
+        # unhashable options
+        return serializer_cls(**options)
+
+
+#
+# Metadata formats rendering
+#
+def render_dublincore(identity, source, **serializer_kwargs):
+    """Render the DublinCore XML etree of a record's search dump."""
+    item = current_rdm_records_service.oai_result_item(identity, source)
     # TODO: DublinCoreXMLSerializer should be able to dump an etree directly
     # instead. See https://github.com/inveniosoftware/flask-resources/issues/117
-    obj = DublinCoreXMLSerializer(**serializer_kwargs).dump_obj(item.to_dict())
+    serializer = get_serializer(DublinCoreXMLSerializer, **serializer_kwargs)
+    obj = serializer.dump_obj(item.to_dict())
     return simpledc.dump_etree(obj)
 
 
-def marcxml_etree(pid, record):
-    """OAI MARCXML format for OAI-PMH."""
-    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
-    # TODO: MARCXMLSerializer should directly be able to dump an etree instead
-    # of internally creating an etree, then dump to xml, then parse into an
-    # etree. See https://github.com/inveniosoftware/flask-resources/issues/117
-    return etree.fromstring(
-        MARCXMLSerializer().serialize_object(item.to_dict()).encode(encoding="utf-8")
-    )
-
+def render_marcxml(identity, source):
+    """Render the MARCXML etree of a record's search dump."""
+    item = current_rdm_records_service.oai_result_item(identity, source)
+    return get_serializer(MARCXMLSerializer).dump_etree(item.to_dict())
 
-def dcat_etree(pid, record):
-    """OAI DCAT-AP format for OAI-PMH."""
-    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
-    # TODO: Ditto. See https://github.com/inveniosoftware/flask-resources/issues/117
-    return etree.fromstring(
-        DCATSerializer().serialize_object(item.to_dict()).encode(encoding="utf-8")
-    )
 
+def render_dcat(identity, source):
+    """Render the DCAT-AP etree of a record's search dump."""
+    item = current_rdm_records_service.oai_result_item(identity, source)
+    return get_serializer(DCATSerializer).dump_etree(item.to_dict())
 
-def datacite_etree(pid, record):
-    """DataCite XML format for OAI-PMH.
 
-    It assumes that record is a search result.
-    """
+def render_datacite(identity, source):
+    """Render the DataCite XML etree of a record's search dump."""
     # TODO: Ditto. See https://github.com/inveniosoftware/flask-resources/issues/117
-    data_dict = DataCite45XMLSerializer().dump_obj(record["_source"])
+    data_dict = get_serializer(DataCite45XMLSerializer).dump_obj(source)
     return schema45.dump_etree(data_dict)
 
 
-def oai_datacite_etree(pid, record):
-    """OAI DataCite XML format for OAI-PMH.
-
-    It assumes that record is a search result.
-    """
+def render_oai_datacite(identity, source):
+    """Render the OAI DataCite XML etree of a record's search dump."""
     # TODO: See https://github.com/inveniosoftware/flask-resources/issues/117
     # This should be made into a serializer similar to the ones above.
-    resource_dict = DataCite45XMLSerializer().dump_obj(record["_source"])
+    resource_dict = get_serializer(DataCite45XMLSerializer).dump_obj(source)
 
     nsmap = {
         None: "http://schema.datacite.org/oai/oai-1.1/",
@@ -100,6 +113,99 @@ def oai_datacite_etree(pid, record):
     return oai_datacite
 
 
+OAI_METADATA_RENDERERS = {
+    "oai_dc": (render_dublincore, True),
+    "marcxml": (render_marcxml, True),
+    "dcat": (render_dcat, True),
+    "datacite": (render_datacite, False),
+    "oai_datacite": (render_oai_datacite, False),
+}
+"""Renderers of the metadata formats that can be pre-rendered at indexing time.
+
+Each entry maps to the render function and whether its output depends on the
+identity, in which case the pre-rendered output is only used for anonymous
+harvesting (it is rendered with an anonymous identity).
+"""
+
+
+def render_oai_metadata(metadata_format, identity, source):
+    """Render the metadata format of a record's search dump as an XML string."""
+    render, _ = OAI_METADATA_RENDERERS[metadata_format]
+    return etree.tostring(render(identity, source), encoding="unicode")
+
+
+def get_cached_etree(record, metadata_format):
+    """Get the pre-rendered etree of the metadata format for a search hit.
+
+    Returns ``None`` if the format was not pre-rendered for the record's current
+    revision, or if it cannot be used for the current identity.
+    """
+    source = record["_source"]
+    cache = source.get("oai_cache")
+    if not cache or cache.get("version_id") != source.get("version_id"):
+        return None
+
+    xml = cache.get("formats", {}).get(metadata_format)
+    if xml is None:
+        return None
+
+    _, identity_dependent = OAI_METADATA_RENDERERS[metadata_format]
+    if identity_dependent and g.identity.id is not None:
+        return None
+
+    return etree.fromstring(xml.encode("utf-8"))
+
+
+#
+# OAI-PMH metadata formats
+#
+def dublincore_etree(pid, record, **serializer_kwargs):
+    """Get DublinCore XML etree for OAI-PMH."""
+    # the pre-rendered metadata is rendered with the default serializer options
+    cached = None if serializer_kwargs else get_cached_etree(record, "oai_dc")
+    if cached is not None:
+        return cached
+    return render_dublincore(g.identity, record["_source"], **serializer_kwargs)
+
+
+def marcxml_etree(pid, record):
+    """OAI MARCXML format for OAI-PMH."""
+    cached = get_cached_etree(record, "marcxml")
+    if cached is not None:
+        return cached
+    return render_marcxml(g.identity, record["_source"])
+
+
+def dcat_etree(pid, record):
+    """OAI DCAT-AP format for OAI-PMH."""
+    cached = get_cached_etree(record, "dcat")
+    if cached is not None:
+        return cached
+    return render_dcat(g.identity, record["_source"])
+
+
+def datacite_etree(pid, record):
+    """DataCite XML format for OAI-PMH.
+
+    It assumes that record is a search result.
+    """
+    cached = get_cached_etree(record, "datacite")
+    if cached is not None:
+        return cached
+    return render_datacite(g.identity, record["_source"])
+
+
+def oai_datacite_etree(pid, record):
+    """OAI DataCite XML format for OAI-PMH.
+
+    It assumes that record is a search result.
+    """
+    cached = get_cached_etree(record, "oai_datacite")
+    if cached is not None:
+        return cached
+    return render_oai_datacite(g.identity, record["_source"])
+
+
 def oaiid_fetcher(record_uuid, data):
     """Fetch a record's identifier.
 
@@ -15,7 +15,6 @@ from invenio_drafts_resources.services.records.components.media_files import (
 )
 from invenio_pidstore.models import PIDStatus
 from invenio_records.dumpers import SearchDumper
-from invenio_records.dumpers.relations import RelationDumperExt
 from invenio_records.systemfields import ConstantField, DictField, ModelField
 from invenio_records.systemfields.relations import MultiRelationsField
 from invenio_records_resources.records.api import FileRecord
@@ -45,10 +44,12 @@ from invenio_rdm_records.services.errors import ReviewStateError
 
 from . import models
 from .dumpers import (
+    CachedRelationDumperExt,
     CombinedSubjectsDumperExt,
     EDTFDumperExt,
     EDTFListDumperExt,
     GrantTokensDumperExt,
+    OAIMetadataDumperExt,
     StatisticsDumperExt,
     SubjectHierarchyDumperExt,
 )
@@ -119,11 +120,13 @@ class CommonFieldsMixin:
         extensions=[
             EDTFDumperExt("metadata.publication_date"),
             EDTFListDumperExt("metadata.dates", "date"),
-            RelationDumperExt("relations"),
+            CachedRelationDumperExt("relations"),
             CombinedSubjectsDumperExt(),
             CustomFieldsDumperExt(fields_var="RDM_CUSTOM_FIELDS"),
             StatisticsDumperExt("stats"),
             SubjectHierarchyDumperExt(),
+            # must be last, as it renders the rest of the dumped data
+            OAIMetadataDumperExt("oai_cache"),
         ]
     )
 
@@ -499,7 +502,7 @@ class RDMRecord(CommonFieldsMixin, Record):
     model_cls = models.RDMRecordMetadata
 
     index = IndexField(
-        "rdmrecords-records-record-v7.0.0", search_alias="rdmrecords-records"
+        "rdmrecords-records-record-v7.1.0", search_alias="rdmrecords-records"
     )
 
     files = FilesField(
@@ -540,6 +543,23 @@ class RDMRecord(CommonFieldsMixin, Record):
 
     tombstone = TombstoneField()
 
+    @classmethod
+    def _published_versions_query(cls, parent):
+        """Query the published versions of a parent, from the latest to the oldest."""
+        return (
+            cls.model_cls.query.filter_by(parent_id=parent.id)
+            .filter(
+                cls.model_cls.deletion_status
+                == RecordDeletionStatusEnum.PUBLISHED.value
+            )
+            .order_by(cls.model_cls.index.desc())
+        )
+
+    @classmethod
+    def _get_versions_state(cls, parent):
+        """Get the versions state of a parent, or None if it has no versions yet."""
+        return cls.versions_model_cls.query.filter_by(parent_id=parent.id).one_or_none()
+
     @classmethod
     def next_latest_published_record_by_parent(cls, parent):
         """Get the next latest published record.
@@ -548,20 +568,14 @@ class RDMRecord(CommonFieldsMixin, Record):
         records are deleted i.e `record.deletion_status != 'P'`.
 
         :param parent: parent record.
-        :param excluded_latest: latest record to exclude find next published version
         """
         with db.session.no_autoflush:
-            rec_model_query = (
-                cls.model_cls.query.filter_by(parent_id=parent.id)
-                .filter(
-                    cls.model_cls.deletion_status
-                    == RecordDeletionStatusEnum.PUBLISHED.value
+            rec_model_query = cls._published_versions_query(parent)
+            version = cls._get_versions_state(parent)
+            if version and version.latest_id:
+                rec_model_query = rec_model_query.filter(
+                    cls.model_cls.id != version.latest_id
                 )
-                .order_by(cls.model_cls.index.desc())
-            )
-            current_latest_id = cls.get_latest_by_parent(parent, id_only=True)
-            if current_latest_id:
-                rec_model_query.filter(cls.model_cls.id != current_latest_id)
 
             rec_model = rec_model_query.first()
             return (
@@ -586,6 +600,40 @@ class RDMRecord(CommonFieldsMixin, Record):
             return None
         return latest_record
 
+    @classmethod
+    def get_latest_published_by_parents(cls, parents):
+        """Get the latest published records of many parent records at once.
+
+        Bulk form of ``get_latest_published_by_parent``, querying the latest
+        published version of all the parents with a single query.
+
+        :param parents: parent records.
+        :returns: a dictionary mapping the parent ids to their latest published
+            record. Parents without latest published version are not included.
+        """
+        parents = {parent.id: parent for parent in parents}
+        if not parents:
+            return {}
+
+        versions_model_cls = cls.versions_model_cls
+        rec_models = (
+            cls.model_cls.query.join(
+                versions_model_cls, versions_model_cls.latest_id == cls.model_cls.id
+            )
+            .filter(
+                versions_model_cls.parent_id.in_(parents.keys()),
+                cls.model_cls.deletion_status
+                == RecordDeletionStatusEnum.PUBLISHED.value,
+            )
+            .all()
+        )
+        return {
+            rec_model.parent_id: cls(
+                rec_model.data, model=rec_model, parent=parents[rec_model.parent_id]
+            )
+            for rec_model in rec_models
+        }
+
     @classmethod
     def get_previous_published_by_parent(cls, parent):
         """Get the previous of latest published record for the specified parent record.
@@ -601,16 +649,23 @@ class RDMRecord(CommonFieldsMixin, Record):
 
         Check `services.components.pids.PIDsComponent.publish()` for how it is used.
         """
-        # We need no_autoflush because the record.versions access triggers automatically
-        # one
+        # We need no_autoflush because the versions state is updated in the session
+        # before the record is published
         with db.session.no_autoflush:
-            records = cls.get_records_by_parent(parent)
-            for record in records:
-                latest_version_index = record.versions.latest_index
-                if latest_version_index > 1:
-                    if record.versions.index == latest_version_index - 1:
-                        return record
-            return None
+            version = cls._get_versions_state(parent)
+            if not version or not version.latest_index or version.latest_index <= 1:
+                return None
+
+            rec_model = (
+                cls._published_versions_query(parent)
+                .filter(cls.model_cls.index < version.latest_index)
+                .first()
+            )
+            return (
+                cls(rec_model.data, model=rec_model, parent=parent)
+                if rec_model
+                else None
+            )
 
 
 RDMFileRecord.record_cls = RDMRecord
@@ -7,17 +7,22 @@ from .access import GrantTokensDumperExt
 from .combined_subjects import CombinedSubjectsDumperExt
 from .edtf import EDTFDumperExt, EDTFListDumperExt
 from .locations import LocationsDumper
+from .oai import OAIMetadataDumperExt
 from .pids import PIDsDumperExt
+from .relations import CachedRelationDumperExt, RelationsCache
 from .statistics import StatisticsDumperExt
 from .subject_hierarchy import SubjectHierarchyDumperExt
 
 __all__ = (
+    "CachedRelationDumperExt",
     "CombinedSubjectsDumperExt",
     "EDTFDumperExt",
     "EDTFListDumperExt",
     "PIDsDumperExt",
+    "RelationsCache",
     "GrantTokensDumperExt",
     "LocationsDumper",
+    "OAIMetadataDumperExt",
     "StatisticsDumperExt",
     "SubjectHierarchyDumperExt",
 )
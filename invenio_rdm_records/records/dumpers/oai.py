@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Search dumper for pre-rendered OAI-PMH metadata formats."""
+
+from copy import deepcopy
+
+from flask import current_app
+from flask_principal import AnonymousIdentity
+from invenio_access.permissions import any_user
+from invenio_records.dumpers import SearchDumperExt
+
+from ..indexer import is_indexing
+
+
+class OAIMetadataDumperExt(SearchDumperExt):
+    """Search dumper extension pre-rendering the OAI-PMH metadata formats.
+
+    When dumping for indexing (i.e. on publish or reindex), it renders the
+    metadata formats configured in ``RDM_OAI_PMH_CACHED_FORMATS`` for published
+    records that are exposed via OAI-PMH, and stores them (together with the
+    record's revision) in a field that is not indexed. The OAI-PMH metadata format functions then return the
+    stored XML instead of rendering the record for every harvest.
+    On load, the pre-rendered formats are removed from the data.
+
+    Note: this extension must be the last one of the dumper, as it renders the
+    formats from the rest of the dumped data.
+    """
+
+    def __init__(self, key="oai_cache"):
+        """Constructor.
+
+        :param key: top-level key where to dump the pre-rendered formats.
+        """
+        super().__init__()
+        self.key = key
+
+    def _is_harvestable(self, record, data):
+        """Check if the record is exposed via the OAI-PMH server."""
+        return (
+            not record.is_draft
+            and not data.get("is_deleted", False)
+            and data.get("pids", {}).get("oai", {}).get("identifier")
+            and data.get("access", {}).get("record") == "public"
+        )
+
+    def dump(self, record, data):
+        """Dump the pre-rendered OAI-PMH metadata formats."""
+        metadata_formats = current_app.config.get("RDM_OAI_PMH_CACHED_FORMATS")
+        if not metadata_formats or not is_indexing():
+            return
+        if not self._is_harvestable(record, data):
+            return
+
+        # avoid circular imports, the OAI-PMH functions depend on the services
+        from ...oai import render_oai_metadata
+
+        identity = AnonymousIdentity()
+        identity.provides.add(any_user)
+
+        rendered = {}
+        for metadata_format in metadata_formats:
+            try:
+                rendered[metadata_format] = render_oai_metadata(
+                    metadata_format, identity, deepcopy(data)
+                )
+            except Exception:
+                # the format will be rendered on harvest instead
+                current_app.logger.warning(
+                    f"Failed to pre-render '{metadata_format}' for record {record.id}",
+                    exc_info=True,
+                )
+
+        data[self.key] = {
+            "version_id": data.get("version_id"),
+            "formats": rendered,
+        }
+
+    def load(self, data, record_cls):
+        """Remove the pre-rendered OAI-PMH metadata formats."""
+        data.pop(self.key, None)
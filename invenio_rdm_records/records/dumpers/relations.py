@@ -0,0 +1,226 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Relations dumper sharing a dereference cache between records."""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from flask import current_app
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_records.dumpers.relations import RelationDumperExt
+from invenio_records_resources.records.systemfields.pid import ModelPIDFieldContext
+from invenio_records_resources.records.systemfields.relations import PIDRelation
+
+_relations_cache = ContextVar("rdm_relations_cache", default=None)
+"""Dereference cache of the current bulk operation."""
+
+
+class _CountingCache:
+    """View on the cache of a vocabulary type, counting the hits of a relation."""
+
+    def __init__(self, store, counters):
+        """Constructor."""
+        self._store = store
+        self._counters = counters
+
+    def __contains__(self, id_):
+        """Check if the object is cached, counting a hit or a miss."""
+        found = id_ in self._store
+        self._counters["hits" if found else "misses"] += 1
+        return found
+
+    def __getitem__(self, id_):
+        """Get a cached object."""
+        return self._store[id_]
+
+    def __setitem__(self, id_, obj):
+        """Cache an object."""
+        self._store[id_] = obj
+
+
+class RelationsCache:
+    """Dereference cache of the record relations, shared by many records.
+
+    By default, each record dereferences its relations with its own cache, so
+    that the same vocabulary entries are resolved again for every record. This
+    cache is shared by all the records of a bulk operation (e.g. bulk indexing).
+    The related objects of each chunk of records can be prefetched with one query
+    per vocabulary type.
+
+    The hits and misses are counted per relation.
+    """
+
+    def __init__(self, maxsize=10000):
+        """Constructor.
+
+        :param maxsize: maximum number of cached objects per vocabulary type. The
+            objects of a type are dropped when it is exceeded.
+        """
+        self.maxsize = maxsize
+        self._stores = defaultdict(dict)
+        self._counters = defaultdict(lambda: {"hits": 0, "misses": 0})
+
+    @staticmethod
+    def _pid_relations(record, key):
+        """Iterate over the PID relation fields of the record, by name."""
+        relations = getattr(record, key, None)
+        if relations is None:
+            return
+        for name, field in relations._fields.items():
+            if isinstance(field, PIDRelation):
+                yield name, field
+
+    @staticmethod
+    def _cache_key(name, field):
+        """Get the cache key of a relation field (i.e. its vocabulary type)."""
+        return field._cache_key or name
+
+    @staticmethod
+    def _collect_ids(values, suffix, ids):
+        """Collect the referenced ids in (nested lists of) relation values."""
+        if isinstance(values, list):
+            for value in values:
+                RelationsCache._collect_ids(value, suffix, ids)
+        elif isinstance(values, dict):
+            id_ = values.get(suffix)
+            # already dereferenced values don't need to be resolved
+            if id_ is not None and "@v" not in values:
+                ids.add(id_)
+
+    def _store(self, cache_key):
+        """Get the store of a vocabulary type, dropping it if it's full."""
+        store = self._stores[cache_key]
+        if len(store) >= self.maxsize:
+            store.clear()
+        return store
+
+    def inject(self, record, key="relations"):
+        """Make the relations of the record resolve from the shared cache."""
+        for name, field in self._pid_relations(record, key):
+            cache_key = self._cache_key(name, field)
+            view = _CountingCache(self._store(cache_key), self._counters[name])
+            field.inject_cache({cache_key: view}, name)
+
+    def _fetch(self, field, ids):
+        """Fetch the related objects of a relation field, with a single query."""
+        pid_ctx = field.pid_field
+        record_cls = pid_ctx.record_cls
+        model_cls = record_cls.model_cls
+
+        if isinstance(pid_ctx, ModelPIDFieldContext):
+            pid_column = getattr(model_cls, pid_ctx.field.model_field_name)
+            models = model_cls.query.filter(pid_column.in_(ids)).all()
+            objs = {
+                getattr(model, pid_ctx.field.model_field_name): record_cls(
+                    model.data, model=model
+                )
+                for model in models
+                if not model.is_deleted
+            }
+        else:
+            pid_type = getattr(pid_ctx, "pid_type", None) or pid_ctx.field._pid_type
+            pids = PersistentIdentifier.query.filter(
+                PersistentIdentifier.pid_type == pid_type,
+                PersistentIdentifier.pid_value.in_(ids),
+                PersistentIdentifier.status == PIDStatus.REGISTERED,
+            ).all()
+            uuids = {pid.object_uuid: pid.pid_value for pid in pids}
+            objs = {uuids[obj.id]: obj for obj in record_cls.get_records(uuids.keys())}
+
+        # Detach the models from the session, like the relations do when they
+        # resolve a single object
+        for obj in objs.values():
+            db.session.expunge(obj.model)
+        return objs
+
+    def prefetch(self, records, key="relations"):
+        """Prefetch the related objects of the records, per vocabulary type."""
+        ids = defaultdict(set)
+        fields = {}
+        for record in records:
+            for name, field in self._pid_relations(record, key):
+                result = getattr(getattr(record, key), name)
+                try:
+                    values = result._lookup_data()
+                except KeyError:
+                    continue
+                cache_key = self._cache_key(name, field)
+                fields.setdefault(cache_key, field)
+                self._collect_ids(values, field._value_key_suffix, ids[cache_key])
+
+        for cache_key, field in fields.items():
+            store = self._store(cache_key)
+            missing = [id_ for id_ in ids[cache_key] if id_ not in store]
+            if not missing:
+                continue
+            try:
+                store.update(self._fetch(field, missing))
+            except Exception:
+                # the relations will be resolved one by one instead
+                current_app.logger.warning(
+                    f"Failed to prefetch the '{cache_key}' relations.", exc_info=True
+                )
+
+    def stats(self):
+        """Get the hits, misses and hit ratio of each relation."""
+        stats = {}
+        for name, counters in self._counters.items():
+            total = counters["hits"] + counters["misses"]
+            stats[name] = {
+                **counters,
+                "hit_ratio": counters["hits"] / total if total else 0.0,
+            }
+        return stats
+
+    @classmethod
+    def current(cls):
+        """Get the cache of the current bulk operation, if any."""
+        return _relations_cache.get()
+
+    @classmethod
+    @contextmanager
+    def scope(cls, maxsize=10000):
+        """Share a dereference cache between the records dumped in the block.
+
+        If a cache is already shared, it is reused. When the (outermost) block
+        exits, the hit ratios of the relations are logged.
+        """
+        cache = _relations_cache.get()
+        if cache is not None:
+            yield cache
+            return
+
+        cache = cls(maxsize=maxsize)
+        token = _relations_cache.set(cache)
+        try:
+            yield cache
+        finally:
+            _relations_cache.reset(token)
+            stats = cache.stats()
+            if stats:
+                current_app.logger.info(
+                    "Relations dereference cache hit ratios: "
+                    + ", ".join(
+                        f"{name}={s['hit_ratio']:.2f} ({s['hits']}/"
+                        f"{s['hits'] + s['misses']})"
+                        for name, s in sorted(stats.items())
+                    )
+                )
+
+
+class CachedRelationDumperExt(RelationDumperExt):
+    """Relations dumper resolving from the shared dereference cache, if any.
+
+    Outside of a :meth:`RelationsCache.scope`, it behaves as the regular
+    relations dumper.
+    """
+
+    def dump(self, record, data):
+        """Dump relations."""
+        cache = RelationsCache.current()
+        if cache is not None:
+            cache.inject(record, self.key)
+        super().dump(record, data)
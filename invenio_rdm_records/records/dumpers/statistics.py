@@ -15,6 +15,8 @@ class StatisticsDumperExt(SearchDumperExt):
 
     On dump, it fetches the record's download & view statistics via Invenio-Stats
     queries and dumps them into a field so that they are indexed in the search engine.
+    If the statistics have been prefetched for a whole chunk of records (e.g. by
+    the bulk indexer), they are taken from there instead.
     On load, it keeps the dumped values in the data dictionary, in order to enable
     the record schema to dump them if present.
     """
@@ -38,9 +40,12 @@ class StatisticsDumperExt(SearchDumperExt):
 
         try:
             parent_data = dict_lookup(data, self.keys, parent=True)
-            parent_data[self.key] = Statistics.get_record_stats(
-                recid=recid, parent_recid=parent_recid
-            )
+            stats = Statistics.get_prefetched_stats(recid)
+            if stats is None:
+                stats = Statistics.get_record_stats(
+                    recid=recid, parent_recid=parent_recid
+                )
+            parent_data[self.key] = stats
         except KeyError as e:
             current_app.logger.warning(e)
 
@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Record indexer prefetching data for whole chunks of bulk-indexed records."""
+
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from itertools import islice
+
+from flask import current_app
+from invenio_indexer.api import RecordIndexer
+from sqlalchemy.orm.exc import NoResultFound
+
+from .dumpers.relations import RelationsCache
+from .stats import Statistics
+from .systemfields.is_verified import IsVerifiedField
+
+_indexing = ContextVar("rdm_indexing", default=False)
+"""Whether the records are currently being dumped for indexing."""
+
+
+def is_indexing():
+    """Check if the records are currently being dumped for indexing.
+
+    Useful for dumper extensions that only make sense for the indexed documents.
+    """
+    return _indexing.get()
+
+
+@contextmanager
+def _indexing_context():
+    """Mark the records dumped in the block as dumped for indexing."""
+    token = _indexing.set(True)
+    try:
+        yield
+    finally:
+        _indexing.reset(token)
+
+
+class RDMRecordIndexer(RecordIndexer):
+    """Record indexer for RDM records and drafts.
+
+    When processing the bulk indexing queue, the messages are consumed in chunks.
+    The records of each chunk are loaded with a single query, and the data that
+    would otherwise be fetched once per record while dumping (e.g. the record
+    statistics, the related vocabularies and the verification of the owners) is
+    prefetched for the whole chunk.
+    The dereferenced relations are cached for the whole bulk operation.
+    """
+
+    def relations_cache(self):
+        """Share a relations dereference cache between the dumped records."""
+        return RelationsCache.scope(
+            maxsize=current_app.config["RDM_RELATIONS_CACHE_MAXSIZE"]
+        )
+
+    def prefetch(self, records):
+        """Prefetch the data needed to dump the given records.
+
+        :returns: a context manager, in which the prefetched data is available.
+        """
+        stack = ExitStack()
+        stack.enter_context(Statistics.prefetch(records))
+        stack.enter_context(
+            IsVerifiedField.prefetch(
+                [getattr(record, "parent", None) or record for record in records]
+            )
+        )
+        stack.enter_context(self.relations_cache()).prefetch(records)
+        return stack
+
+    def _prepare_record(self, record, index, arguments=None, **kwargs):
+        """Prepare record data for indexing."""
+        with _indexing_context():
+            return super()._prepare_record(record, index, arguments, **kwargs)
+
+    def _get_records(self, payloads):
+        """Load the records of the index actions in a single query."""
+        ids = [payload["id"] for payload in payloads if payload["op"] != "delete"]
+        if not ids:
+            return []
+
+        try:
+            return self.record_cls.get_records(ids)
+        except Exception:
+            # the records will be loaded one by one instead
+            current_app.logger.warning(
+                "Failed to load records for bulk indexing.", exc_info=True
+            )
+            return []
+
+    def _actionsiter(self, message_iterator):
+        """Iterate bulk actions, prefetching data for each chunk of messages.
+
+        :param message_iterator: Iterator yielding messages from a queue.
+        """
+        chunk_size = current_app.config["RDM_INDEXER_BULK_CHUNK_SIZE"]
+        message_iterator = iter(message_iterator)
+
+        with self.relations_cache():
+            yield from self._chunks_actionsiter(message_iterator, chunk_size)
+
+    def _chunks_actionsiter(self, message_iterator, chunk_size):
+        """Iterate bulk actions, chunk by chunk."""
+        while chunk := list(islice(message_iterator, chunk_size)):
+            payloads = [message.decode() for message in chunk]
+            records = self._get_records(payloads)
+            records_by_id = {str(record.id): record for record in records}
+
+            with self.prefetch(records):
+                for message, payload in zip(chunk, payloads):
+                    try:
+                        if payload["op"] == "delete":
+                            yield self._delete_action(payload)
+                        else:
+                            yield self._index_action(
+                                payload, record=records_by_id.get(payload["id"])
+                            )
+                        message.ack()
+                    except NoResultFound:
+                        message.reject()
+                    except Exception:
+                        message.reject()
+                        current_app.logger.error(
+                            "Failed to index record {0}".format(payload.get("id")),
+                            exc_info=True,
+                        )
+
+    def _index_action(self, payload, record=None):
+        """Bulk index action.
+
+        :param payload: Decoded message body.
+        :param record: The already loaded record, if any.
+        :returns: Dictionary defining the search engine bulk 'index' action.
+        """
+        if record is None:
+            return super()._index_action(payload)
+
+        index = self.record_to_index(record)
+
+        arguments = {}
+        body = self._prepare_record(record, index, arguments)
+        index = self._prepare_index(index)
+
+        action = {
+            "_op_type": "index",
+            "_index": index,
+            "_id": str(record.id),
+            "_version": record.revision_id,
+            "_version_type": self._version_type,
+            "_source": body,
+        }
+        action.update(arguments)
+
+        return action
@@ -271,3 +271,28 @@ class RDMUserQuota(db.Model, db.Timestamp):
 
     notes = db.Column(db.Text, nullable=False, default="")
     """Notes related to setting the quota."""
+
+
+class RDMParentStorageUsage(db.Model, db.Timestamp):
+    """Store for the storage used by all versions and drafts of a record."""
+
+    __tablename__ = "rdm_parents_storage_usage"
+
+    @declared_attr
+    def parent_id(cls):
+        """Parent record identifier."""
+        return db.Column(
+            UUIDType,
+            # the usage is deleted together with the parent record
+            db.ForeignKey(
+                RDMVersionsState.__parent_record_model__.id,
+                ondelete="CASCADE",
+            ),
+            primary_key=True,
+        )
+
+    user_id = db.Column(db.Integer, index=True)
+    """Owner of the parent record (via parent.access.owned_by)."""
+
+    used_bytes = db.Column(db.BigInteger, nullable=False, default=0)
+    """Size of the largest bucket among the versions and drafts of the record."""
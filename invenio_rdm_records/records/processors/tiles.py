@@ -4,6 +4,7 @@
 """Tiles processor."""
 
 from contextlib import contextmanager
+from itertools import islice
 
 from flask import current_app
 from invenio_db import db
@@ -11,7 +12,10 @@ from invenio_records_resources.services.uow import TaskOp
 
 from invenio_rdm_records.records.processors.base import RecordFilesProcessor
 from invenio_rdm_records.services.iiif.storage import tiles_storage
-from invenio_rdm_records.services.iiif.tasks import cleanup_tiles_file, generate_tiles
+from invenio_rdm_records.services.iiif.tasks import (
+    cleanup_tiles_file,
+    generate_tiles_batch,
+)
 
 
 class TilesProcessor(RecordFilesProcessor):
@@ -45,6 +49,14 @@ class TilesProcessor(RecordFilesProcessor):
 
     def _can_process_file(self, file_record, draft, record) -> bool:
         """Checks to determine if to process the record."""
+        # Skip the files whose tiles are being (or have been) generated
+        processor = getattr(file_record, "processor", None) or {}
+        if processor.get("type") == "image-tiles" and processor.get("status") in (
+            "init",
+            "processing",
+            "finished",
+        ):
+            return False
         return file_record.file.ext in self.valid_exts
 
     @contextmanager
@@ -83,10 +95,18 @@ class TilesProcessor(RecordFilesProcessor):
                         )
                     )
 
+    @property
+    def batch_size(self) -> int:
+        """Return the number of files converted per tiles generation task."""
+        return current_app.config.get("IIIF_TILES_BATCH_SIZE", 50)
+
     def _process_file(self, file_record, draft, record, file_type, uow=None):
-        """Process a file record to kickoff pyramidal tiff generation."""
+        """Process a file record to prepare its pyramidal tiff generation.
+
+        :returns: ``True`` if the tiles of the file need to be generated.
+        """
         if not self._can_process_file(file_record, draft, record):
-            return
+            return False
 
         status_file = record.media_files.get(f"{file_record.key}.ptif")
         if status_file:
@@ -94,7 +114,7 @@ class TilesProcessor(RecordFilesProcessor):
                 file_record.file.id
             )
             if status_file.processor["status"] == "finished" and not has_file_changed:
-                return
+                return False
 
         try:
             with db.session.begin_nested():
@@ -125,14 +145,7 @@ class TilesProcessor(RecordFilesProcessor):
                 status_file.access.hidden = True
                 status_file.commit()
                 record.media_files.commit(f"{file_record.key}.ptif")
-            uow.register(
-                TaskOp(
-                    generate_tiles,
-                    record_id=record["id"],
-                    file_key=file_record.key,
-                    file_type=file_type,
-                )
-            )
+            return True
         except Exception:
             # Nested transaction for current file is rolled back
             current_app.logger.exception(
@@ -142,6 +155,15 @@ class TilesProcessor(RecordFilesProcessor):
                     "file_key": file_record.key,
                 },
             )
+            return False
+
+    def _generate_tiles(self, record, files, uow):
+        """Kickoff the tiles generation, with one task per batch of files."""
+        files = iter(files)
+        while batch := list(islice(files, self.batch_size)):
+            uow.register(
+                TaskOp(generate_tiles_batch, record_id=record["id"], files=batch)
+            )
 
     def _process(self, draft, record, uow):
         """Process the whole record to generate pyramidal tifs for valid files."""
@@ -170,10 +192,15 @@ class TilesProcessor(RecordFilesProcessor):
             record_files = list(record.files.values())
             record_media_files = list(record.media_files.values())
 
-            for file_record in record_files:
-                self._process_file(file_record, draft, record, "files", uow)
-            for file_record in record_media_files:
-                self._process_file(file_record, draft, record, "media_files", uow)
+            files = []
+            for file_type, file_records in (
+                ("files", record_files),
+                ("media_files", record_media_files),
+            ):
+                for file_record in file_records:
+                    if self._process_file(file_record, draft, record, file_type, uow):
+                        files.append((file_record.key, file_type))
+            self._generate_tiles(record, files, uow)
 
         if not len(record.media_files.entries):
             record.media_files.enabled = False
@@ -7,19 +7,60 @@ In contrast to the very liberal defaults provided by Invenio-Stats, these permis
 factories deny access unless otherwise specified.
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from flask import current_app
+from invenio_search.engine import dsl
+from invenio_search.proxies import current_search_client
 from invenio_stats.proxies import current_stats
 
+_prefetched_stats = ContextVar("rdm_prefetched_stats", default=None)
+"""Statistics prefetched for the records of the current bulk operation."""
+
 
 class Statistics:
     """Statistics API class."""
 
+    views_fallback = {
+        "views": 0,
+        "unique_views": 0,
+    }
+    """Fallback result for failing or empty view statistics queries."""
+
+    downloads_fallback = {
+        "downloads": 0,
+        "unique_downloads": 0,
+        "data_volume": 0,
+    }
+    """Fallback result for failing or empty download statistics queries."""
+
     @classmethod
     def _get_query(cls, query_name):
         """Build the statistics query from configuration."""
         query_config = current_stats.queries[query_name]
         return query_config.cls(name=query_config.name, **query_config.params)
 
+    @classmethod
+    def _build_stats(cls, views, views_all, downloads, downloads_all):
+        """Build the statistics dictionary from the query results."""
+        return {
+            "this_version": {
+                "views": views["views"],
+                "unique_views": views["unique_views"],
+                "downloads": downloads["downloads"],
+                "unique_downloads": downloads["unique_downloads"],
+                "data_volume": downloads["data_volume"],
+            },
+            "all_versions": {
+                "views": views_all["views"],
+                "unique_views": views_all["unique_views"],
+                "downloads": downloads_all["downloads"],
+                "unique_downloads": downloads_all["unique_downloads"],
+                "data_volume": downloads_all["data_volume"],
+            },
+        }
+
     @classmethod
     def get_record_stats(cls, recid, parent_recid):
         """Fetch the statistics for the given record."""
@@ -32,12 +73,7 @@ class Statistics:
             # e.g. opensearchpy.exceptions.NotFoundError
             # when the aggregation search index hasn't been created yet
             current_app.logger.warning(e)
-
-            fallback_result = {
-                "views": 0,
-                "unique_views": 0,
-            }
-            views = views_all = downloads = downloads_all = fallback_result
+            views = views_all = cls.views_fallback
 
         try:
             downloads = cls._get_query("record-download").run(recid=recid)
@@ -48,29 +84,127 @@ class Statistics:
             # same as above, but for failure in the download statistics
             # because they are a separate index that can fail independently
             current_app.logger.warning(e)
+            downloads = downloads_all = cls.downloads_fallback
+
+        return cls._build_stats(views, views_all, downloads, downloads_all)
 
-            fallback_result = {
-                "downloads": 0,
-                "unique_downloads": 0,
-                "data_volume": 0,
+    #
+    # Bulk API
+    #
+    @classmethod
+    def _build_bulk_query(cls, query_name, values):
+        """Build a statistics query for many values of its required filter.
+
+        Instead of filtering on a single value (e.g. a ``recid``), the query is
+        filtered on all of the values at once and its metrics are computed in a
+        terms aggregation bucket per value.
+        """
+        query = cls._get_query(query_name)
+        (filtered_field,) = query.required_filters.values()
+
+        search = query.build_query(None, None).filter(
+            "terms", **{filtered_field: values}
+        )
+        bucket = search.aggs.bucket(
+            "by_value", "terms", field=filtered_field, size=len(values)
+        )
+        for dst, (metric, field, opts) in query.metric_fields.items():
+            bucket.metric(dst, metric, field=field, **opts)
+
+        return query, search
+
+    @classmethod
+    def _process_bulk_result(cls, query, response):
+        """Map each value of the required filter to its metrics."""
+        result = {}
+        for bucket in response.aggregations.by_value.buckets:
+            result[bucket.key] = {
+                metric: bucket[metric].value for metric in query.metric_fields
             }
-            downloads = downloads_all = fallback_result
+        return result
 
-        stats = {
-            "this_version": {
-                "views": views["views"],
-                "unique_views": views["unique_views"],
-                "downloads": downloads["downloads"],
-                "unique_downloads": downloads["unique_downloads"],
-                "data_volume": downloads["data_volume"],
-            },
-            "all_versions": {
-                "views": views_all["views"],
-                "unique_views": views_all["unique_views"],
-                "downloads": downloads_all["downloads"],
-                "unique_downloads": downloads_all["unique_downloads"],
-                "data_volume": downloads_all["data_volume"],
-            },
+    @classmethod
+    def get_records_stats(cls, recids, parent_recids):
+        """Fetch the statistics for many records in a single round-trip.
+
+        The four statistics queries are sent as one multi-search request, each
+        of them aggregating the metrics per ``recid`` (or ``parent_recid``).
+
+        :param recids: list of record ids.
+        :param parent_recids: list of the records' parent ids, in the same order.
+        :returns: mapping of each record id to its statistics.
+        """
+        recids = dict(zip(recids, parent_recids))
+        if not recids:
+            return {}
+
+        queries = {
+            "record-view": list(recids.keys()),
+            "record-view-all-versions": list(set(recids.values())),
+            "record-download": list(recids.keys()),
+            "record-download-all-versions": list(set(recids.values())),
         }
 
-        return stats
+        results = {}
+        try:
+            msearch = dsl.MultiSearch(using=current_search_client)
+            built_queries = []
+            for query_name, values in queries.items():
+                query, search = cls._build_bulk_query(query_name, values)
+                built_queries.append((query_name, query))
+                msearch = msearch.add(search)
+
+            responses = msearch.execute(raise_on_error=False)
+            for (query_name, query), response in zip(built_queries, responses):
+                if response is None:
+                    # the view and download indices can fail independently
+                    current_app.logger.warning(
+                        f"Bulk statistics query '{query_name}' failed."
+                    )
+                    continue
+                results[query_name] = cls._process_bulk_result(query, response)
+        except Exception as e:
+            # e.g. opensearchpy.exceptions.NotFoundError
+            # when the aggregation search index hasn't been created yet
+            current_app.logger.warning(e)
+
+        views = results.get("record-view", {})
+        views_all = results.get("record-view-all-versions", {})
+        downloads = results.get("record-download", {})
+        downloads_all = results.get("record-download-all-versions", {})
+
+        return {
+            recid: cls._build_stats(
+                views.get(recid, cls.views_fallback),
+                views_all.get(parent_recid, cls.views_fallback),
+                downloads.get(recid, cls.downloads_fallback),
+                downloads_all.get(parent_recid, cls.downloads_fallback),
+            )
+            for recid, parent_recid in recids.items()
+        }
+
+    @classmethod
+    @contextmanager
+    def prefetch(cls, records):
+        """Prefetch the statistics of the given records for the enclosed block.
+
+        Drafts are skipped, as their statistics are never dumped.
+        """
+        published = [record for record in records if not record.is_draft]
+        stats = cls.get_records_stats(
+            [record["id"] for record in published],
+            [record.parent["id"] for record in published],
+        )
+        token = _prefetched_stats.set(stats)
+        try:
+            yield stats
+        finally:
+            _prefetched_stats.reset(token)
+
+    @classmethod
+    def get_prefetched_stats(cls, recid):
+        """Get the prefetched statistics for the record, if any."""
+        prefetched = _prefetched_stats.get()
+        if prefetched is None:
+            return None
+        return prefetched.get(recid)
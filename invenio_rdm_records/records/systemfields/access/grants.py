@@ -268,8 +268,13 @@ class Grants(list):
 
     def extend(self, grants):
         """Add all new items from the specified grants to this list."""
+        # look up the existing grants in a set, rather than scanning the list for
+        # each new grant
+        existing = set(self)
         for grant in grants:
-            self.add(grant)
+            if grant not in existing:
+                existing.add(grant)
+                super().append(grant)
 
     def create(
         self,
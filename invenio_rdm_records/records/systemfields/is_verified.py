@@ -2,9 +2,44 @@
 # SPDX-License-Identifier: MIT
 """Record 'verified' system field."""
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from flask import g, has_request_context
 from invenio_access.permissions import system_user_id
+from invenio_accounts.models import User
+from invenio_accounts.signals import datastore_post_commit
+from invenio_db import db
 from invenio_records_resources.records.systemfields.calculated import CalculatedField
 
+_prefetched_owners = ContextVar("rdm_prefetched_verified_owners", default=None)
+"""Verification of the owners prefetched for the current bulk operation."""
+
+
+def _owners_cache():
+    """Get the cache of the owners verification, if any.
+
+    The prefetched owners of a bulk operation take precedence, otherwise the
+    cache is scoped to the current request.
+    """
+    prefetched = _prefetched_owners.get()
+    if prefetched is not None:
+        return prefetched
+    if has_request_context():
+        if "rdm_verified_owners" not in g:
+            g.rdm_verified_owners = {}
+        return g.rdm_verified_owners
+    return None
+
+
+def _clear_request_cache(sender, session=None, **kwargs):
+    """Clear the request cache, as users might have been (un)verified."""
+    if has_request_context():
+        g.pop("rdm_verified_owners", None)
+
+
+datastore_post_commit.connect(_clear_request_cache)
+
 
 class IsVerifiedField(CalculatedField):
     """System field for calculating whether the record is verified."""
@@ -15,14 +50,62 @@ class IsVerifiedField(CalculatedField):
 
     def calculate(self, record):
         """Calculate the ``is_verified`` property of the record."""
-        owner = record.access.owner.resolve()
-        if not owner:
-            # `null` or deleted user
-            return False
-
-        if isinstance(owner, dict) and owner["id"] == system_user_id:
+        owner = record.access.owner
+        if owner.owner_type == "user" and owner.owner_id == system_user_id:
             # system user
             return True
+
+        cache = _owners_cache() if owner.owner_id is not None else None
+        key = str(owner.owner_id)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        entity = owner.resolve()
+        if not entity:
+            # `null` or deleted user
+            verified = False
+        elif isinstance(entity, dict) and entity["id"] == system_user_id:
+            # system user
+            verified = True
         else:
             # real user
-            return owner.verified_at is not None
+            verified = entity.verified_at is not None
+
+        if cache is not None:
+            cache[key] = verified
+        return verified
+
+    @staticmethod
+    @contextmanager
+    def prefetch(parents):
+        """Prefetch the verification of the owners of the parents, in one query.
+
+        In the enclosed block, the ``is_verified`` field of the parents (and of
+        any other parent owned by the same users) is read from memory.
+        """
+        owner_ids = set()
+        for parent in parents:
+            owner = parent.access.owner
+            if owner.owner_type == "user" and owner.owner_id not in (
+                None,
+                system_user_id,
+            ):
+                owner_ids.add(str(owner.owner_id))
+
+        prefetched = dict(_prefetched_owners.get() or {})
+        missing = [id_ for id_ in owner_ids if id_ not in prefetched]
+        if missing:
+            # the deleted users are considered unverified
+            prefetched.update({id_: False for id_ in missing})
+            users = db.session.query(User.id, User.verified_at).filter(
+                User.id.in_([int(id_) for id_ in missing if id_.isdigit()])
+            )
+            prefetched.update(
+                {str(id_): verified_at is not None for id_, verified_at in users}
+            )
+
+        token = _prefetched_owners.set(prefetched)
+        try:
+            yield prefetched
+        finally:
+            _prefetched_owners.reset(token)
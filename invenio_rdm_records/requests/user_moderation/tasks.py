@@ -3,7 +3,11 @@
 
 """User moderation tasks."""
 
+from itertools import islice
+
 from celery import shared_task
+from datacite.errors import DataCiteError
+from flask import current_app
 from invenio_access.permissions import system_identity
 from invenio_users_resources.records.api import UserAggregate
 
@@ -12,8 +16,44 @@ from invenio_rdm_records.records.systemfields.deletion_status import (
     RecordDeletionStatusEnum,
 )
 from invenio_rdm_records.services.errors import DeletionStatusException
+from invenio_rdm_records.services.pids.providers import DataCitePIDProvider
+from invenio_rdm_records.services.pids.queue import send_requests
+
+from .utils import get_user_records, log_moderation_progress
+
+
+def record_batches(recids):
+    """Split the record ids in batches of ``RDM_USER_MODERATION_BATCH_SIZE``."""
+    batch_size = current_app.config["RDM_USER_MODERATION_BATCH_SIZE"]
+    recids = iter(recids)
+    while batch := list(islice(recids, batch_size)):
+        yield batch
+
+
+def _send_deferred_requests(requests):
+    """Send the deferred DOI hide/show requests, rate limited.
 
-from .utils import get_user_records
+    :returns: the number of failed requests.
+    """
+    config = current_app.config
+    errors = send_requests(
+        [(provider, method, kwargs) for provider, _, method, kwargs in requests],
+        concurrency=config["RDM_PIDS_SYNC_CONCURRENCY"],
+        rate_limit=config["RDM_PIDS_SYNC_RATE_LIMIT"],
+    )
+    failed = 0
+    for (provider, pid, method, _), error in zip(requests, errors):
+        if error is None:
+            continue
+        failed += 1
+        action = "hiding" if method == "hide_doi" else "showing"
+        if isinstance(error, DataCiteError):
+            provider.log_error(pid, action, error)
+        else:
+            current_app.logger.error(
+                f"Failed {action} the DOI {pid.pid_value}.", exc_info=error
+            )
+    return failed
 
 
 @shared_task(ignore_result=True)
@@ -24,13 +64,14 @@ def user_block_cleanup(user_id, tombstone_data):
     if not user.blocked:
         return
 
-    for recid in get_user_records(
+    recids = get_user_records(
         user_id,
         from_db=True,
         # Only fetch published records that might have not been deleted yet.
         status=[RecordDeletionStatusEnum.PUBLISHED],
-    ):
-        delete_record.delay(recid, tombstone_data)
+    )
+    for batch in record_batches(recids):
+        delete_records.delay(batch, tombstone_data)
 
 
 @shared_task(ignore_result=True)
@@ -41,13 +82,14 @@ def user_restore_cleanup(user_id):
     if user.blocked:
         return
 
-    for recid in get_user_records(
+    recids = get_user_records(
         user_id,
         from_db=True,
         # Only fetch deleted records that might have not been restored yet.
         status=[RecordDeletionStatusEnum.DELETED],
-    ):
-        restore_record.delay(recid)
+    )
+    for batch in record_batches(recids):
+        restore_records.delay(batch)
 
 
 @shared_task(ignore_result=True)
@@ -70,3 +112,55 @@ def restore_record(recid):
     except DeletionStatusException as ex:
         # Record is already restored; index it again to make sure search is up-to-date.
         current_rdm_records_service.indexer.index(ex.record)
+
+
+@shared_task(ignore_result=True)
+def delete_records(recids, tombstone_data, user_id=None, batch=None, total=None):
+    """Delete a batch of records, in a single transaction.
+
+    The DOIs of the records are hidden after the commit, through the rate
+    limited DataCite requests.
+
+    :param user_id: the blocked user, whose moderation request logs the
+        progress (if given).
+    :param batch: the number of this batch, out of ``total`` batches.
+    """
+    with DataCitePIDProvider.deferred_requests() as requests:
+        stats = current_rdm_records_service.delete_records(
+            system_identity, recids, tombstone_data
+        )
+    failed = _send_deferred_requests(requests)
+
+    if user_id is not None:
+        log_moderation_progress(
+            user_id,
+            "records_deleted",
+            f"Records deletion, batch {batch} of {total}: {stats['deleted']} "
+            f"records deleted, {stats['skipped']} already deleted, {len(requests)} "
+            f"DOIs hidden ({failed} failed).",
+        )
+
+
+@shared_task(ignore_result=True)
+def restore_records(recids, user_id=None, batch=None, total=None):
+    """Restore a batch of records, in a single transaction.
+
+    The DOIs of the records are shown again after the commit, through the
+    rate limited DataCite requests.
+
+    :param user_id: the restored user, whose moderation request logs the
+        progress (if given).
+    :param batch: the number of this batch, out of ``total`` batches.
+    """
+    with DataCitePIDProvider.deferred_requests() as requests:
+        stats = current_rdm_records_service.restore_records(system_identity, recids)
+    failed = _send_deferred_requests(requests)
+
+    if user_id is not None:
+        log_moderation_progress(
+            user_id,
+            "records_restored",
+            f"Records restoration, batch {batch} of {total}: {stats['restored']} "
+            f"records restored, {stats['skipped']} not deleted, {len(requests)} "
+            f"DOIs shown ({failed} failed).",
+        )
@@ -4,7 +4,12 @@
 
 """RDM user moderation utilities."""
 
+from invenio_access.permissions import system_identity
 from invenio_db import db
+from invenio_requests.customizations.event_types import LogEventType
+from invenio_requests.customizations.user_moderation import UserModerationRequest
+from invenio_requests.proxies import current_events_service
+from invenio_requests.records.api import Request
 from invenio_search.api import RecordsSearchV2
 
 from ...proxies import current_rdm_records_service
@@ -42,3 +47,26 @@ def get_user_records(user_id, from_db=False, status=None):
             status = [s.value for s in status]
             search = search.filter("terms", deletion_status=status)
         return (hit["id"] for hit in search.scan())
+
+
+def get_moderation_request(user_id):
+    """Get the latest moderation request of the user, if any."""
+    model_cls = Request.model_cls
+    model = (
+        model_cls.query.filter(
+            model_cls.json["type"].as_string() == UserModerationRequest.type_id,
+            model_cls.json["topic"]["user"].as_string() == str(user_id),
+        )
+        .order_by(model_cls.created.desc())
+        .first()
+    )
+    return Request(model.data, model=model) if model else None
+
+
+def log_moderation_progress(user_id, event, content):
+    """Log the progress of a moderation action on the moderation request."""
+    request = get_moderation_request(user_id)
+    if request is None:
+        return
+    data = {"payload": {"event": event, "content": content}}
+    current_events_service.create(system_identity, request.id, data, LogEventType)
@@ -4,7 +4,7 @@
 """Schemas for parameter parsing."""
 
 from invenio_drafts_resources.resources.records.args import SearchRequestArgsSchema
-from marshmallow import fields
+from marshmallow import fields, validate
 
 
 class RDMSearchRequestArgsSchema(SearchRequestArgsSchema):
@@ -15,3 +15,4 @@ class RDMSearchRequestArgsSchema(SearchRequestArgsSchema):
     status = fields.Str()
     include_deleted = fields.Bool()
     shared_with_me = fields.Bool()
+    links = fields.Str(validate=validate.OneOf(["full", "minimal"]))
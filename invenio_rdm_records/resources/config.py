@@ -272,6 +272,15 @@ class RDMRecordResourceConfig(RecordResourceConfig, ConfiguratorMixin):
         "include_previous": ma.fields.Bool(),
     }
 
+    request_revisions_args = {
+        "size": ma.fields.Int(validate=ma.validate.Range(min=1)),
+        "after": ma.fields.Int(),
+        "mode": ma.fields.Str(
+            validate=ma.validate.OneOf(["metadata", "full", "diff"]),
+            load_default="metadata",
+        ),
+    }
+
     request_body_parsers = {
         "application/json": RequestBodyParser(JSONDeserializer()),
         f'application/ld+json;profile="{ROCRATE_PROFILE}"': RequestBodyParser(
@@ -484,6 +493,7 @@ class RDMParentGrantsResourceConfig(RecordResourceConfig, ConfiguratorMixin):
 
     routes = {
         "list": "/grants",
+        "batch": "/grants/batch",
         "item": "/grants/<grant_id>",
     }
 
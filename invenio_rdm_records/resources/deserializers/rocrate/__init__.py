@@ -33,28 +33,57 @@ class ROCrateJSONDeserializer(JSONDeserializer):
 
     @staticmethod
     def _dereference(data: list):
+        """Dereference the entities of the graph, starting from the root dataset.
+
+        Each entity is resolved once and the resolved entity is shared by all the
+        nodes referencing it, which keeps the dereferencing linear in the size of
+        the graph. The input graph is not modified. A reference back to an entity
+        being resolved (i.e. a cycle) is left as a plain reference.
+        """
         entities = {}
         for item in data:
             if "@id" in item:
                 entities[item["@id"]] = item
-            item.pop("@reverse", None)
-
-        dataset = entities.pop("./")
-
-        def _walk(node):
-            if isinstance(node, dict):
-                for key in list(node.keys()):
-                    value = node[key]
-                    if key == "@id" and value in entities:
-                        node.update(entities[value])
-                    if isinstance(value, (list, dict)):
-                        _walk(value)
-            elif isinstance(node, list):
-                for item in node:
-                    _walk(item)
-
-        for value in entities.values():
-            _walk(value)
-        _walk(dataset)
-
-        return dataset
+
+        dataset = entities.pop("./", None)
+        if dataset is None:
+            raise DeserializerError(
+                _("Invalid RO-Crate metadata format, missing root dataset './'.")
+            )
+
+        resolved = {}
+        resolving = set()
+
+        def _resolve_entity(id_):
+            if id_ in resolved:
+                return resolved[id_]
+            if id_ in resolving:
+                # cycle, keep the reference
+                return {"@id": id_}
+            resolving.add(id_)
+            resolved[id_] = _resolve(entities[id_])
+            resolving.discard(id_)
+            return resolved[id_]
+
+        def _resolve(node):
+            if isinstance(node, list):
+                return [_resolve(item) for item in node]
+            if not isinstance(node, dict):
+                return node
+
+            id_ = node.get("@id")
+            entity = _resolve_entity(id_) if id_ in entities else None
+            if entity is not None and len(node) == 1:
+                # plain reference, share the resolved entity
+                return entity
+            result = {
+                key: _resolve(value) for key, value in node.items() if key != "@reverse"
+            }
+            if entity is not None:
+                result.update(entity)
+            return result
+
+        try:
+            return _resolve(dataset)
+        except RecursionError:
+            raise DeserializerError(_("RO-Crate metadata is nested too deeply."))
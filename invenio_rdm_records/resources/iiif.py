@@ -82,7 +82,7 @@ class IIIFResourceConfig(ResourceConfig, ConfiguratorMixin):
     }
 
     request_headers = {
-        "If-Modified-Since": ma.fields.DateTime(),
+        "If-Modified-Since": ma.fields.DateTime(format="rfc"),
     }
 
     response_handler = {"application/json": ResponseHandler(JSONSerializer())}
@@ -262,7 +262,7 @@ class IIIFResource(ErrorHandlersMixin, Resource):
         size = resource_requestctx.view_args["size"]
         rotation = resource_requestctx.view_args["rotation"]
         quality = resource_requestctx.view_args["quality"]
-        to_serve = self.service.image_api(
+        image = self.service.image_api(
             identity=g.identity,
             uuid=uuid,
             region=region,
@@ -273,12 +273,12 @@ class IIIFResource(ErrorHandlersMixin, Resource):
         )
         # decide the mime_type from the requested image_format
         mimetype = self.config.supported_formats.get(image_format, "image/jpeg")
-        # TODO: get from cache on the service image.last_modified
-        last_modified = None
-        send_file_kwargs = {"mimetype": mimetype}
-        # last_modified is not supported before flask 0.12
-        if last_modified:
-            send_file_kwargs.update(last_modified=last_modified)
+        last_modified = image.last_modified
+        send_file_kwargs = {
+            "mimetype": mimetype,
+            "etag": image.etag,
+            "last_modified": last_modified,
+        }
 
         dl = resource_requestctx.args.get("dl")
         if dl is not None:
@@ -300,11 +300,16 @@ class IIIFResource(ErrorHandlersMixin, Resource):
                 send_file_kwargs.update(
                     download_name=secure_filename(filename),
                 )
-        if_modified_since = resource_requestctx.headers.get("If-Modified-Since")
-        if if_modified_since and last_modified and if_modified_since >= last_modified:
-            raise HTTPJSONException(code=304)
+        # answer conditional requests without rendering the image
+        if request.if_none_match:
+            if request.if_none_match.contains(image.etag):
+                raise HTTPJSONException(code=304)
+        else:
+            if_modified_since = resource_requestctx.headers.get("If-Modified-Since")
+            if if_modified_since and if_modified_since >= last_modified:
+                raise HTTPJSONException(code=304)
 
-        response = send_file(to_serve, **send_file_kwargs)
+        response = send_file(image.open(), **send_file_kwargs)
         return response
 
 
@@ -10,8 +10,15 @@
 
 from functools import wraps
 
-from flask import abort, current_app, flash, g, redirect, url_for
-from flask_resources import Resource, resource_requestctx, response_handler, route
+from flask import abort, current_app, flash, g, redirect, request, url_for
+from flask_resources import (
+    Resource,
+    from_conf,
+    request_parser,
+    resource_requestctx,
+    response_handler,
+    route,
+)
 from invenio_base import invenio_url_for
 from invenio_drafts_resources.resources import RecordResource
 from invenio_i18n import lazy_gettext as _
@@ -28,6 +35,10 @@ from invenio_records_resources.resources.records.utils import search_preference
 from invenio_stats import current_stats
 from sqlalchemy.exc import NoResultFound
 
+request_revisions_args = request_parser(
+    from_conf("request_revisions_args"), location="args"
+)
+
 
 def response_header_signposting(f):
     """Add signposting link to view's reponse headers.
@@ -101,14 +112,32 @@ class RDMRecordResource(RecordResource):
 
     @request_headers
     @request_extra_args
+    @request_revisions_args
     @request_view_args
     def search_revisions(self):
-        """Return all revisions of a record."""
-        item = self.service.search_revisions(
-            identity=g.identity, id_=resource_requestctx.view_args["pid_value"]
-        )
+        """Return a page of revisions of a record.
 
-        return item.to_dict(), 200
+        The link to the next page is returned in the ``Link`` header.
+        """
+        args = resource_requestctx.args
+        item = self.service.search_revisions(
+            identity=g.identity,
+            id_=resource_requestctx.view_args["pid_value"],
+            size=args.get("size"),
+            after=args.get("after"),
+            mode=args["mode"],
+        )
+
+        headers = {}
+        if item.next_after is not None:
+            next_url = url_for(
+                request.endpoint,
+                **request.view_args,
+                **{**request.args.to_dict(), "after": item.next_after},
+                _external=True,
+            )
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return item.to_dict(), 200, headers
 
     @request_headers
     @request_extra_args
@@ -630,6 +659,7 @@ class RDMParentGrantsResource(RecordResource):
         return [
             route("GET", p("list"), self.search),
             route("POST", p("list"), self.create),
+            route("POST", p("batch"), self.batch_create),
             route("GET", p("item"), self.read),
             route("PUT", p("item"), self.update),
             route("PATCH", p("item"), self.partial_update),
@@ -666,6 +696,23 @@ class RDMParentGrantsResource(RecordResource):
         )
         return items.to_dict(), 201
 
+    @request_extra_args
+    @request_view_args
+    @request_data
+    @response_handler()
+    def batch_create(self):
+        """Create a large batch of access grants for a record."""
+        data = resource_requestctx.data
+        for grant in data["grants"]:
+            grant["origin"] = f"api:{g.identity.id}"
+        items = self.service.access.batch_create_grants(
+            identity=g.identity,
+            id_=resource_requestctx.view_args["pid_value"],
+            data=data,
+            expand=resource_requestctx.args.get("expand", False),
+        )
+        return items.to_dict(), 201
+
     @request_extra_args
     @request_view_args
     @request_data
@@ -4,6 +4,7 @@
 """CSL JSON and  citation string serializers for Invenio RDM Records."""
 
 import re
+import threading
 
 from citeproc import (
     Citation,
@@ -20,9 +21,11 @@ from flask_resources import BaseListSchema, MarshmallowSerializer
 from flask_resources.serializers import JSONSerializer
 from webargs import fields
 
+from ....cache import TTLCache
 from ....contrib.imprint.processors import ImprintCSLDumper
 from ....contrib.journal.processors import JournalCSLDumper
 from ....contrib.meeting.processors import MeetingCSLDumper
+from ....proxies import current_rdm_records
 from .schema import CSLJSONSchema
 
 
@@ -42,46 +45,97 @@ class CSLJSONSerializer(MarshmallowSerializer):
         )
 
 
-def get_citation_string(json, id, style, locale):
-    """Get the citation string from CiteProc library."""
+class CitationsCache:
+    """Process-local cache of the parsed CSL styles and the rendered citations.
 
-    def _clean_result(text):
-        """Remove double spaces, punctuation."""
-        text = re.sub(r"\s\s+", " ", text)
-        text = re.sub(r"\.\.+", ".", text)
-        return text
+    Parsing the style and locale files is much slower than rendering, so the
+    parsed styles are cached per (style, locale). The citations of the records
+    are cached per record revision, style and locale.
+    """
+
+    def __init__(self, styles_maxsize=32, maxsize=10000, ttl=3600):
+        """Constructor.
 
-    def _replace_doi_link(text, doi, new_doi_link):
-        """Replace the citation DOI link with the correct one.
-
-        Citation styles that generate a DOI URL in their citation generate it with the
-        form: "https://doi.org/<prefix>/<suffix>". However, when using a
-        Datacite test account (i.e. when `DATACITE_TEST_MODE = True`) and
-        potentially when using other providers' test accounts, the actual DOI URL is
-        of a different form: "https://handle.test.datacite.org/<prefix>/<suffix> as of
-        writing. By relying on a passed DOI URL instead, we can make sure the
-        correct URL is used. The DOI url is passed in the namespaced entry
-        json["_extras"]["links"]["doi"].
+        :param styles_maxsize: maximum number of cached (style, locale) pairs.
+        :param maxsize: maximum number of cached citations.
+        :param ttl: number of seconds after which a cached citation expires.
         """
-        if doi and new_doi_link:
-            return text.replace(f"https://doi.org/{doi}", new_doi_link)
-        else:
-            return text
-
-    extras = json.pop("_extras", {})
-    source = CiteProcJSON([json])
-    citation_style = CitationStylesStyle(validate=False, style=style, locale=locale)
-    bib = CitationStylesBibliography(citation_style, source, formatter.plain)
-    citation = Citation([CitationItem(id)])
-    bib.register(citation)
-
-    citation_raw = str(bib.bibliography()[0])
-    citation_doi_replaced = _replace_doi_link(
-        citation_raw,
-        json.get("DOI"),
-        extras.get("links", {}).get("doi"),
-    )
-    return _clean_result(citation_doi_replaced)
+        self.styles = TTLCache(maxsize=styles_maxsize, ttl=None)
+        self.citations = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get_style(self, style, locale):
+        """Get the parsed CSL style for the locale, and the lock to render with it.
+
+        Rendering a bibliography modifies the style, so it must be done while
+        holding the returned lock.
+        """
+        return self.styles.get_or_set(
+            (style, locale),
+            lambda: (
+                CitationStylesStyle(validate=False, style=style, locale=locale),
+                threading.Lock(),
+            ),
+        )
+
+    def stats(self):
+        """Get the hit/miss counters of the caches."""
+        return {"styles": self.styles.stats(), "citations": self.citations.stats()}
+
+
+def _clean_result(text):
+    """Remove double spaces, punctuation."""
+    text = re.sub(r"\s\s+", " ", text)
+    text = re.sub(r"\.\.+", ".", text)
+    return text
+
+
+def _replace_doi_link(text, doi, new_doi_link):
+    """Replace the citation DOI link with the correct one.
+
+    Citation styles that generate a DOI URL in their citation generate it with the
+    form: "https://doi.org/<prefix>/<suffix>". However, when using a
+    Datacite test account (i.e. when `DATACITE_TEST_MODE = True`) and
+    potentially when using other providers' test accounts, the actual DOI URL is
+    of a different form: "https://handle.test.datacite.org/<prefix>/<suffix> as of
+    writing. By relying on a passed DOI URL instead, we can make sure the
+    correct URL is used. The DOI url is passed in the namespaced entry
+    json["_extras"]["links"]["doi"].
+    """
+    if doi and new_doi_link:
+        return text.replace(f"https://doi.org/{doi}", new_doi_link)
+    else:
+        return text
+
+
+def get_citation_strings(entries, style, locale):
+    """Get the citation strings of several records, from a single bibliography.
+
+    :param entries: list of ``(json, id)`` tuples.
+    :returns: the citation strings, in the order of the entries.
+    """
+    extras = [json.pop("_extras", {}) for json, _ in entries]
+    source = CiteProcJSON([json for json, _ in entries])
+    citation_style, lock = current_rdm_records.citations_cache.get_style(style, locale)
+    with lock:
+        bib = CitationStylesBibliography(citation_style, source, formatter.plain)
+        for _, id in entries:
+            bib.register(Citation([CitationItem(id)]))
+        rendered = dict(zip(bib.keys, (str(c) for c in bib.bibliography())))
+
+    citations = []
+    for (json, id), extra in zip(entries, extras):
+        citation_doi_replaced = _replace_doi_link(
+            rendered[CitationItem(id).key],
+            json.get("DOI"),
+            extra.get("links", {}).get("doi"),
+        )
+        citations.append(_clean_result(citation_doi_replaced))
+    return citations
+
+
+def get_citation_string(json, id, style, locale):
+    """Get the citation string from CiteProc library."""
+    return get_citation_strings([(json, id)], style, locale)[0]
 
 
 def get_style_location(style):
@@ -132,11 +186,8 @@ class StringCitationSerializer(MarshmallowSerializer):
         )
         self.url_args_retriever = url_args_retriever
 
-    def serialize_object(self, record):
-        """Serialize the output of a RecordItem.to_dict() to a citation string.
-
-        :param record: dict from RecordItem.to_dict().
-        """
+    def _style_args(self):
+        """Get the style file path and the locale of the citations."""
         style, locale = (
             self.url_args_retriever()
             if callable(self.url_args_retriever)
@@ -145,22 +196,50 @@ class StringCitationSerializer(MarshmallowSerializer):
         # set defaults if params are not provided
         style = style or self._default_style
         locale = locale or self._default_locale
+        return get_style_location(style), locale
 
-        style_filepath = get_style_location(style)
-
+    def _dump_record(self, record):
+        """Dump the record to CSL JSON."""
         # Pass the record links under _extras namespace
         # so that DOI link can be replaced
         record_dumped = self.dump_obj(record)
         record_dumped.setdefault("_extras", {})
         record_dumped["_extras"]["links"] = record.get("links", {})
+        return record_dumped
+
+    def serialize_object(self, record):
+        """Serialize the output of a RecordItem.to_dict() to a citation string.
 
-        return get_citation_string(record_dumped, record["id"], style_filepath, locale)
+        The citations are cached per record revision, style and locale.
+
+        :param record: dict from RecordItem.to_dict().
+        """
+        style_filepath, locale = self._style_args()
+
+        def render():
+            return get_citation_string(
+                self._dump_record(record), record["id"], style_filepath, locale
+            )
+
+        if record.get("revision_id") is None:
+            return render()
+        key = (
+            record["id"],
+            record.get("is_draft", False),
+            record["revision_id"],
+            style_filepath,
+            locale,
+        )
+        return current_rdm_records.citations_cache.citations.get_or_set(key, render)
 
     def serialize_object_list(self, records):
-        """Serialize a list of records.
+        """Serialize a list of records, as a single bibliography.
 
         :param records: List of records instance.
         """
-        return "\n".join(
-            [self.serialize_object(rec) for rec in records["hits"]["hits"]]
-        )
+        hits = records["hits"]["hits"]
+        if not hits:
+            return ""
+        style_filepath, locale = self._style_args()
+        entries = [(self._dump_record(rec), rec["id"]) for rec in hits]
+        return "\n".join(get_citation_strings(entries, style_filepath, locale))
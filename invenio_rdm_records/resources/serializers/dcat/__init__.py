@@ -5,6 +5,8 @@
 """Datacite to DCAT serializer."""
 
 import mimetypes
+import threading
+from functools import lru_cache
 from importlib.resources import files
 
 from datacite import schema45
@@ -12,11 +14,35 @@ from flask_resources import BaseListSchema, MarshmallowSerializer
 from flask_resources.serializers import SimpleSerializer
 from idutils import detect_identifier_schemes, to_url
 from lxml import etree as ET
-from werkzeug.utils import cached_property
 
 from ....contrib.journal.processors import JournalDataciteDumper
 from ....resources.serializers.dcat.schema import DcatSchema
 
+_xslt_local = threading.local()
+
+
+@lru_cache(maxsize=1)
+def _dcat_stylesheet():
+    """Parse the DataCite to DCAT-AP XSLT stylesheet, once per process."""
+    file_ = (
+        files("invenio_rdm_records.resources.serializers")
+        / "dcat/datacite-to-dcat-ap.xsl"
+    )
+    with file_.open("rb") as f:
+        return ET.XML(f.read())
+
+
+def get_dcat_xslt():
+    """Get the compiled DataCite to DCAT-AP XSLT transformation.
+
+    The stylesheet is compiled once per thread, as the compiled transformations
+    should not be applied concurrently from several threads.
+    """
+    transform = getattr(_xslt_local, "transform", None)
+    if transform is None:
+        transform = _xslt_local.transform = ET.XSLT(_dcat_stylesheet())
+    return transform
+
 
 class DCATSerializer(MarshmallowSerializer):
     """DCAT serializer for records."""
@@ -32,6 +58,10 @@ class DCATSerializer(MarshmallowSerializer):
             **options,
         )
 
+    def dump_etree(self, obj):
+        """Dump the object into an lxml element, without going through a string."""
+        return self.transform_with_xslt(self.dump_obj(obj))
+
     def _etree_tostring(self, record, **kwargs):
         root = self.transform_with_xslt(record, **kwargs)
         return ET.tostring(
@@ -41,17 +71,10 @@ class DCATSerializer(MarshmallowSerializer):
             encoding="utf-8",
         ).decode("utf-8")
 
-    @cached_property
+    @property
     def xslt_transform_func(self):
         """Return the DCAT XSLT transformation function."""
-        file_ = (
-            files("invenio_rdm_records.resources.serializers")
-            / "dcat/datacite-to-dcat-ap.xsl"
-        )
-        with file_.open("rb") as f:
-            xsl = ET.XML(f.read())
-        transform = ET.XSLT(xsl)
-        return transform
+        return get_dcat_xslt()
 
     def _add_files(self, root, files):
         """Add files information via distribution elements."""
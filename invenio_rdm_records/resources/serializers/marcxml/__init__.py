@@ -32,6 +32,10 @@ class MARCXMLSerializer(MarshmallowSerializer):
             encoder=self.marcxml_tostring,
         )
 
+    def dump_etree(self, obj):
+        """Dump the object into an lxml element, without going through a string."""
+        return dumps_etree(self.dump_obj(obj))
+
     @classmethod
     def marcxml_tostring(cls, record):
         """Stringify a MarcXML record."""
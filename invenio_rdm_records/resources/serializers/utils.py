@@ -7,27 +7,99 @@
 
 import math
 
+from flask import current_app
 from invenio_access.permissions import system_identity
 from invenio_i18n import lazy_gettext as _
 from invenio_search.engine import dsl
 from invenio_vocabularies.proxies import current_service as vocabulary_service
 
+from ...cache import TTLCache
+from ...proxies import current_rdm_records
 from .errors import VocabularyItemNotFoundError
 
 
+class VocabularyPropsCache:
+    """Process-local cache of the props of whole vocabularies.
+
+    The props of all the items of a vocabulary are loaded at once, and cached per
+    vocabulary and fields. Items that are not part of the cached props (e.g. when
+    the vocabulary is larger than ``max_items``, or when the item was created in
+    the meantime) are looked up one by one, and the ids that don't exist are
+    cached as well, with the same time-to-live.
+    """
+
+    def __init__(self, maxsize=64, ttl=600, max_items=10000):
+        """Constructor.
+
+        :param maxsize: maximum number of cached (vocabulary, fields) entries.
+        :param ttl: number of seconds after which the props are reloaded.
+        :param max_items: maximum number of items loaded per vocabulary.
+        """
+        self.max_items = max_items
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def _read(self, vocabulary, fields, extra_filter="", max_records=150):
+        """Read the props of the vocabulary items, by id."""
+        results = vocabulary_service.read_all(
+            system_identity,
+            ["id"] + fields,
+            vocabulary,
+            cache=False,
+            extra_filter=extra_filter,
+            max_records=max_records,
+        )
+        return {h["id"]: h.get("props", {}) for h in results.hits}
+
+    def get(self, vocabulary, fields, id_):
+        """Get the props of the vocabulary item, or None if it doesn't exist."""
+        key = (vocabulary, tuple(fields))
+        props_map = self._cache.get_or_set(
+            key, lambda: self._read(vocabulary, fields, max_records=self.max_items)
+        )
+        if id_ in props_map:
+            return props_map[id_]
+
+        missing_key = (*key, id_)
+        if missing_key in self._cache:
+            return None
+
+        found = self._read(vocabulary, fields, extra_filter=dsl.Q("term", id=id_))
+        if id_ in found:
+            # the cached map is shared between threads, it's never mutated
+            self._cache.update(key, lambda cached: {**cached, **found})
+        else:
+            self._cache.set(missing_key, None)
+        return found.get(id_)
+
+    def invalidate(self, vocabulary=None):
+        """Invalidate the cached props of the vocabulary, or of all of them."""
+        if vocabulary is None:
+            self._cache.invalidate()
+        else:
+            self._cache.invalidate(lambda key: key[0] == vocabulary)
+
+    def stats(self):
+        """Get the hit/miss counters of the cache."""
+        return self._cache.stats()
+
+
+def invalidate_vocabulary_props(mapper, connection, target):
+    """Invalidate the cached props of the vocabulary of a changed item.
+
+    Meant to be registered as a listener of the vocabulary model's events.
+    """
+    ext = current_app.extensions.get("invenio-rdm-records")
+    if ext is None:
+        return
+    vocabulary = ((target.json or {}).get("type") or {}).get("id")
+    ext.vocabulary_props_cache.invalidate(vocabulary)
+
+
 def get_vocabulary_props(vocabulary, fields, id_):
     """Returns props associated with a vocabulary, id_."""
-    # This is ok given that read_all is cached per vocabulary+fields and
-    # is reused overtime
-    results = vocabulary_service.read_all(
-        system_identity,
-        ["id"] + fields,
-        vocabulary,
-        extra_filter=dsl.Q("term", id=id_),
-    )
-
-    for h in results.hits:
-        return h.get("props", {})
+    props = current_rdm_records.vocabulary_props_cache.get(vocabulary, fields, id_)
+    if props is not None:
+        return props
 
     raise VocabularyItemNotFoundError(
         _(
@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Verification cache for secret link tokens."""
+
+import hashlib
+
+from flask import current_app
+from invenio_db import db
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..cache import TTLCache
+from .serializers import SecretLinkSerializer, TimedSecretLinkSerializer
+from .signals import link_created, link_revoked
+
+
+class TokenVerificationCache:
+    """Per-process cache for the verification of secret link tokens.
+
+    To verify a token, we need the serializer (digest algorithm, expiring or not)
+    that signed it. We also check in the database that its link still exists and
+    has not expired. The cache holds prebuilt serializers and remembers, per
+    token, which serializer matched. It also keeps the result of the database
+    check for a short time.
+
+    Revoking a link, or changing its expiration date, evicts its token from
+    the cache of the current process once the change is committed (before that,
+    a concurrent request could cache the old row again). The other processes
+    may still accept the link until their entry expires.
+    """
+
+    session_key = "rdm_secret_links_evictions"
+    """Key of the tokens to evict on commit, in the session info."""
+
+    def __init__(self, algorithms):
+        """Constructor.
+
+        :param algorithms: the supported digest algorithms, in order of preference.
+        """
+        self.algorithms = algorithms
+        self._serializers = (None, [])
+        self._matches = None
+        self._links = None
+
+        link_created.connect(self._evict_link, weak=False)
+        link_revoked.connect(self._evict_link, weak=False)
+        event.listen(Session, "after_commit", self._evict_committed)
+        event.listen(Session, "after_rollback", self._discard_evictions)
+
+    @staticmethod
+    def digest(token):
+        """Get the cache key of a token."""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    @property
+    def serializers(self):
+        """Prebuilt serializers for all the supported algorithms."""
+        secret_key = current_app.config["SECRET_KEY"]
+        key, serializers = self._serializers
+        if key != secret_key:
+            serializers = [
+                serializer_cls(algorithm_name=algorithm)
+                for algorithm in self.algorithms
+                for serializer_cls in (SecretLinkSerializer, TimedSecretLinkSerializer)
+            ]
+            self._serializers = (secret_key, serializers)
+        return serializers
+
+    @property
+    def matches(self):
+        """Index of the serializer that signed each token."""
+        if self._matches is None:
+            # the serializer of a token never changes, so there's no expiration
+            self._matches = TTLCache(
+                maxsize=current_app.config.get(
+                    "RDM_SECRET_LINKS_VERIFICATION_CACHE_MAXSIZE", 10000
+                ),
+                ttl=None,
+            )
+        return self._matches
+
+    @property
+    def links(self):
+        """Existence and expiration date of the link of each token."""
+        if self._links is None:
+            self._links = TTLCache(
+                maxsize=current_app.config.get(
+                    "RDM_SECRET_LINKS_VERIFICATION_CACHE_MAXSIZE", 10000
+                ),
+                ttl=current_app.config.get(
+                    "RDM_SECRET_LINKS_VERIFICATION_CACHE_TTL", 30
+                ),
+            )
+        return self._links
+
+    def load_token(self, token, expected_data=None, force=False):
+        """Load a token with the serializer that signed it.
+
+        Only the first time a token is seen are all the serializers tried.
+        """
+        serializers = self.serializers
+        key = self.digest(token)
+
+        index = self.matches.get(key)
+        if index is not None:
+            # the other serializers can't verify the signature anyway
+            return serializers[index].validate_token(
+                token, expected_data=expected_data, force=force
+            )
+
+        for index, serializer in enumerate(serializers):
+            # serializer.validate_token() already handles BadData
+            data = serializer.validate_token(
+                token, expected_data=expected_data, force=force
+            )
+            if data:
+                self.matches.set(key, index)
+                return data
+
+        return None
+
+    def get_link(self, token, loader):
+        """Get whether the link of the token exists, and its expiration date.
+
+        :param loader: function returning an ``(exists, expires_at)`` tuple,
+            called if the result is not cached.
+        """
+        return self.links.get_or_set(self.digest(token), loader)
+
+    def evict_on_commit(self, token):
+        """Evict the token from the cache, once the current transaction commits."""
+        if token:
+            db.session.info.setdefault(self.session_key, set()).add(self.digest(token))
+
+    def _evict_link(self, link):
+        """Evict the token of a created or revoked link."""
+        self.evict_on_commit(link.token)
+
+    def _evict_committed(self, session):
+        """Evict the tokens of the links changed by the committed transaction."""
+        keys = session.info.pop(self.session_key, None)
+        if keys and self._links is not None:
+            for key in keys:
+                self._links.delete(key)
+
+    def _discard_evictions(self, session):
+        """Forget the evictions of a rolled back transaction."""
+        session.info.pop(self.session_key, None)
+
+    def clear(self):
+        """Clear the cached verifications."""
+        self._serializers = (None, [])
+        self._matches = None
+        self._links = None
@@ -8,8 +8,10 @@ import uuid
 from datetime import date, datetime, timezone
 
 from invenio_db import db
+from sqlalchemy import event
 from sqlalchemy_utils import UUIDType
 
+from .cache import TokenVerificationCache
 from .errors import InvalidPermissionLevelError
 from .permissions import LinkNeed
 from .serializers import SecretLinkSerializer, TimedSecretLinkSerializer
@@ -17,6 +19,9 @@ from .signals import link_created, link_revoked
 
 SUPPORTED_DIGEST_ALGORITHMS = ("HS256", "HS512")
 
+verification_cache = TokenVerificationCache(SUPPORTED_DIGEST_ALGORITHMS)
+"""Per-process verification cache of the secret link tokens."""
+
 
 class SecretLink(db.Model):
     """Secret links for sharing permissions on records."""
@@ -55,7 +60,11 @@ class SecretLink(db.Model):
     """Description of the secret link, for identification purposes."""
 
     def revoke(self):
-        """Revoke (i.e. delete) this secret link."""
+        """Revoke (i.e. delete) this secret link.
+
+        The link is evicted from the verification cache once the deletion is
+        committed.
+        """
         db.session.delete(self)
         link_revoked.send(self)
 
@@ -144,13 +153,21 @@ class SecretLink(db.Model):
         """Validate a secret link token.
 
         Only queries the database if token is valid to determine that the token
-        has not been revoked.
+        has not been revoked. The result of the query is cached for
+        ``RDM_SECRET_LINKS_VERIFICATION_CACHE_TTL`` seconds.
         """
         data = cls.load_token(token, expected_data=expected_data)
 
         if data:
-            link = db.session.get(cls, data["id"])
-            if link and not link.is_expired:
+
+            def load_link():
+                link = db.session.get(cls, data["id"])
+                if link is None:
+                    return False, None
+                return True, link.expires_at
+
+            exists, expires_at = verification_cache.get_link(token, load_link)
+            if exists and not (expires_at and datetime.now(timezone.utc) > expires_at):
                 return True
 
         return False
@@ -164,15 +181,13 @@ class SecretLink(db.Model):
         If ``force`` is set to ``True``, the token's expiration date is
         ignored.
         """
-        for algorithm in SUPPORTED_DIGEST_ALGORITHMS:
-            s = SecretLinkSerializer(algorithm_name=algorithm)
-            st = TimedSecretLinkSerializer(algorithm_name=algorithm)
-
-            for serializer in (s, st):
-                # serializer.validate_token() already handles BadData
-                data = serializer.validate_token(
-                    token, expected_data=expected_data, force=force
-                )
-
-                if data:
-                    return data
+        return verification_cache.load_token(
+            token, expected_data=expected_data, force=force
+        )
+
+
+@event.listens_for(SecretLink.expires_at, "set")
+def _expires_at_set(link, value, oldvalue, initiator):
+    """Evict the verification of a link whose expiration date changes."""
+    if value != oldvalue:
+        verification_cache.evict_on_commit(link.token)
@@ -6,14 +6,18 @@
 
 """RDM record access settings service."""
 
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 
 import arrow
 from flask import current_app
 from flask_login import current_user
 from invenio_access.permissions import authenticated_user, system_identity
+from invenio_access.proxies import current_access
+from invenio_accounts.proxies import current_datastore
 from invenio_audit_logs.services.uow import AuditLogOp
 from invenio_base import invenio_url_for
+from invenio_db import db
 from invenio_drafts_resources.services.records import RecordService
 from invenio_drafts_resources.services.records.uow import ParentRecordCommitOp
 from invenio_i18n import lazy_gettext as _
@@ -24,6 +28,7 @@ from invenio_records_resources.services.uow import RecordCommitOp, unit_of_work
 from invenio_requests.proxies import current_requests_service
 from invenio_search.engine import dsl
 from invenio_users_resources.proxies import current_user_resources
+from invenio_users_resources.records.api import GroupAggregate, UserAggregate
 from marshmallow.exceptions import ValidationError
 from sqlalchemy.orm.exc import NoResultFound
 
@@ -93,6 +98,11 @@ class RecordAccessService(RecordService):
         """Schema for grants."""
         return ServiceSchemaWrapper(self, schema=self.config.schema_grants)
 
+    @property
+    def schema_batch_grants(self):
+        """Schema for batches of grants."""
+        return ServiceSchemaWrapper(self, schema=self.config.schema_batch_grants)
+
     @property
     def schema_request_access(self):
         """Schema for secret links."""
@@ -438,53 +448,111 @@ class RecordAccessService(RecordService):
             #       "not found" errors, to not leak information about existence
             return False
 
+    def _validate_grant_subjects(self, identity, grants):
+        """Check if the subjects of the grants exist and are visible to the identity.
+
+        Like :meth:`_validate_grant_subject`, but the users and groups are resolved
+        with a single query per subject type.
+
+        :returns: The grants whose subject could not be validated.
+        """
+        ids = defaultdict(set)
+        for grant in grants:
+            ids[grant.subject_type].add(grant.subject_id)
+
+        valid = {
+            ("system_role", id_)
+            for id_ in ids["system_role"]
+            if id_ in current_access.system_roles
+        }
+
+        # NOTE: the IDs of users are integers, anything else can't be found
+        user_ids = {int(id_) for id_ in ids["user"] if id_.isdigit()}
+        if user_ids:
+            users_service = current_user_resources.users_service
+            user_model = current_datastore.user_model
+            with db.session.no_autoflush:
+                users = user_model.query.filter(user_model.id.in_(user_ids)).all()
+                for user in users:
+                    if users_service.check_permission(
+                        identity, "read", record=UserAggregate.from_model(user)
+                    ):
+                        valid.add(("user", str(user.id)))
+
+        if ids[RecordAccessService.group_subject_type]:
+            groups_service = current_user_resources.groups_service
+            role_model = current_datastore.role_model
+            role_ids = ids[RecordAccessService.group_subject_type]
+            with db.session.no_autoflush:
+                roles = role_model.query.filter(role_model.id.in_(role_ids)).all()
+                for role in roles:
+                    if groups_service.check_permission(
+                        identity, "read", record=GroupAggregate.from_model(role)
+                    ):
+                        valid.add((RecordAccessService.group_subject_type, role.id))
+
+        return [
+            grant
+            for grant in grants
+            if (grant.subject_type, grant.subject_id) not in valid
+        ]
+
     @unit_of_work()
-    def bulk_create_grants(self, identity, id_, data, expand=False, uow=None):
-        """Bulk create access grants for a record (resp. its parent)."""
+    def bulk_create_grants(
+        self, identity, id_, data, expand=False, uow=None, schema=None
+    ):
+        """Bulk create access grants for a record (resp. its parent).
+
+        :param schema: Schema to load the grants with, defaults to the grants
+            schema (which limits the number of grants per request).
+        """
         record, parent = self.get_parent_and_record_or_draft(id_)
 
         # Permissions
         self.require_permission(identity, "manage", record=record)
 
         # Validation
-        data, __ = self.schema_grants.load(
-            data, context={"identity": identity}, raise_errors=True
-        )
+        schema = schema or self.schema_grants
+        data, __ = schema.load(data, context={"identity": identity}, raise_errors=True)
 
         grants = data["grants"]
 
-        new_grants = []
-
         # fail if any of the grants already exist
-        if any(
-            existing_grant.subject_id == grant["subject"]["id"]
-            and existing_grant.subject_type == grant["subject"]["type"]
+        existing_subjects = {
+            (existing_grant.subject_type, existing_grant.subject_id)
             for existing_grant in parent.access.grants
+        }
+        if any(
+            (grant["subject"]["type"], grant["subject"]["id"]) in existing_subjects
             for grant in grants
         ):
             raise GrantExistsError()
 
-        for grant in grants:
-            # checks if groups are enabled in the instance
-            if (
-                not current_app.config.get("USERS_RESOURCES_GROUPS_ENABLED", False)
-                and grant["subject"]["type"] == RecordAccessService.group_subject_type
-            ):
-                raise PermissionDeniedError()
+        # checks if groups are enabled in the instance
+        if not current_app.config.get("USERS_RESOURCES_GROUPS_ENABLED", False) and any(
+            grant["subject"]["type"] == RecordAccessService.group_subject_type
+            for grant in grants
+        ):
+            raise PermissionDeniedError()
 
-            # Creation
-            new_grant = parent.access.grants.create(
+        # Creation
+        grant_cls = parent.access.grants.grant_cls
+        new_grants = [
+            grant_cls.create(
                 subject_type=grant["subject"]["type"],
                 subject_id=grant["subject"]["id"],
                 permission=grant["permission"],
                 origin=grant.get("origin"),
             )
+            for grant in grants
+        ]
+        if self._validate_grant_subjects(identity, new_grants):
+            raise ValidationError(
+                _("Could not find the specified subject."), field_name="subject.id"
+            )
+        parent.access.grants.extend(new_grants)
 
-            if not self._validate_grant_subject(identity, new_grant):
-                raise ValidationError(
-                    _("Could not find the specified subject."), field_name="subject.id"
-                )
-
+        for grant in grants:
             if grant["subject"]["type"] == "user" and grant.get("notify"):
                 uow.register(
                     NotificationOp(
@@ -496,7 +564,6 @@ class RecordAccessService(RecordService):
                         )
                     )
                 )
-            new_grants.append(new_grant)
 
         uow.register(ParentRecordCommitOp(parent, indexer_context=dict(service=self)))
         self._update_record_request(record, uow)
@@ -524,6 +591,22 @@ class RecordAccessService(RecordService):
             expand=expand,
         )
 
+    @unit_of_work()
+    def batch_create_grants(self, identity, id_, data, expand=False, uow=None):
+        """Create a large batch of access grants for a record (resp. its parent).
+
+        Same as :meth:`bulk_create_grants`, but accepts up to
+        ``RDM_RECORDS_GRANTS_BATCH_MAX_SIZE`` grants at once.
+        """
+        return self.bulk_create_grants(
+            identity,
+            id_,
+            data,
+            expand=expand,
+            uow=uow,
+            schema=self.schema_batch_grants,
+        )
+
     def read_grant(self, identity, id_, grant_id, expand=False):
         """Read a specific access grant of a record (resp. its parent)."""
         record, parent = self.get_parent_and_record_or_draft(id_)
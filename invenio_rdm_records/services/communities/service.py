@@ -9,10 +9,12 @@ from flask import current_app
 from flask_principal import AnonymousIdentity
 from invenio_access.permissions import system_identity
 from invenio_communities.proxies import current_communities
+from invenio_db import db
 from invenio_drafts_resources.services.records.uow import ParentRecordCommitOp
 from invenio_i18n import lazy_gettext as _
 from invenio_notifications.services.uow import NotificationOp
 from invenio_pidstore.errors import PIDDoesNotExistError, PIDUnregistered
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 from invenio_records_resources.services import (
     RecordIndexerMixin,
     Service,
@@ -21,12 +23,15 @@ from invenio_records_resources.services import (
 from invenio_records_resources.services.errors import PermissionDeniedError
 from invenio_records_resources.services.uow import (
     IndexRefreshOp,
+    RecordBulkIndexOp,
+    RecordCommitOp,
     RecordIndexOp,
     unit_of_work,
 )
 from invenio_requests import current_request_type_registry, current_requests_service
 from invenio_requests.resolvers.registry import ResolverRegistry
 from invenio_search.engine import dsl
+from sqlalchemy import insert
 from sqlalchemy.orm.exc import NoResultFound
 
 from ...notifications.builders import CommunityInclusionSubmittedNotificationBuilder
@@ -430,10 +435,63 @@ class RecordCommunitiesService(Service, RecordIndexerMixin):
 
         return record.parent
 
+    def _get_parents_by_record_pids(self, record_pids):
+        """Get the parents of the published records, with one query per model.
+
+        :returns: A dict mapping the PID of each found record to its parent.
+        """
+        record_cls = self.record_cls
+        model_cls = record_cls.model_cls
+        pid_type = record_cls.pid.field._pid_type
+
+        rows = (
+            db.session.query(PersistentIdentifier.pid_value, model_cls.parent_id)
+            .join(model_cls, model_cls.id == PersistentIdentifier.object_uuid)
+            .filter(
+                PersistentIdentifier.pid_type == pid_type,
+                PersistentIdentifier.pid_value.in_(record_pids),
+                PersistentIdentifier.status == PIDStatus.REGISTERED,
+                model_cls.json.isnot(None),
+            )
+            .all()
+        )
+        parents = {
+            str(parent.id): parent
+            for parent in record_cls.parent_record_cls.get_records(
+                {parent_id for _, parent_id in rows}
+            )
+        }
+        return {
+            pid_value: parents[str(parent_id)]
+            for pid_value, parent_id in rows
+            if str(parent_id) in parents
+        }
+
+    def _get_siblings_ids(self, parent_ids):
+        """Get the IDs of the records and drafts of the parents."""
+        siblings = []
+        for cls in (self.record_cls, self.draft_cls):
+            model_cls = cls.model_cls
+            ids = (
+                db.session.query(model_cls.id)
+                .filter(
+                    model_cls.parent_id.in_(parent_ids),
+                    model_cls.json.isnot(None),
+                )
+                .all()
+            )
+            siblings.append([str(id_) for id_, in ids])
+        return siblings
+
     @unit_of_work()
     def bulk_add(self, identity, community_id, record_ids, set_default=False, uow=None):
         """Bulk adds records to a community.
 
+        The records are processed in chunks of ``RDM_COMMUNITY_BULK_ADD_CHUNK_SIZE``:
+        the records and their parents are fetched and the community relations are
+        inserted with one query each per chunk. All the affected records and
+        drafts are then reindexed in a single bulk indexing pass.
+
         :param identity: The identity performing the action.
         :param community_id: The ID of the community.
         :param record_ids: List of record IDs to be added to the community.
@@ -454,41 +512,86 @@ class RecordCommunitiesService(Service, RecordIndexerMixin):
             uow=uow,
         )
 
-        for record_id in record_ids:
-            record = self.record_cls.pid.resolve(record_id)
-            community = current_communities.service.record_cls.pid.resolve(community_id)
+        community = current_communities.service.record_cls.pid.resolve(community_id)
+        parent_community = getattr(community, "parent", None)
+        m2m_model_cls = (
+            self.record_cls.parent_record_cls.communities.field._m2m_model_cls
+        )
 
-            already_included = community.id in record.parent.communities
-            if already_included:
-                errors.append(
-                    {
-                        "record_id": record_id,
-                        "community_id": community_id,
-                        "message": _("Community already included."),
-                    }
+        chunk_size = current_app.config["RDM_COMMUNITY_BULK_ADD_CHUNK_SIZE"]
+        total = len(record_ids)
+        updated_parents = set()
+        for start in range(0, total, chunk_size):
+            chunk = record_ids[start : start + chunk_size]
+            parents = self._get_parents_by_record_pids(chunk)
+
+            relations = []
+            chunk_parents = []
+            for record_id in chunk:
+                parent = parents.get(record_id)
+                if parent is None:
+                    errors.append(
+                        {
+                            "record_id": record_id,
+                            "community_id": community_id,
+                            "message": _("Record not found."),
+                        }
+                    )
+                    continue
+                # another version of the record has already been added
+                if str(parent.id) in updated_parents:
+                    continue
+
+                communities = parent.communities
+                if community.id in communities:
+                    errors.append(
+                        {
+                            "record_id": record_id,
+                            "community_id": community_id,
+                            "message": _("Community already included."),
+                        }
+                    )
+                    continue
+
+                data = communities.to_dict()
+                new_ids = []
+                if parent_community and str(parent_community.id) not in communities:
+                    new_ids.append(str(parent_community.id))
+                if set_default_flag["value"] or not (data.get("ids") or new_ids):
+                    data["default"] = str(community.id)
+                new_ids.append(str(community.id))
+
+                # the relations are inserted in bulk below, so only the
+                # denormalized state of the manager is updated here
+                data["ids"] = [*data.get("ids", []), *new_ids]
+                communities.from_dict(data)
+                relations.extend(
+                    {"record_id": parent.id, "community_id": id_, "request_id": None}
+                    for id_ in new_ids
                 )
-                continue
-
-            parent_community = getattr(community, "parent", None)
-            already_in_parent = (
-                parent_community
-                and str(parent_community.id) in record.parent.communities
-            )
+                chunk_parents.append(parent)
+                updated_parents.add(str(parent.id))
 
-            if parent_community and not already_in_parent:
-                record.parent.communities.add(parent_community, request=None)
+            if relations:
+                db.session.execute(insert(m2m_model_cls), relations)
+            for parent in chunk_parents:
+                uow.register(RecordCommitOp(parent))
 
-            set_default = set_default_flag["value"] or not record.parent.communities
-            record.parent.communities.add(community, request=None, default=set_default)
+            current_app.logger.info(
+                f"Added {min(start + chunk_size, total)}/{total} records to "
+                f"community {community_id}."
+            )
 
-            # Commit and bulk re-index everything
-            uow.register(
-                ParentRecordCommitOp(
-                    record.parent,
-                    indexer_context={"service": current_rdm_records_service},
-                    bulk_index=True,
+        # Bulk re-index everything
+        if updated_parents:
+            records_ids, drafts_ids = self._get_siblings_ids(updated_parents)
+            service = current_rdm_records_service
+            if records_ids:
+                uow.register(RecordBulkIndexOp(records_ids, indexer=service.indexer))
+            if drafts_ids:
+                uow.register(
+                    RecordBulkIndexOp(drafts_ids, indexer=service.draft_indexer)
                 )
-            )
         return errors
 
     def get_record_requests(self, identity, record):
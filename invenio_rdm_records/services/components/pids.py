@@ -12,10 +12,9 @@ from flask import current_app
 from invenio_drafts_resources.services.records.components import ServiceComponent
 from invenio_drafts_resources.services.records.uow import ParentRecordCommitOp
 from invenio_i18n import lazy_gettext as _
-from invenio_records_resources.services.uow import TaskOp
 
 from ..errors import ValidationErrorWithMessageAsList
-from ..pids.tasks import register_or_update_pid
+from ..pids.uow import PIDRegisterOrUpdateOp
 
 OPTIONAL_DOI_TRANSITIONS = {
     "datacite": {
@@ -239,7 +238,7 @@ class PIDsComponent(ServiceComponent):
 
         # Async register/update tasks after transaction commit.
         for scheme in pids.keys():
-            self.uow.register(TaskOp(register_or_update_pid, record["id"], scheme))
+            self.uow.register(PIDRegisterOrUpdateOp(record["id"], scheme))
 
     def new_version(self, identity, draft=None, record=None):
         """A new draft should not have any pids from the previous record."""
@@ -348,9 +347,7 @@ class ParentPIDsComponent(ServiceComponent):
 
         # Async register/update tasks after transaction commit.
         for scheme in pids.keys():
-            self.uow.register(
-                TaskOp(register_or_update_pid, record["id"], scheme, parent=True)
-            )
+            self.uow.register(PIDRegisterOrUpdateOp(record["id"], scheme, parent=True))
 
     def delete_record(self, identity, data=None, record=None, uow=None):
         """Process pids on delete record."""
@@ -363,9 +360,7 @@ class ParentPIDsComponent(ServiceComponent):
 
         # Async register/update tasks after transaction commit.
         for scheme in parent_pids.keys():
-            self.uow.register(
-                TaskOp(register_or_update_pid, record["id"], scheme, parent=True)
-            )
+            self.uow.register(PIDRegisterOrUpdateOp(record["id"], scheme, parent=True))
 
     def restore_record(self, identity, record=None, uow=None):
         """Restore previously invalidated pids."""
@@ -374,6 +369,4 @@ class ParentPIDsComponent(ServiceComponent):
 
         # Async register/update tasks after transaction commit.
         for scheme in parent_pids.keys():
-            self.uow.register(
-                TaskOp(register_or_update_pid, record["id"], scheme, parent=True)
-            )
+            self.uow.register(PIDRegisterOrUpdateOp(record["id"], scheme, parent=True))
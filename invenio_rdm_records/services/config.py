@@ -10,7 +10,6 @@
 """RDM Record Service."""
 
 import itertools
-from copy import deepcopy
 from os.path import splitext
 from pathlib import Path
 
@@ -69,6 +68,7 @@ from invenio_rdm_records.services.review.policy import NewRecordVersionReviewPol
 
 from ..records import RDMDraft, RDMRecord
 from ..records.api import RDMDraftMediaFiles, RDMRecordMediaFiles
+from ..records.indexer import RDMRecordIndexer
 from . import facets
 from .components import DefaultRecordsComponents
 from .customizations import (
@@ -76,6 +76,13 @@ from .customizations import (
     FromConfigPIDsProviders,
     FromConfigRequiredPIDs,
 )
+from .links import (
+    RDMConditionalLink,
+    RDMEndpointLink,
+    RDMRecordEndpointLink,
+    SharedPredicateMixin,
+    evaluate,
+)
 from .permissions import RDMRecordPermissionPolicy
 from .request_policies import (
     FileModificationPolicyEvaluator,
@@ -87,6 +94,7 @@ from .results import RDMRecordList, RDMRecordRevisionsList
 from .schemas import RDMParentSchema, RDMRecordSchema
 from .schemas.community_records import CommunityRecordsSchema
 from .schemas.parent.access import AccessSettingsSchema
+from .schemas.parent.access import BatchGrants as BatchGrantsSchema
 from .schemas.parent.access import Grant as GrantSchema
 from .schemas.parent.access import Grants as GrantsSchema
 from .schemas.parent.access import RequestAccessSchema
@@ -99,6 +107,7 @@ from .search_params import (
     MetricsParam,
     PublishedRecordsParam,
     SharedOrMyDraftsParam,
+    SourceExcludesParam,
     StatusParam,
 )
 from .sort import VerifiedRecordsSortParam
@@ -217,6 +226,7 @@ class RDMSearchOptions(SearchOptions, SearchOptionsMixin):
         StatusParam,
         PublishedRecordsParam,
         MetricsParam,
+        SourceExcludesParam,
     ]
 
 
@@ -245,7 +255,8 @@ class RDMSearchVersionsOptions(SearchVersionsOptions, SearchOptionsMixin):
     """Search options for record versioning search."""
 
     params_interpreters_cls = [
-        PublishedRecordsParam
+        PublishedRecordsParam,
+        SourceExcludesParam,
     ] + SearchVersionsOptions.params_interpreters_cls
 
 
@@ -254,7 +265,7 @@ class RDMSearchVersionsOptions(SearchVersionsOptions, SearchOptionsMixin):
 #
 
 
-class RecordPIDLink(ExternalLink):
+class RecordPIDLink(SharedPredicateMixin, ExternalLink):
     """Record external PID link."""
 
     def vars(self, record, vars):
@@ -279,7 +290,7 @@ class ThumbnailLinks:
     Adopts the interface of an EndpointLink but not one.
     """
 
-    link_for_thumbnail = EndpointLink(
+    link_for_thumbnail = RDMEndpointLink(
         "iiif.image_api",
         params=["uuid", "region", "size", "rotation", "quality", "image_format"],
     )
@@ -292,14 +303,13 @@ class ThumbnailLinks:
     def should_render(self, obj, context):
         """Determine if the dictionary of links should be rendered."""
         if self._when_func:
-            return bool(self._when_func(obj, context))
+            return bool(evaluate(self._when_func, obj, context))
         else:
             return True
 
     def expand(self, obj, context):
         """Expand the thumbs size dictionary of URIs."""
-        vars = {}
-        vars.update(deepcopy(context))
+        vars = context.copy()
         record = obj
         pid_value = record.pid.pid_value
         file_key = get_record_thumbnail_file(record=record)
@@ -319,7 +329,7 @@ class ThumbnailLinks:
         return links
 
 
-record_doi_link = ConditionalLink(
+record_doi_link = RDMConditionalLink(
     cond=is_datacite_test,
     if_=RecordPIDLink("https://handle.test.datacite.org/{+pid_doi}", when=has_doi),
     else_=RecordPIDLink("https://doi.org/{+pid_doi}", when=has_doi),
@@ -585,6 +595,10 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
     record_cls = FromConfig("RDM_RECORD_CLS", default=RDMRecord)
     draft_cls = FromConfig("RDM_DRAFT_CLS", default=RDMDraft)
 
+    # Indexers
+    indexer_cls = RDMRecordIndexer
+    draft_indexer_cls = RDMRecordIndexer
+
     # Schemas
     schema = FromConfig("RDM_RECORD_SCHEMA", default=RDMRecordSchema)
     schema_parent = RDMParentSchema
@@ -592,6 +606,7 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
     schema_secret_link = SecretLinkSchema
     schema_grant = GrantSchema
     schema_grants = GrantsSchema
+    schema_batch_grants = BatchGrantsSchema
     schema_request_access = RequestAccessSchema
     schema_tombstone = TombstoneSchema
     schema_quota = QuotaSchema
@@ -679,24 +694,24 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
     # Links
     links_item = {
         # Record
-        "self": ConditionalLink(
+        "self": RDMConditionalLink(
             cond=is_record,
-            if_=RecordEndpointLink("records.read"),
-            else_=RecordEndpointLink("records.read_draft"),
+            if_=RDMRecordEndpointLink("records.read"),
+            else_=RDMRecordEndpointLink("records.read_draft"),
         ),
-        "self_html": ConditionalLink(
+        "self_html": RDMConditionalLink(
             cond=is_record,
-            if_=RecordEndpointLink("invenio_app_rdm_records.record_detail"),
-            else_=RecordEndpointLink("invenio_app_rdm_records.deposit_edit"),
+            if_=RDMRecordEndpointLink("invenio_app_rdm_records.record_detail"),
+            else_=RDMRecordEndpointLink("invenio_app_rdm_records.deposit_edit"),
         ),
-        "preview_html": RecordEndpointLink(
+        "preview_html": RDMRecordEndpointLink(
             "invenio_app_rdm_records.record_detail",
             vars=vars_preview_html,
         ),
         # DOI
         "doi": record_doi_link,
         "self_doi": record_doi_link,
-        "self_doi_html": EndpointLink(
+        "self_doi_html": RDMEndpointLink(
             "invenio_app_rdm_records.record_from_pid",
             params=["pid_value", "pid_scheme"],
             when=is_record_and_has_doi,
@@ -708,13 +723,13 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
             ),
         ),
         # TODO: only include link when DOI support is enabled.
-        "reserve_doi": RecordEndpointLink(
+        "reserve_doi": RDMRecordEndpointLink(
             "records.pids_reserve",
             params=["pid_value", "scheme"],
             vars=lambda record, vars: vars.update({"scheme": "doi"}),
         ),
         # Parent
-        "parent": EndpointLink(
+        "parent": RDMEndpointLink(
             "records.read",
             params=["pid_value"],
             when=is_record,
@@ -722,7 +737,7 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
                 {"pid_value": record.parent.pid.pid_value}
             ),
         ),
-        "parent_html": EndpointLink(
+        "parent_html": RDMEndpointLink(
             "invenio_app_rdm_records.record_detail",
             params=["pid_value"],
             when=is_record,
@@ -730,7 +745,7 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
                 {"pid_value": record.parent.pid.pid_value}
             ),
         ),
-        "parent_doi": ConditionalLink(
+        "parent_doi": RDMConditionalLink(
             cond=is_datacite_test,
             if_=RecordPIDLink(
                 "https://handle.test.datacite.org/{+parent_pid_doi}",
@@ -741,7 +756,7 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
                 when=is_record_or_draft_and_has_parent_doi,
             ),
         ),
-        "parent_doi_html": EndpointLink(
+        "parent_doi_html": RDMEndpointLink(
             "invenio_app_rdm_records.record_from_pid",
             params=["pid_value", "pid_scheme"],
             when=is_record_or_draft_and_has_parent_doi,
@@ -753,97 +768,97 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
             ),
         ),
         # IIIF
-        "self_iiif_manifest": EndpointLink(
+        "self_iiif_manifest": RDMEndpointLink(
             "iiif.manifest", params=["uuid"], vars=vars_self_iiif
         ),
-        "self_iiif_sequence": EndpointLink(
+        "self_iiif_sequence": RDMEndpointLink(
             "iiif.sequence", params=["uuid"], vars=vars_self_iiif
         ),
         # Files
-        "files": ConditionalLink(
+        "files": RDMConditionalLink(
             cond=is_record,
-            if_=RecordEndpointLink("record_files.search"),
-            else_=RecordEndpointLink("draft_files.search"),
+            if_=RDMRecordEndpointLink("record_files.search"),
+            else_=RDMRecordEndpointLink("draft_files.search"),
         ),
-        "media_files": ConditionalLink(
+        "media_files": RDMConditionalLink(
             cond=is_record,
-            if_=RecordEndpointLink("record_media_files.search"),
-            else_=RecordEndpointLink("draft_media_files.search"),
+            if_=RDMRecordEndpointLink("record_media_files.search"),
+            else_=RDMRecordEndpointLink("draft_media_files.search"),
         ),
         "thumbnails": ThumbnailLinks(
             sizes=LocalProxy(record_thumbnail_sizes),
             when=has_image_files,
         ),
-        "archive": ConditionalLink(
+        "archive": RDMConditionalLink(
             cond=is_record,
-            if_=RecordEndpointLink(
+            if_=RDMRecordEndpointLink(
                 "record_files.read_archive",
                 when=archive_download_enabled,
             ),
-            else_=RecordEndpointLink(
+            else_=RDMRecordEndpointLink(
                 "draft_files.read_archive",
                 when=archive_download_enabled,
             ),
         ),
-        "archive_media": ConditionalLink(
+        "archive_media": RDMConditionalLink(
             cond=is_record,
-            if_=RecordEndpointLink(
+            if_=RDMRecordEndpointLink(
                 "record_media_files.read_archive",
                 when=archive_download_enabled,
             ),
-            else_=RecordEndpointLink(
+            else_=RDMRecordEndpointLink(
                 "draft_media_files.read_archive",
                 when=archive_download_enabled,
             ),
         ),
         # Versioning
-        "latest": RecordEndpointLink("records.read_latest", when=is_record),
-        "latest_html": RecordEndpointLink(
+        "latest": RDMRecordEndpointLink("records.read_latest", when=is_record),
+        "latest_html": RDMRecordEndpointLink(
             "invenio_app_rdm_records.record_latest",
             when=is_record,
         ),
-        "versions": RecordEndpointLink("records.search_versions"),
+        "versions": RDMRecordEndpointLink("records.search_versions"),
         # Corresponding Draft/Record
-        "draft": RecordEndpointLink("records.read_draft", when=is_record),
-        "record": RecordEndpointLink("records.read", when=is_draft),
+        "draft": RDMRecordEndpointLink("records.read_draft", when=is_record),
+        "record": RDMRecordEndpointLink("records.read", when=is_draft),
         # TODO: record_html temporarily needed for DOI registration, until
         # problems with self_doi has been fixed
-        "record_html": RecordEndpointLink(
+        "record_html": RDMRecordEndpointLink(
             "invenio_app_rdm_records.record_detail", when=is_draft
         ),
         # Actions
-        "publish": RecordEndpointLink("records.publish", when=is_draft),
-        "review": RecordEndpointLink("records.review_read", when=is_draft),
-        "submit-review": RecordEndpointLink(
+        "publish": RDMRecordEndpointLink("records.publish", when=is_draft),
+        "review": RDMRecordEndpointLink("records.review_read", when=is_draft),
+        "submit-review": RDMRecordEndpointLink(
             "records.review_submit",
             when=is_draft_and_has_review,
         ),
         # Access
-        "access_links": RecordEndpointLink("record_links.search"),
-        "access_grants": RecordEndpointLink("record_grants.search"),
-        "access_users": RecordEndpointLink("record_user_access.search"),
-        "access_groups": RecordEndpointLink(
+        "access_links": RDMRecordEndpointLink("record_links.search"),
+        "access_grants": RDMRecordEndpointLink("record_grants.search"),
+        "access_users": RDMRecordEndpointLink("record_user_access.search"),
+        "access_groups": RDMRecordEndpointLink(
             "record_group_access.search",
             when=_groups_enabled,
         ),
-        "access_request": RecordEndpointLink("records.create_access_request"),
-        "access": RecordEndpointLink("records.update_access_settings"),
+        "access_request": RDMRecordEndpointLink("records.create_access_request"),
+        "access": RDMRecordEndpointLink("records.update_access_settings"),
         # Communities
-        "communities": RecordEndpointLink("record_communities.search"),
-        "communities-suggestions": RecordEndpointLink(  # TODO This is very bad? why hyphen?
+        "communities": RDMRecordEndpointLink("record_communities.search"),
+        "communities-suggestions": RDMRecordEndpointLink(  # TODO This is very bad? why hyphen?
             "record_communities.get_suggestions"
         ),
-        "request_deletion": RecordEndpointLink(
+        "request_deletion": RDMRecordEndpointLink(
             "records.request_deletion", when=is_published
         ),
-        "file_modification": RecordEndpointLink(
+        "file_modification": RDMRecordEndpointLink(
             "records.file_modification", when=is_published
         ),
-        "quota_increase": RecordEndpointLink("records.quota_increase"),
+        "quota_increase": RDMRecordEndpointLink("records.quota_increase"),
         # Requests
         # Unfortunately `record_pid`` was used in `RDMRecordRequestsResourceConfig``
         # instead of `pid_value`, so we have to pass a bespoke vars func
-        "requests": EndpointLink(
+        "requests": RDMEndpointLink(
             "record_requests.search",
             params=["record_pid"],
             vars=lambda record, vars: (
@@ -854,6 +869,9 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
         ),
     }
 
+    # Links expanded for the hits of a search with ``links=minimal``
+    links_item_minimal = ["self", "self_html", "thumbnails"]
+
     nested_links_item = [
         NestedLinks(
             links=RDMFileRecordServiceConfig.file_links_item,
@@ -216,3 +216,7 @@ class CannotRemoveCommunityError(Exception):
     """Error thrown when the last community is being removed from the record."""
 
     description = _("A record should be part of at least 1 community.")
+
+
+class ZipballTransferError(RDMRecordsException):
+    """Error thrown when the zipball of a release could not be transferred."""
@@ -12,7 +12,9 @@ from invenio_rdm_records.auditlog.actions import (
     FileCreateAuditLog,
     FileDeleteAuditLog,
 )
+from invenio_rdm_records.proxies import current_rdm_records_storage_service
 from invenio_rdm_records.services.errors import RecordDeletedException
+from invenio_rdm_records.services.storage.service import StorageUsageOp
 
 
 class RDMFileService(FileService):
@@ -44,6 +46,9 @@ class RDMFileService(FileService):
         uow.register(
             AuditLogOp(FileCreateAuditLog.build(identity, id_, file_key=file_key))
         )  # Added here as audit logs can't be added to invenio-records-resources
+        uow.register(
+            StorageUsageOp(current_rdm_records_storage_service, result._record.parent)
+        )
         return result
 
     @unit_of_work()
@@ -54,4 +59,7 @@ class RDMFileService(FileService):
         uow.register(
             AuditLogOp(FileDeleteAuditLog.build(identity, id_, file_key=file_key))
         )  # Added here as audit logs can't be added to invenio-records-resources
+        uow.register(
+            StorageUsageOp(current_rdm_records_storage_service, result._record.parent)
+        )
         return result
@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""IIIF image derivatives cache."""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Union
+
+from flask import current_app
+
+
+class DerivativesCache:
+    """Base class for IIIF image derivatives caches.
+
+    A derivative is the result of applying the IIIF Image API parameters (region,
+    size, rotation, quality and format) to a source file. As the result only
+    depends on the content of the source file and the parameters, derivatives
+    are cached by the checksum of the file and the parameters.
+    """
+
+    @staticmethod
+    def make_key(checksum, region, size, rotation, quality, image_format):
+        """Build the cache key of a derivative."""
+        value = "/".join((checksum, region, size, rotation, quality, image_format))
+        return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Get a cached derivative.
+
+        :returns: a binary file-like object, or ``None`` if it is not cached.
+        """
+        return None
+
+    def set(self, key, data):
+        """Cache a derivative.
+
+        :param data: the content of the derivative, as bytes.
+        """
+        pass
+
+    def delete(self, key):
+        """Delete a cached derivative."""
+        pass
+
+    def clear(self):
+        """Delete all the cached derivatives."""
+        pass
+
+
+class LocalDerivativesCache(DerivativesCache):
+    """Derivatives cache on the local filesystem, with LRU eviction.
+
+    Each derivative is stored in its own file. Reading a derivative updates its
+    access time, and when the cache grows beyond its maximum size, the least
+    recently accessed derivatives are deleted until the cache fits again (with
+    some headroom, to avoid evicting on every write).
+
+    The size of the cache is tracked per process, and recomputed from the files
+    on each eviction, so the maximum size is only approximately respected when
+    several processes write to the same directory.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_path: Union[str, None] = None,
+        max_size: Union[int, None] = None,
+        low_watermark: float = 0.9,
+    ):
+        """Constructor.
+
+        :param base_path: directory of the cache, defaults to
+            ``IIIF_DERIVATIVES_CACHE_BASE_PATH``.
+        :param max_size: maximum size of the cache in bytes, defaults to
+            ``IIIF_DERIVATIVES_CACHE_MAX_SIZE``.
+        :param low_watermark: fraction of the maximum size to shrink the cache
+            to, when evicting.
+        """
+        self._base_path = base_path
+        self._max_size = max_size
+        self.low_watermark = low_watermark
+        self._size = None
+        self._lock = threading.Lock()
+
+    @property
+    def base_path(self):
+        """Return base path from object/config."""
+        path = Path(
+            self._base_path
+            or current_app.config.get("IIIF_DERIVATIVES_CACHE_BASE_PATH")
+        )
+        if path.is_absolute():
+            return path
+        # If relative path, resolve against instance path
+        return Path(current_app.instance_path) / path
+
+    @property
+    def max_size(self):
+        """Return maximum size from object/config."""
+        return self._max_size or current_app.config.get(
+            "IIIF_DERIVATIVES_CACHE_MAX_SIZE"
+        )
+
+    def _get_file_path(self, key):
+        """Get file path, partitioned by the first characters of the key."""
+        return self.base_path / key[:2] / key[2:]
+
+    def _iter_files(self):
+        """Iterate over the cached files, as ``(path, stat)`` tuples."""
+        if not self.base_path.exists():
+            return
+        for directory in self.base_path.iterdir():
+            if not directory.is_dir():
+                continue
+            for entry in os.scandir(directory):
+                # skip the temporary files being written
+                if entry.is_file() and not entry.name.startswith("."):
+                    yield Path(entry.path), entry.stat()
+
+    def get(self, key):
+        """Get a cached derivative, marking it as recently used."""
+        path = self._get_file_path(key)
+        try:
+            fp = path.open("rb")
+        except FileNotFoundError:
+            return None
+
+        try:
+            # only touch the access time, as the eviction is based on it
+            os.utime(path, (time.time(), os.fstat(fp.fileno()).st_mtime))
+        except OSError:
+            pass
+        return fp
+
+    def set(self, key, data):
+        """Cache a derivative, evicting the least recently used ones if needed."""
+        path = self._get_file_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file first, so that concurrent readers never see
+        # a partially written derivative
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".")
+        try:
+            with os.fdopen(fd, "wb") as fout:
+                fout.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(stat.st_size for _, stat in self._iter_files())
+            else:
+                self._size += len(data)
+            if self._size > self.max_size:
+                self._evict()
+
+    def _evict(self):
+        """Delete the least recently used derivatives until the cache fits."""
+        files = sorted(self._iter_files(), key=lambda item: item[1].st_atime)
+        size = sum(stat.st_size for _, stat in files)
+        target = self.max_size * self.low_watermark
+
+        for path, stat in files:
+            if size <= target:
+                break
+            path.unlink(missing_ok=True)
+            size -= stat.st_size
+        self._size = size
+
+    def delete(self, key):
+        """Delete a cached derivative."""
+        self._get_file_path(key).unlink(missing_ok=True)
+
+    def clear(self):
+        """Delete all the cached derivatives."""
+        with self._lock:
+            for path, _ in self._iter_files():
+                path.unlink(missing_ok=True)
+            self._size = 0
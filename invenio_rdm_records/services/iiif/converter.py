@@ -3,7 +3,21 @@
 
 """IIIF Tiles converter."""
 
+import importlib.metadata as metadata
+import math
+
 from flask import current_app
+from PIL.Image import DecompressionBombError
+
+try:
+    metadata.distribution("wand")
+    from wand.image import Image
+    from wand.resource import limits
+
+    HAS_IMAGEMAGICK = True
+except (metadata.PackageNotFoundError, ImportError):
+    # ImageMagick notinstalled
+    HAS_IMAGEMAGICK = False
 
 try:
     import pyvips
@@ -16,6 +30,20 @@ except OSError:
     # Underlying library libvips not installed
     HAS_VIPS = False
 
+VIPS_FORMAT_SIZES = {
+    "uchar": 1,
+    "char": 1,
+    "ushort": 2,
+    "short": 2,
+    "uint": 4,
+    "int": 4,
+    "float": 4,
+    "complex": 8,
+    "double": 8,
+    "dpcomplex": 16,
+}
+"""Size in bytes of a band of a pixel, per libvips format."""
+
 
 class ImageConverter:
     """Base class for Image converters."""
@@ -113,3 +141,52 @@ class PyVIPSImageConverter(ImageConverter):
         except Exception:
             current_app.logger.exception("Image processing with pyvips failed")
             return False
+
+
+def rasterize_first_page(in_stream, max_memory):
+    """Rasterize the first page of a document (e.g. a PDF) to a PNG image.
+
+    With PyVIPS, the page is rendered at a lower scale if its pixels would take
+    more than ``max_memory`` bytes. ImageMagick loads the whole document in
+    memory, so documents bigger than ``max_memory`` are refused, and the pixel
+    cache of ImageMagick is limited to ``max_memory`` (spilling to disk beyond).
+
+    :returns: the PNG image as bytes, or ``None`` if no rasterizer is installed.
+    :raises DecompressionBombError: if the document exceeds the memory limit.
+    """
+    # prefer PyVIPS since it doesn't load the whole file in memory
+    if HAS_VIPS:
+        source = PyVIPSImageConverter.fp_source(in_stream)
+        # only the header is read, the page is rendered when written
+        page = pyvips.Image.new_from_source(source, "", access="sequential")
+        page_memory = (
+            page.width * page.height * page.bands * VIPS_FORMAT_SIZES[page.format]
+        )
+        if page_memory > max_memory:
+            scale = math.sqrt(max_memory / page_memory)
+            in_stream.seek(0)
+            page = pyvips.Image.thumbnail_source(
+                PyVIPSImageConverter.fp_source(in_stream),
+                max(1, int(page.width * scale)),
+                height=max(1, int(page.height * scale)),
+            )
+        return page.write_to_buffer(".png")
+
+    if HAS_IMAGEMAGICK:
+        blob = in_stream.read(max_memory + 1)
+        if len(blob) > max_memory:
+            raise DecompressionBombError(
+                f"Document size exceeds the limit of {max_memory} bytes."
+            )
+        # the limit is process-wide, restore it for the other conversions
+        previous_memory = limits["memory"]
+        limits["memory"] = max_memory
+        try:
+            with Image(blob=blob) as document:
+                with Image(image=document.sequence[0]) as page:
+                    page.format = "png"
+                    return page.make_blob()
+        finally:
+            limits["memory"] = previous_memory
+
+    return None
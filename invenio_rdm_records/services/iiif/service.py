@@ -5,31 +5,39 @@
 
 """IIIF Service."""
 
-import importlib.metadata as metadata
 import io
+from datetime import datetime, timezone
+from functools import cached_property
 
+from flask import current_app
 from flask_iiif.api import IIIFImageAPIWrapper
 from invenio_records_resources.services import Service
+from werkzeug.utils import import_string
 
-try:
-    metadata.distribution("wand")
-    from wand.image import Image
+from invenio_rdm_records.cache import TTLCache
 
-    HAS_IMAGEMAGICK = True
-except (metadata.PackageNotFoundError, ImportError):
-    # ImageMagick notinstalled
-    HAS_IMAGEMAGICK = False
+from .cache import DerivativesCache
+from .converter import HAS_IMAGEMAGICK, HAS_VIPS, rasterize_first_page
+from .tasks import first_page_key, generate_first_page
 
-try:
-    import pyvips
 
-    HAS_VIPS = True
-except ModuleNotFoundError:
-    # Python module pyvips not installed
-    HAS_VIPS = False
-except OSError:
-    # Underlying library libvips not installed
-    HAS_VIPS = False
+class IIIFImage:
+    """An IIIF image derivative, opened only when it needs to be served."""
+
+    def __init__(self, etag, last_modified, opener):
+        """Constructor.
+
+        :param etag: entity tag of the derivative.
+        :param last_modified: last modification date of the source file.
+        :param opener: function returning the derivative as a binary file-like.
+        """
+        self.etag = etag
+        self.last_modified = last_modified
+        self._opener = opener
+
+    def open(self):
+        """Get the derivative, rendering it if it is not cached."""
+        return self._opener()
 
 
 class IIIFService(Service):
@@ -42,6 +50,18 @@ class IIIFService(Service):
         """Constructor."""
         super().__init__(config)
         self._records_service = records_service
+        # first pages being stored, to avoid sending the same task many times
+        self._pending_first_pages = TTLCache(maxsize=1024, ttl=300)
+
+    @cached_property
+    def derivatives_cache(self):
+        """Cache of the image derivatives, or ``None`` if disabled."""
+        if not current_app.config.get("IIIF_DERIVATIVES_CACHE_ENABLED"):
+            return None
+        cache = current_app.config["IIIF_DERIVATIVES_CACHE_CLASS"]
+        if isinstance(cache, str):
+            cache = import_string(cache)
+        return cache() if isinstance(cache, type) else cache
 
     def _iiif_uuid(self, uuid):
         """Split the uuid content.
@@ -77,39 +97,56 @@ class IIIFService(Service):
         )
         return read(identity=identity, id_=id_)
 
+    def _get_first_page(self, file_):
+        """Open the stored first page of the file, if it is up to date."""
+        record = file_._record
+        if record.is_draft or not record.media_files.enabled:
+            return None
+
+        media_file = record.media_files.get(first_page_key(file_.file_id))
+        if media_file is None:
+            return None
+        processor = media_file.processor or {}
+        if (
+            processor.get("status") != "finished"
+            or processor.get("source_file_id") != file_.data["file_id"]
+        ):
+            return None
+        return media_file.get_stream("rb")
+
+    def _save_first_page(self, file_):
+        """Store the first page of the file (in the background) for next requests."""
+        record = file_._record
+        # drafts change often, and restricted files should not be exposed as media
+        if record.is_draft or record.access.protection.files != "public":
+            return
+
+        key = (record["id"], file_.file_id, file_.data["file_id"])
+        if key in self._pending_first_pages:
+            return
+        self._pending_first_pages.set(key, True)
+        generate_first_page.delay(record_id=record["id"], file_key=file_.file_id)
+
     def _open_image(self, file_):
-        fp = file_.get_stream("rb")
         # If the file is not a PDF or text, return the file
         if file_.data["mimetype"] not in {"application/pdf", "text/plain"}:
-            return fp
+            return file_.get_stream("rb")
 
         # If Wand (ImageMagick) or PyVIPS is installed, extract the first page
-        if HAS_VIPS:  # prefer PyVIPS since it doesn't load the whole file in memory
-
-            def _seek_handler(offset, whence):
-                fp.seek(offset, whence)
-                return fp.tell()
-
-            source = pyvips.SourceCustom()
-            source.on_read(fp.read)
-            source.on_seek(_seek_handler)
-
-            # PyVIPS returns by default the first page of the PDF
-            first_page = pyvips.Image.new_from_source(source, "", access="sequential")
-            # Convert to memory to be able to return a file-like object
-            first_page_buf = io.BytesIO(first_page.write_to_memory())
-            fp.close()
-            return first_page_buf
-        elif HAS_IMAGEMAGICK:
-            first_page = Image(blob=fp)
-            first_page_buf = io.BytesIO()
-            with first_page.convert(format="png") as converted:
-                converted.save(file=first_page_buf)
-            first_page_buf.seek(0)
-            fp.close()
-            return first_page_buf
-
-        return fp
+        if not (HAS_VIPS or HAS_IMAGEMAGICK):
+            return file_.get_stream("rb")
+
+        # The first page is rasterized only once, and stored as a media file
+        first_page = self._get_first_page(file_)
+        if first_page is not None:
+            return first_page
+
+        with file_.open_stream("rb") as fp:
+            first_page = rasterize_first_page(
+                fp, current_app.config["RDM_IIIF_RASTERIZE_MAX_MEMORY"]
+            )
+        self._save_first_page(file_)
+        return io.BytesIO(first_page)
 
     def get_file(self, identity, uuid, key=None):
         """Get the file for the given ``uuid``.
@@ -141,6 +178,11 @@ class IIIFService(Service):
     ):
         """Run the IIIF image API workflow.
 
+        The derivative is only rendered (or read from the derivatives cache) when
+        the returned image is opened, so that conditional requests can be answered
+        without touching the file content.
+
+        :returns: an :class:`IIIFImage`.
         :raises FileKeyNotFoundError: If the record has no file for the ``key``
         """
         # Validate IIIF parameters
@@ -155,8 +197,51 @@ class IIIFService(Service):
 
         type_, id_, key = self._iiif_image_uuid(uuid)
         service = self.file_service(type_)
-        # TODO: check cache before this
+        # the file is resolved first (which does not read its content), as the
+        # permissions must be checked even for cached derivatives
         file_ = service.get_file_content(id_=id_, file_key=key, identity=identity)
+        checksum = file_.data.get("checksum")
+        cache_key = DerivativesCache.make_key(
+            checksum or str(file_.data.get("file_id")),
+            region,
+            size,
+            rotation,
+            quality,
+            image_format,
+        )
+        last_modified = datetime.fromisoformat(file_.data["updated"])
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+
+        def _open():
+            # without checksum, the content of the file cannot be identified
+            cache = self.derivatives_cache if checksum else None
+            if cache is not None:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            to_serve = self._render_image(
+                file_, region, size, rotation, quality, image_format
+            )
+            if cache is not None:
+                try:
+                    cache.set(cache_key, to_serve.getvalue())
+                except Exception:
+                    current_app.logger.warning(
+                        "Failed to cache IIIF image derivative.", exc_info=True
+                    )
+            return to_serve
+
+        return IIIFImage(
+            etag=cache_key,
+            # HTTP dates have a precision of seconds
+            last_modified=last_modified.replace(microsecond=0),
+            opener=_open,
+        )
+
+    def _render_image(self, file_, region, size, rotation, quality, image_format):
+        """Render the image derivative of the file."""
         data = self._open_image(file_)
         # TODO: include image magic for pdf
         image = IIIFImageAPIWrapper.open_image(data)
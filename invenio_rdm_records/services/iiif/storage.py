@@ -3,6 +3,7 @@
 
 """IIIF Tiles generation storage."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from textwrap import wrap
 from typing import Union
@@ -113,6 +114,54 @@ class LocalTilesStorage(TilesStorage):
 
         return True
 
+    def save_many(self, record, files, max_workers=1):
+        """Convert and save many files of a record to ptif, concurrently.
+
+        The files (and their storage) are resolved upfront, so that only the
+        conversions run in the worker threads.
+
+        :param files: list of ``(filename, file_type)`` tuples.
+        :param max_workers: maximum number of concurrent conversions.
+        :returns: a dictionary with the conversion state of each filename.
+        """
+        app = current_app._get_current_object()
+        converter = self.converter
+        self._get_dir(record).mkdir(parents=True, exist_ok=True)
+
+        def _convert(filename, storage, outpath):
+            with app.app_context():
+                try:
+                    with storage.open("rb") as fin, outpath.open("w+b") as fout:
+                        conversion_state = converter.convert(fin, fout)
+                except Exception:
+                    current_app.logger.exception(
+                        "Image conversion failed.",
+                        extra={"record_id": record["id"], "filename_": filename},
+                    )
+                    conversion_state = False
+                if not conversion_state:
+                    current_app.logger.info(f"Image conversion failed {record.id}")
+                return bool(conversion_state)
+
+        states = {}
+        jobs = []
+        for filename, file_type in files:
+            file_record = getattr(record, file_type).get(filename)
+            if file_record is None:
+                states[filename] = False
+                continue
+            storage = file_record.file.file_model.storage()
+            jobs.append((filename, storage, self._get_file_path(record, filename)))
+
+        if max_workers <= 1 or len(jobs) <= 1:
+            states.update({job[0]: _convert(*job) for job in jobs})
+            return states
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {job[0]: executor.submit(_convert, *job) for job in jobs}
+            states.update({key: future.result() for key, future in futures.items()})
+        return states
+
     def open(self, record, filename):
         """Open the file in read mode."""
         return self._get_file_path(record, filename).open("rb")
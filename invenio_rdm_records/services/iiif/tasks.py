@@ -1,16 +1,26 @@
 # SPDX-FileCopyrightText: 2024 CERN.
 # SPDX-License-Identifier: MIT
 
-"""Tasks for statistics."""
+"""Tasks for IIIF tiles."""
+
+import io
 
 from celery import shared_task
+from flask import current_app
 from invenio_db import db
+from invenio_records_resources.services.uow import RecordCommitOp, UnitOfWork
 
 from invenio_rdm_records.proxies import current_rdm_records_service
 
+from .converter import rasterize_first_page
 from .storage import tiles_storage
 
 
+def first_page_key(file_key):
+    """Get the key of the media file storing the first page of a file."""
+    return f"{file_key}.first-page.png"
+
+
 @shared_task(ignore_result=True)
 def generate_tiles(record_id, file_key, file_type):
     """Generate pyramidal TIFF."""
@@ -30,6 +40,52 @@ def generate_tiles(record_id, file_key, file_type):
     db.session.commit()
 
 
+def tiles_progress(record):
+    """Count the finished (or failed) tiles of a record, and the total."""
+    done = total = 0
+    for media_file in record.media_files.values():
+        processor = media_file.processor or {}
+        if processor.get("type") != "image-tiles":
+            continue
+        total += 1
+        if processor.get("status") in ("finished", "failed"):
+            done += 1
+    return {"done": done, "total": total}
+
+
+@shared_task(ignore_result=True)
+def generate_tiles_batch(record_id, files):
+    """Generate pyramidal TIFFs for a batch of files of a record.
+
+    The files are converted concurrently (up to ``IIIF_TILES_CONVERSION_CONCURRENCY``
+    at a time), and the status of the whole batch is updated at once at the end,
+    together with the tiles generation progress of the record (see
+    :func:`tiles_progress`) at the time of this batch's commit.
+
+    :param files: list of ``(file_key, file_type)`` pairs.
+    """
+    record = current_rdm_records_service.record_cls.pid.resolve(record_id)
+    max_workers = current_app.config.get("IIIF_TILES_CONVERSION_CONCURRENCY", 1)
+    states = tiles_storage.save_many(record, files, max_workers=max_workers)
+
+    status_files = []
+    for file_key, conversion_state in states.items():
+        status_file = record.media_files.get(file_key + ".ptif")
+        if status_file is None:
+            continue
+        status_file.processor["status"] = "finished" if conversion_state else "failed"
+        status_file.file.file_model.uri = str(
+            tiles_storage._get_file_path(record, file_key)
+        )
+        status_files.append(status_file)
+
+    progress = tiles_progress(record)
+    for status_file in status_files:
+        status_file.processor["progress"] = progress
+        status_file.commit()
+    db.session.commit()
+
+
 @shared_task(
     ignore_result=True,
     max_retries=4,
@@ -54,3 +110,60 @@ def cleanup_tiles_file(record_id, tile_file_key, retry=True):
             cleanup_tiles_file.retry(exc=exc)
         else:
             raise exc
+
+
+@shared_task(ignore_result=True)
+def generate_first_page(record_id, file_key):
+    """Rasterize the first page of a file, and store it as a media file.
+
+    The media file is hidden, and its processor keeps track of the source file,
+    so that it's regenerated if the file changes.
+    """
+    record = current_rdm_records_service.record_cls.pid.resolve(record_id)
+    file_record = record.files.get(file_key)
+    if file_record is None:
+        return
+
+    key = first_page_key(file_key)
+    source_file_id = str(file_record.file.file_id)
+    media_file = record.media_files.get(key) if record.media_files.enabled else None
+    if media_file is not None:
+        processor = media_file.processor or {}
+        if (
+            processor.get("status") == "finished"
+            and processor.get("source_file_id") == source_file_id
+        ):
+            return
+
+    with file_record.open_stream("rb") as fp:
+        data = rasterize_first_page(
+            fp, current_app.config["RDM_IIIF_RASTERIZE_MAX_MEMORY"]
+        )
+    if data is None:
+        return
+
+    with UnitOfWork() as uow:
+        # Enable media files always since we need it for state management
+        record.media_files.enabled = True
+        if not record.media_files.bucket:
+            record.media_files.create_bucket()
+
+        record.media_files.unlock()
+        if media_file is None:
+            media_file = record.media_files.create(key, stream=io.BytesIO(data))
+        else:
+            media_file = record.media_files.update(key, stream=io.BytesIO(data))
+        record.media_files.lock()
+
+        media_file.processor = {
+            "type": "first-page",
+            "status": "finished",
+            "source_file_id": source_file_id,
+            "props": {},
+        }
+        media_file.access.hidden = True
+        media_file.commit()
+        uow.register(
+            RecordCommitOp(record, indexer=current_rdm_records_service.indexer)
+        )
+        uow.commit()
@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Precompiled links of the records.
+
+Building a URL with ``invenio_url_for`` matches the endpoint's rule and quotes
+every value, which adds up when expanding dozens of links for each hit of a
+search page. Instead, the URL of an endpoint is built once per application with
+placeholder values, and the links are expanded by substituting the (quoted)
+values in that template.
+"""
+
+from urllib.parse import quote
+
+from flask import current_app
+from invenio_base import invenio_url_for
+from invenio_records_resources.services import (
+    ConditionalLink,
+    EndpointLink,
+    LinksTemplate,
+    RecordEndpointLink,
+)
+
+SHARED_PREDICATES_KEY = "shared_predicates"
+"""Key of the shared predicates in the links context."""
+
+_PROBE = "a b/c:d@e%f?g#hé"
+"""Value checking that the template quotes the values like the URL map does."""
+
+
+def _quote(value):
+    """Quote a value like the default URL converter does."""
+    return quote(str(value), safe="!$&'()*+,/:;=@")
+
+
+def _placeholder(index):
+    """Placeholder of a value, kept as is by the URL quoting."""
+    return f"LINKVAR{index}X"
+
+
+def compile_endpoint(endpoint, keys):
+    """Compile the URL template of an endpoint, for the given value keys.
+
+    Returns ``None`` if the URL cannot be built by substitution, e.g. when a
+    value is converted (``<int:...>``) or quoted differently (``<path:...>`` or
+    in the query string).
+    """
+    try:
+        template = invenio_url_for(
+            endpoint, **{key: _placeholder(i) for i, key in enumerate(keys)}
+        )
+        probe = invenio_url_for(
+            endpoint, **{key: f"{_PROBE}{i}" for i, key in enumerate(keys)}
+        )
+    except Exception:
+        return None
+
+    placeholders = [(_placeholder(i), key) for i, key in enumerate(keys)]
+    expected = template
+    for placeholder, key in placeholders:
+        if template.count(placeholder) != 1:
+            return None
+        expected = expected.replace(placeholder, _quote(f"{_PROBE}{keys.index(key)}"))
+    if expected != probe:
+        return None
+    return template, placeholders
+
+
+def build_url(endpoint, values, anchor=None):
+    """Build the URL of an endpoint, from its compiled template if possible."""
+    compiled = None
+    if (
+        anchor is None
+        and current_app.config.get("RDM_LINKS_COMPILED", True)
+        and all(isinstance(v, (str, int)) for v in values.values())
+    ):
+        templates = current_app.extensions["invenio-rdm-records"].link_templates
+        cache_key = (endpoint, tuple(values))
+        if cache_key not in templates:
+            templates[cache_key] = compile_endpoint(endpoint, list(values))
+        compiled = templates[cache_key]
+
+    if compiled is None:
+        return invenio_url_for(endpoint, _anchor=anchor, **values)
+
+    url, placeholders = compiled
+    for placeholder, key in placeholders:
+        url = url.replace(placeholder, _quote(values[key]))
+    return url
+
+
+class SharedPredicates:
+    """Results of the link predicates, shared by the links of an expansion.
+
+    Many links are rendered depending on the same predicates (e.g. whether the
+    object is a published record), which are then computed only once.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self._results = {}
+
+    def __call__(self, func, obj, ctx):
+        """Get the result of the predicate for the object."""
+        key = (func, id(obj))
+        if key not in self._results:
+            self._results[key] = func(obj, ctx)
+        return self._results[key]
+
+
+def evaluate(func, obj, ctx):
+    """Evaluate a link predicate, sharing its result if possible."""
+    shared = ctx.get(SHARED_PREDICATES_KEY)
+    if shared is None:
+        return func(obj, ctx)
+    return shared(func, obj, ctx)
+
+
+class SharedPredicateMixin:
+    """Link whose ``when`` predicate result is shared."""
+
+    def should_render(self, obj, ctx):
+        """Determine if the link should be rendered."""
+        if self._when_func:
+            return bool(evaluate(self._when_func, obj, ctx))
+        return True
+
+
+class CompiledEndpointLinkMixin(SharedPredicateMixin):
+    """Endpoint link expanded from its compiled URL template."""
+
+    def expand(self, obj, context):
+        """Expand the endpoint."""
+        # same values as ``EndpointLink.expand``
+        vars = context.copy()
+        if context.get("args"):
+            vars["args"] = context["args"].copy()
+
+        self.vars(obj, vars)
+        if self._vars_func:
+            self._vars_func(obj, vars)
+
+        values = {k: v for k, v in vars.items() if k in self._params}
+        values.update(vars.get("args", {}))
+        values = dict(sorted(values.items()))
+        return build_url(self._endpoint, values, anchor=self._anchor_func(obj, vars))
+
+
+class RDMEndpointLink(CompiledEndpointLinkMixin, EndpointLink):
+    """Endpoint link expanded from its compiled URL template."""
+
+
+class RDMRecordEndpointLink(CompiledEndpointLinkMixin, RecordEndpointLink):
+    """Record endpoint link expanded from its compiled URL template."""
+
+
+class RDMConditionalLink(ConditionalLink):
+    """Conditional link whose condition result is shared."""
+
+    def should_render(self, obj, ctx):
+        """Determine if the link should be rendered."""
+        if evaluate(self._condition, obj, ctx):
+            return self._if_link.should_render(obj, ctx)
+        else:
+            return self._else_link.should_render(obj, ctx)
+
+    def expand(self, obj, ctx):
+        """Expand the link of the condition result."""
+        if evaluate(self._condition, obj, ctx):
+            return self._if_link.expand(obj, ctx)
+        else:
+            return self._else_link.expand(obj, ctx)
+
+
+class RDMLinksTemplate(LinksTemplate):
+    """Links template sharing the predicates results between its links.
+
+    Only a subset of the links can be expanded, with the ``keys`` argument.
+    """
+
+    def __init__(self, links=None, context=None):
+        """Constructor."""
+        super().__init__(links=links, context=context)
+        self._base_context = None
+
+    def expand(self, identity, obj, keys=None):
+        """Expand the link templates (of the given keys, if any)."""
+        # the context is the same for all the hits of a result list
+        if self._base_context is None:
+            self._base_context = self.context
+        links = {}
+        ctx = self._base_context.copy()
+        ctx["identity"] = identity
+        ctx[SHARED_PREDICATES_KEY] = SharedPredicates()
+        for key, link in self._links.items():
+            if keys is not None and key not in keys:
+                continue
+            if link.should_render(obj, ctx):
+                links[key] = link.expand(obj, ctx)
+        return links
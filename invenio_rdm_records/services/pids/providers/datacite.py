@@ -6,26 +6,98 @@
 """DataCite DOI Provider."""
 
 import json
+import ssl
+import threading
 import warnings
 from collections import ChainMap
+from contextlib import contextmanager
+from contextvars import ContextVar
 from json import JSONDecodeError
 
+import requests
 from datacite import DataCiteRESTClient
 from datacite.errors import (
     DataCiteError,
     DataCiteNoContentError,
     DataCiteNotFoundError,
     DataCiteServerError,
+    HttpError,
 )
+from datacite.request import DataCiteRequest
 from flask import current_app
 from invenio_i18n import lazy_gettext as _
 from invenio_pidstore.models import PIDStatus
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from requests.exceptions import RequestException
 
 from ....resources.serializers import DataCite45JSONSerializer
 from ....utils import ChainObject
 from .base import PIDProvider
 
 
+class PooledDataCiteRequest(DataCiteRequest):
+    """DataCite request sent through a shared HTTP session."""
+
+    def __init__(self, session, **kwargs):
+        """Constructor."""
+        super().__init__(**kwargs)
+        self.session = session
+
+    def request(self, url, method="GET", body=None, params=None, headers=None):
+        """Make a request, reusing the connections of the session."""
+        params = dict(params or {}, **self.default_params)
+        if self.base_url:
+            url = self.base_url + url
+        if body and isinstance(body, str):
+            body = body.encode("utf-8")
+
+        kwargs = dict(
+            auth=HTTPBasicAuth(self.username, self.password),
+            params=params,
+            headers=headers or {},
+        )
+        if method in ("POST", "PUT"):
+            kwargs["data"] = body
+        if self.timeout is not None:
+            kwargs["timeout"] = self.timeout
+
+        try:
+            return self.session.request(method, url, **kwargs)
+        except (RequestException, ssl.SSLError) as e:
+            raise HttpError(e)
+
+
+class PooledDataCiteRESTClient(DataCiteRESTClient):
+    """DataCite REST API client keeping a pool of HTTP connections.
+
+    The upstream client opens a new connection for each request. This client
+    shares the connections (and their TLS sessions) between the requests, and
+    can be used from several threads.
+    """
+
+    def __init__(self, *args, pool_size=10, **kwargs):
+        """Constructor.
+
+        :param pool_size: maximum number of connections kept open.
+        """
+        super().__init__(*args, **kwargs)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _create_request(self):
+        """Create a new Request object, using the shared session."""
+        return PooledDataCiteRequest(
+            self.session,
+            base_url=self.api_url,
+            username=self.username,
+            password=self.password,
+            timeout=self.timeout,
+        )
+
+
 class DataCiteClient:
     """DataCite Client."""
 
@@ -35,6 +107,8 @@ class DataCiteClient:
         self._config_prefix = config_prefix or "DATACITE"
         self._config_overrides = config_overrides or {}
         self._api = None
+        self._pooled_api = None
+        self._pooled_api_lock = threading.Lock()
 
     def cfgkey(self, key):
         """Generate a configuration key."""
@@ -104,6 +178,32 @@ class DataCiteClient:
             )
         return self._api
 
+    @property
+    def pooled_api(self):
+        """DataCite REST API client instance, keeping its connections open.
+
+        Used to send many requests, possibly concurrently. The size of its
+        connection pool is configured with the ``POOL_SIZE`` config key (e.g.
+        ``DATACITE_POOL_SIZE``). It reads the application config, so it must
+        be first accessed within an application context.
+        """
+        with self._pooled_api_lock:
+            if self._pooled_api is None:
+                self.check_credentials()
+                self._pooled_api = PooledDataCiteRESTClient(
+                    self.cfg("username"),
+                    self.cfg("password"),
+                    self.cfg("prefix"),
+                    self.cfg("test_mode", True),
+                    url=self.cfg("url"),
+                    pool_size=self.cfg("pool_size", 10),
+                )
+        return self._pooled_api
+
+
+_deferred_requests = ContextVar("datacite_deferred_requests", default=None)
+"""Requests to DataCite deferred by the hide/show of the DOIs, if any."""
+
 
 class DataCitePIDProvider(PIDProvider):
     """DataCite Provider class.
@@ -113,6 +213,23 @@ class DataCitePIDProvider(PIDProvider):
     only at PIDStore level.
     """
 
+    @staticmethod
+    @contextmanager
+    def deferred_requests():
+        """Defer the hide/show requests of the registered DOIs.
+
+        Within the context, deleting or restoring a registered DOI only
+        updates it locally, and its request to DataCite is appended to the
+        yielded list, as ``(provider, pid, method, kwargs)`` tuples, to be
+        sent later on (e.g. after the transaction commit).
+        """
+        requests = []
+        token = _deferred_requests.set(requests)
+        try:
+            yield requests
+        finally:
+            _deferred_requests.reset(token)
+
     def __init__(
         self,
         id_,
@@ -172,6 +289,57 @@ class DataCitePIDProvider(PIDProvider):
         """Checks if the PID can be modified."""
         return not pid.is_registered() and not pid.is_reserved()
 
+    @staticmethod
+    def _is_restricted(record):
+        """Check if the record (or the latest version of the parent) is restricted."""
+        if isinstance(record, ChainObject):
+            return record._child["access"]["record"] == "restricted"
+        return record["access"]["record"] == "restricted"
+
+    def log_error(self, pid, action, exception):
+        """Log an error from DataCite, for the given action (e.g. "updating")."""
+        current_app.logger.warning(
+            f"DataCite provider error when {action} DOI for {pid.pid_value}"
+        )
+        self._log_errors(exception)
+
+    def prepare_register(self, pid, record, url=None):
+        """Register a DOI locally, and prepare its registration on DataCite.
+
+        :returns: a ``(method, kwargs)`` tuple, describing the call to the
+            DataCite REST API client, or ``None`` if the DOI can't be registered.
+        """
+        if self._is_restricted(record):
+            return None
+
+        local_success = super().register(pid)
+        if not local_success:
+            return None
+
+        doc = self.serializer.dump_obj(record)
+        return "public_doi", dict(metadata=doc, url=url, doi=pid.pid_value)
+
+    def prepare_update(self, pid, record, url=None):
+        """Prepare the update of a DOI on DataCite.
+
+        :returns: a ``(method, kwargs)`` tuple, describing the call to the
+            DataCite REST API client.
+        """
+        if self._is_restricted(record):
+            return "hide_doi", dict(doi=pid.pid_value)
+
+        doc = self.serializer.dump_obj(record)
+        doc["event"] = (
+            "publish"  # Required for DataCite to make the DOI findable in the case it was hidden before. See https://support.datacite.org/docs/how-do-i-make-a-findable-doi-with-the-rest-api
+        )
+        return "update_doi", dict(metadata=doc, doi=pid.pid_value, url=url)
+
+    def finish_update(self, pid):
+        """Update the local status of a DOI, once updated on DataCite."""
+        if pid.is_deleted():
+            return pid.sync_status(PIDStatus.REGISTERED)
+        return True
+
     def register(self, pid, record, **kwargs):
         """Register a DOI via the DataCite API.
 
@@ -179,27 +347,16 @@ class DataCitePIDProvider(PIDProvider):
         :param record: the record metadata for the DOI.
         :returns: `True` if is registered successfully.
         """
-        if isinstance(record, ChainObject):
-            if record._child["access"]["record"] == "restricted":
-                return False
-        elif record["access"]["record"] == "restricted":
-            return False
-
-        local_success = super().register(pid)
-        if not local_success:
+        request = self.prepare_register(pid, record, url=kwargs["url"])
+        if request is None:
             return False
 
+        method, api_kwargs = request
         try:
-            doc = self.serializer.dump_obj(record)
-            url = kwargs["url"]
-            self.client.api.public_doi(metadata=doc, url=url, doi=pid.pid_value)
+            getattr(self.client.api, method)(**api_kwargs)
             return True
         except DataCiteError as e:
-            current_app.logger.warning(
-                f"DataCite provider error when registering DOI for {pid.pid_value}"
-            )
-            self._log_errors(e)
-
+            self.log_error(pid, "registering", e)
             return False
 
     def update(self, pid, record, url=None, **kwargs):
@@ -210,37 +367,21 @@ class DataCitePIDProvider(PIDProvider):
         :param record: the record metadata for the DOI.
         :returns: `True` if is updated successfully.
         """
-        hide = False
-        if isinstance(record, ChainObject):
-            if record._child["access"]["record"] == "restricted":
-                hide = True
-        elif record["access"]["record"] == "restricted":
-            hide = True
-
+        method, api_kwargs = self.prepare_update(pid, record, url=url)
         try:
-            if hide:
-                self.client.api.hide_doi(doi=pid.pid_value)
-            else:
-                doc = self.serializer.dump_obj(record)
-                doc["event"] = (
-                    "publish"  # Required for DataCite to make the DOI findable in the case it was hidden before. See https://support.datacite.org/docs/how-do-i-make-a-findable-doi-with-the-rest-api
-                )
-                self.client.api.update_doi(metadata=doc, doi=pid.pid_value, url=url)
+            getattr(self.client.api, method)(**api_kwargs)
         except DataCiteError as e:
-            current_app.logger.warning(
-                f"DataCite provider error when updating DOI for {pid.pid_value}"
-            )
-            self._log_errors(e)
-
+            self.log_error(pid, "updating", e)
             return False
 
-        if pid.is_deleted():
-            return pid.sync_status(PIDStatus.REGISTERED)
-
-        return True
+        return self.finish_update(pid)
 
     def restore(self, pid, **kwargs):
         """Restore previously deactivated DOI."""
+        deferred = _deferred_requests.get()
+        if deferred is not None:
+            deferred.append((self, pid, "show_doi", dict(doi=pid.pid_value)))
+            return
         try:
             self.client.api.show_doi(pid.pid_value)
         except DataCiteNotFoundError as e:
@@ -254,6 +395,10 @@ class DataCitePIDProvider(PIDProvider):
         Otherwise, also it's deleted also remotely.
         :returns: `True` if is deleted successfully.
         """
+        deferred = _deferred_requests.get()
+        if deferred is not None and pid.is_registered():
+            deferred.append((self, pid, "hide_doi", dict(doi=pid.pid_value)))
+            return super().delete(pid, **kwargs)
         try:
             if pid.is_reserved():  # Delete only works for draft DOIs
                 self.client.api.delete_doi(pid.pid_value)
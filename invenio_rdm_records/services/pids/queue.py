@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Coalescing queue of the PIDs to sync with the remote providers."""
+
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from celery import current_app as current_celery_app
+from flask import current_app
+from invenio_access.permissions import system_identity
+from kombu import Producer
+from kombu.compat import Consumer
+
+
+class RateLimiter:
+    """Thread-safe limiter of the number of calls per second.
+
+    The calls are evenly spaced: each call waits until ``1 / rate`` seconds have
+    passed since the previous one.
+    """
+
+    def __init__(self, rate=None, clock=time.monotonic, sleep=time.sleep):
+        """Constructor.
+
+        :param rate: maximum number of calls per second, unlimited if ``None``.
+        """
+        self.interval = 1.0 / rate if rate else 0
+        self._clock = clock
+        self._sleep = sleep
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Wait until the next call is allowed."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = self._clock()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            self._sleep(wait)
+
+
+def send_requests(requests, concurrency=1, rate_limit=None):
+    """Send requests to the remote providers, concurrently and rate limited.
+
+    :param requests: list of ``(provider, method, kwargs)`` tuples, calling
+        ``method`` of the pooled API client of the provider.
+    :param concurrency: maximum number of concurrent requests.
+    :param rate_limit: maximum number of requests per second.
+    :returns: the exception raised by each request, or ``None`` on success.
+    """
+    limiter = RateLimiter(rate_limit)
+
+    def send(call, kwargs):
+        limiter.acquire()
+        return call(**kwargs)
+
+    # the API clients are built from the application config, which is not
+    # available in the worker threads (they have no application context)
+    apis = {}
+    calls = []
+    for provider, method, kwargs in requests:
+        if id(provider) not in apis:
+            apis[id(provider)] = provider.client.pooled_api
+        calls.append((getattr(apis[id(provider)], method), kwargs))
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        futures = [executor.submit(send, call, kwargs) for call, kwargs in calls]
+    return [future.exception() for future in futures]
+
+
+class PIDSyncQueue:
+    """Queue of the PIDs to register or update on the remote providers.
+
+    Instead of sending a task per PID, the PIDs are published to a message queue,
+    like the bulk indexing queue of invenio-indexer. The queue is consumed in
+    batches of ``RDM_PIDS_SYNC_BATCH_SIZE`` messages, in which the pending
+    updates of the same PID are synced only once.
+
+    If a batch cannot be synced, its messages are requeued and the run stops.
+
+    The counters of the published, coalesced, dispatched, succeeded, failed,
+    skipped and requeued syncs of the current process are available with
+    :meth:`stats`.
+    """
+
+    def __init__(self, service, exchange=None, queue=None, routing_key=None):
+        """Constructor.
+
+        :param service: the PIDs service, syncing the PIDs.
+        """
+        self.service = service
+        self._exchange = exchange
+        self._queue = queue
+        self._routing_key = routing_key
+        self._counters = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def mq_exchange(self):
+        """Message queue exchange."""
+        return self._exchange or current_app.config["RDM_PIDS_SYNC_MQ_EXCHANGE"]
+
+    @property
+    def mq_queue(self):
+        """Message queue queue."""
+        return self._queue or current_app.config["RDM_PIDS_SYNC_MQ_QUEUE"]
+
+    @property
+    def mq_routing_key(self):
+        """Message queue routing key."""
+        return self._routing_key or current_app.config["RDM_PIDS_SYNC_MQ_ROUTING_KEY"]
+
+    def _count(self, stats):
+        """Add to the counters."""
+        with self._lock:
+            self._counters.update(stats)
+
+    def stats(self):
+        """Get the counters of the syncs of the current process."""
+        with self._lock:
+            return dict(self._counters)
+
+    def publish(self, entries):
+        """Queue PIDs to sync.
+
+        :param entries: list of ``(id_, scheme, parent)`` tuples.
+        """
+        published = 0
+        with current_celery_app.pool.acquire(block=True) as conn:
+            producer = Producer(
+                conn,
+                exchange=self.mq_exchange,
+                routing_key=self.mq_routing_key,
+                auto_declare=True,
+            )
+            for id_, scheme, parent in entries:
+                producer.publish(
+                    {"id": id_, "scheme": scheme, "parent": parent},
+                    declare=[self.mq_queue],
+                )
+                published += 1
+        self._count({"published": published})
+
+    def process(self, max_batches=None):
+        """Sync the queued PIDs, batch by batch, until the queue is empty.
+
+        :param max_batches: maximum number of batches to process.
+        :returns: the counters of this run.
+        """
+        config = current_app.config
+        batch_size = config["RDM_PIDS_SYNC_BATCH_SIZE"]
+        run_stats = Counter()
+        batches = 0
+
+        with current_celery_app.pool.acquire(block=True) as conn:
+            consumer = Consumer(
+                connection=conn,
+                queue=self.mq_queue.name,
+                exchange=self.mq_exchange.name,
+                routing_key=self.mq_routing_key,
+            )
+            while max_batches is None or batches < max_batches:
+                messages = list(consumer.iterqueue(limit=batch_size))
+                if not messages:
+                    break
+                batches += 1
+
+                entries = []
+                for message in messages:
+                    payload = message.decode()
+                    entries.append(
+                        (payload["id"], payload["scheme"], payload.get("parent", False))
+                    )
+
+                try:
+                    stats = self.service.register_or_update_many(
+                        system_identity,
+                        entries,
+                        concurrency=config["RDM_PIDS_SYNC_CONCURRENCY"],
+                        rate_limit=config["RDM_PIDS_SYNC_RATE_LIMIT"],
+                    )
+                except Exception:
+                    # the batch is retried by the next run, instead of being
+                    # consumed again (and failing) in a loop by this one
+                    current_app.logger.exception("Failed to sync a batch of PIDs.")
+                    for message in messages:
+                        message.requeue()
+                    stats = {"requeued": len(messages)}
+                    run_stats.update(stats)
+                    self._count(stats)
+                    break
+
+                for message in messages:
+                    message.ack()
+                run_stats.update(stats)
+                self._count(stats)
+
+            consumer.close()
+
+        return dict(run_stats)
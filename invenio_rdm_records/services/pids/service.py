@@ -3,6 +3,10 @@
 
 """RDM PIDs Service."""
 
+from collections import Counter
+
+from datacite.errors import DataCiteError
+from flask import current_app
 from invenio_drafts_resources.services.records import RecordService
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_pidstore.models import PersistentIdentifier
@@ -14,8 +18,11 @@ from invenio_records_resources.services.uow import RecordCommitOp, unit_of_work
 from invenio_requests.services.results import EntityResolverExpandableField
 from sqlalchemy.orm.exc import NoResultFound
 
+from ...records.dumpers.relations import RelationsCache
 from ...utils import ChainObject
 from ..results import ParentCommunitiesExpandableField
+from .providers import DataCitePIDProvider
+from .queue import send_requests
 
 
 class PIDsService(RecordService):
@@ -153,20 +160,8 @@ class PIDsService(RecordService):
             expand=expand,
         )
 
-    @unit_of_work()
-    def register_or_update(
-        self,
-        identity,
-        id_,
-        scheme,
-        parent=False,
-        uow=None,
-        expand=False,
-    ):
-        """Register or update a PID of a record.
-
-        If the PID has already been register it updates the remote.
-        """
+    def _sync_target(self, id_, scheme, parent=False):
+        """Get the record, the PID holder, its PID manager and the PID to sync."""
         record = self.record_cls.pid.resolve(id_, registered_only=False)
 
         if parent:
@@ -192,8 +187,10 @@ class PIDsService(RecordService):
         # no need to validate since the record class was already published
         pid_attrs = pid_record.pids.get(scheme)
         pid = pid_manager.read(scheme, pid_attrs["identifier"], pid_attrs["provider"])
+        return record, pid_record, pid_manager, pid
 
-        # Determine landing page (use scheme specific if available)
+    def _sync_url(self, identity, record, scheme, parent=False):
+        """Get the landing page of a PID (scheme specific, if available)."""
         links = self.links_item_tpl.expand(identity, record)
         link_prefix = "parent" if parent else "self"
         link_choices = [
@@ -202,8 +199,24 @@ class PIDsService(RecordService):
         ]
         for link_id in link_choices:
             if link_id in links:
-                url = links[link_id]
-                break
+                return links[link_id]
+
+    @unit_of_work()
+    def register_or_update(
+        self,
+        identity,
+        id_,
+        scheme,
+        parent=False,
+        uow=None,
+        expand=False,
+    ):
+        """Register or update a PID of a record.
+
+        If the PID has already been register it updates the remote.
+        """
+        record, pid_record, pid_manager, pid = self._sync_target(id_, scheme, parent)
+        url = self._sync_url(identity, record, scheme, parent)
 
         # NOTE: This is not the best place to do this, since we shouldn't be aware of
         #       the fact that the record has a `RelationsField``. However, without
@@ -237,6 +250,107 @@ class PIDsService(RecordService):
             expand=expand,
         )
 
+    @unit_of_work()
+    def register_or_update_many(
+        self, identity, entries, concurrency=1, rate_limit=None, uow=None
+    ):
+        """Register or update many PIDs on the remote providers.
+
+        The duplicated entries are synced once. The records are serialized in a
+        single batch, sharing the dereferenced relations. The requests to
+        DataCite are then sent concurrently through a pooled client, while the
+        PIDs of the other providers are synced one by one.
+
+        :param entries: list of ``(id_, scheme, parent)`` tuples.
+        :param concurrency: maximum number of concurrent requests to DataCite.
+        :param rate_limit: maximum number of requests to DataCite per second.
+        :returns: the number of ``coalesced`` entries, and of ``dispatched``,
+            ``succeeded``, ``failed`` and ``skipped`` syncs.
+        """
+        unique_entries = list(dict.fromkeys(entries))
+        stats = Counter(
+            coalesced=len(entries) - len(unique_entries),
+            dispatched=0,
+            succeeded=0,
+            failed=0,
+            skipped=0,
+        )
+
+        targets = []
+        for entry in unique_entries:
+            try:
+                targets.append((entry, *self._sync_target(*entry)))
+            except Exception:
+                current_app.logger.exception(f"Failed to resolve the PID {entry}.")
+                stats["failed"] += 1
+
+        requests = []
+        with RelationsCache.scope() as cache:
+            cache.prefetch([record for _, record, _, _, _ in targets])
+
+            for entry, record, pid_record, pid_manager, pid in targets:
+                _, scheme, parent = entry
+                try:
+                    url = self._sync_url(identity, record, scheme, parent)
+                    relations = getattr(pid_record, "relations", None)
+                    if relations:
+                        cache.inject(record)
+                        relations.dereference()
+
+                    is_update = pid.is_registered()
+                    self.require_permission(
+                        identity,
+                        "pid_update" if is_update else "pid_register",
+                        record=record,
+                    )
+
+                    provider = pid_manager._get_provider(
+                        scheme, pid_record.pids[scheme]["provider"]
+                    )
+                    if not isinstance(provider, DataCitePIDProvider):
+                        if is_update:
+                            pid_manager.update(pid_record, scheme, url=url)
+                        else:
+                            pid_manager.register(pid_record, scheme, url=url)
+                        stats["succeeded"] += 1
+                        continue
+
+                    if is_update:
+                        request = provider.prepare_update(pid, pid_record, url=url)
+                    else:
+                        request = provider.prepare_register(pid, pid_record, url=url)
+                    if request is None:
+                        stats["skipped"] += 1
+                        continue
+                    requests.append((provider, pid, is_update, *request))
+                except Exception:
+                    current_app.logger.exception(f"Failed to sync the PID {entry}.")
+                    stats["failed"] += 1
+
+        errors = send_requests(
+            [(provider, method, kwargs) for provider, _, _, method, kwargs in requests],
+            concurrency=concurrency,
+            rate_limit=rate_limit,
+        )
+        stats["dispatched"] = len(errors)
+
+        for (provider, pid, is_update, _, _), error in zip(requests, errors):
+            if isinstance(error, DataCiteError):
+                action = "updating" if is_update else "registering"
+                provider.log_error(pid, action, error)
+                stats["failed"] += 1
+            elif error is not None:
+                current_app.logger.error(
+                    f"Failed to sync the PID {pid.pid_value}.", exc_info=error
+                )
+                stats["failed"] += 1
+            else:
+                if is_update:
+                    provider.finish_update(pid)
+                stats["succeeded"] += 1
+
+        return dict(stats)
+
     @unit_of_work()
     def discard(self, identity, id_, scheme, provider=None, uow=None, expand=False):
         """Discard a PID for a given draft.
@@ -4,6 +4,7 @@
 """RDM PIDs Service tasks."""
 
 from celery import shared_task
+from flask import current_app
 from invenio_access.permissions import system_identity
 
 from ...proxies import current_rdm_records
@@ -18,3 +19,13 @@ def register_or_update_pid(recid, scheme, parent=False):
         scheme=scheme,
         parent=parent,
     )
+
+
+@shared_task(ignore_result=True)
+def process_pids_sync_queue(max_batches=None):
+    """Register or update the queued PIDs on the remote providers."""
+    stats = current_rdm_records.pids_sync_queue.process(max_batches=max_batches)
+    current_app.logger.info(
+        "PIDs sync queue: "
+        + ", ".join(f"{name}={count}" for name, count in sorted(stats.items()))
+    )
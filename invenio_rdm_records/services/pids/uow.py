@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Unit of work operations for the PIDs."""
+
+from flask import current_app
+from invenio_records_resources.services.uow import Operation
+
+from ...proxies import current_rdm_records
+from .tasks import register_or_update_pid
+
+
+class PIDRegisterOrUpdateOp(Operation):
+    """Register or update a PID on the remote provider, after commit.
+
+    If ``RDM_PIDS_SYNC_QUEUE_ENABLED`` is set, the PID is published to the
+    coalescing sync queue. Otherwise, a task is sent to sync it.
+    """
+
+    def __init__(self, recid, scheme, parent=False):
+        """Constructor."""
+        super().__init__()
+        self._recid = recid
+        self._scheme = scheme
+        self._parent = parent
+
+    def on_post_commit(self, uow):
+        """Queue the PID, or send the task."""
+        if current_app.config.get("RDM_PIDS_SYNC_QUEUE_ENABLED", False):
+            current_rdm_records.pids_sync_queue.publish(
+                [(self._recid, self._scheme, self._parent)]
+            )
+        else:
+            register_or_update_pid.delay(self._recid, self._scheme, parent=self._parent)
@@ -5,6 +5,7 @@
 
 """Service results."""
 
+import jsonpatch
 from invenio_communities.communities.entity_resolvers import pick_fields
 from invenio_communities.communities.schema import CommunityGhostSchema
 from invenio_communities.proxies import current_communities
@@ -19,6 +20,7 @@ from invenio_records_resources.services.records.results import (
 from invenio_users_resources.proxies import current_user_resources
 
 from .dummy import DummyExpandingService
+from .links import RDMLinksTemplate
 
 
 class ParentCommunitiesExpandableField(ExpandableField):
@@ -81,6 +83,12 @@ class RDMRecordList(RecordList):
     @property
     def hits(self):
         """Iterator over the hits."""
+        links_kwargs = {}
+        if (self._params or {}).get("links") == "minimal" and isinstance(
+            self._links_item_tpl, RDMLinksTemplate
+        ):
+            links_kwargs["keys"] = self._service.config.links_item_minimal
+
         for hit in self._results:
             # Load dump
             record_dict = hit.to_dict()
@@ -102,7 +110,7 @@ class RDMRecordList(RecordList):
             )
             if self._links_item_tpl:
                 projection["links"] = self._links_item_tpl.expand(
-                    self._identity, record
+                    self._identity, record, **links_kwargs
                 )
 
             yield projection
@@ -114,23 +122,46 @@ class RDMRecordRevisionsList(ServiceListResult):
     We need a custom result class to handle the record revisions list as they are stored only in DB.
     """
 
-    def __init__(self, identity, revisions):
-        """Instantiate a Collection tree list item."""
+    def __init__(
+        self, identity, revisions, mode="full", previous=None, next_after=None
+    ):
+        """Instantiate a record revisions list.
+
+        :param mode: ``metadata``, ``full`` or ``diff`` (see ``search_revisions``).
+        :param previous: revision preceding the oldest one of the list, used as the
+            base of its diff.
+        :param next_after: transaction id after which the next page starts.
+        """
         self._identity = identity
         self._revisions = revisions
+        self._mode = mode
+        self._previous = previous
+        self.next_after = next_after
+
+    def _patches(self):
+        """Compute the JSON patches of the revisions from their previous one."""
+        bases = [*self._revisions[1:], self._previous]
+        return [
+            jsonpatch.make_patch(base.json if base else {}, revision.json).patch
+            for revision, base in zip(self._revisions, bases)
+        ]
 
     def to_dict(self):
-        """Serialize the collection tree list to a dictionary."""
-        res = map(
-            lambda revision: {
+        """Serialize the revisions list to a list of dictionaries."""
+        res = []
+        patches = self._patches() if self._mode == "diff" else None
+        for i, revision in enumerate(self._revisions):
+            item = {
                 "updated": revision.updated,
                 "created": revision.created,
                 "revision_id": revision.transaction_id,
-                "json": revision.json,
-            },
-            self._revisions,
-        )
-        return list(res)
+            }
+            if self._mode == "full":
+                item["json"] = revision.json
+            elif self._mode == "diff":
+                item["patch"] = patches[i]
+            res.append(item)
+        return res
 
     def __iter__(self):
         """Iterate over the collection revisions."""
@@ -10,7 +10,8 @@
 
 from datetime import timezone
 
-from marshmallow import Schema, fields, validate
+from flask import current_app
+from marshmallow import Schema, ValidationError, fields, validate, validates
 from marshmallow.validate import OneOf
 from marshmallow_utils.fields import (
     ISODateString,
@@ -53,6 +54,19 @@ class Grants(Schema):
     )
 
 
+class BatchGrants(Schema):
+    """Grants schema for batch creation."""
+
+    grants = fields.List(fields.Nested(Grant), validate=validate.Length(min=1))
+
+    @validates("grants")
+    def validate_grants_size(self, value, data_key=None):
+        """Validate the number of grants against the configured maximum."""
+        max_size = current_app.config["RDM_RECORDS_GRANTS_BATCH_MAX_SIZE"]
+        if len(value) > max_size:
+            raise ValidationError(f"Longer than maximum length {max_size}.")
+
+
 class SecretLink(Schema):
     """Schema for a secret link."""
 
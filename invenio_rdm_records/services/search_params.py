@@ -39,6 +39,20 @@ class PublishedRecordsParam(ParamInterpreter):
         return search
 
 
+class SourceExcludesParam(ParamInterpreter):
+    """Excludes the fields only used by other consumers of the index.
+
+    E.g. the pre-rendered OAI-PMH metadata formats are only read by the OAI-PMH
+    server, which has its own search.
+    """
+
+    excludes = ["oai_cache"]
+
+    def apply(self, identity, search, params):
+        """Exclude the fields from the source of the hits."""
+        return search.source(excludes=self.excludes)
+
+
 class SharedOrMyDraftsParam(ParamInterpreter):
     """Evaluates the shared_with_me parameter.
 
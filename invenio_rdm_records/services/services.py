@@ -17,13 +17,14 @@ from invenio_db import db
 from invenio_drafts_resources.services.records import RecordService
 from invenio_drafts_resources.services.records.uow import ParentRecordCommitOp
 from invenio_i18n import lazy_gettext as _
+from invenio_pidstore.models import PersistentIdentifier
 from invenio_records_resources.services import LinksTemplate, ServiceSchemaWrapper
 from invenio_records_resources.services.errors import PermissionDeniedError
 from invenio_records_resources.services.uow import (
+    RecordBulkIndexOp,
     RecordCommitOp,
     RecordIndexDeleteOp,
     RecordIndexOp,
-    TaskOp,
     unit_of_work,
 )
 from invenio_requests.proxies import current_requests_service as requests_service
@@ -31,12 +32,14 @@ from invenio_requests.services.results import EntityResolverExpandableField
 from invenio_search.engine import dsl
 from marshmallow import ValidationError
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import defer
+from sqlalchemy_continuum import version_class
 
 from invenio_rdm_records.records.models import RDMRecordQuota, RDMUserQuota
 from invenio_rdm_records.requests.file_modification import FileModification
 from invenio_rdm_records.requests.quota_increase import QuotaIncrease
 from invenio_rdm_records.requests.record_deletion import RecordDeletion
-from invenio_rdm_records.services.pids.tasks import register_or_update_pid
+from invenio_rdm_records.services.pids.uow import PIDRegisterOrUpdateOp
 
 from ..records.systemfields.deletion_status import RecordDeletionStatusEnum
 from .errors import (
@@ -45,6 +48,7 @@ from .errors import (
     EmbargoNotLiftedError,
     RecordDeletedException,
 )
+from .links import RDMLinksTemplate
 from .results import ParentCommunitiesExpandableField
 
 
@@ -87,6 +91,11 @@ class RDMRecordService(RecordService):
     #
     # Properties
     #
+    @property
+    def links_item_tpl(self):
+        """Item links template."""
+        return RDMLinksTemplate(self.config.links_item)
+
     @property
     def expandable_fields(self):
         """Get expandable fields.
@@ -145,7 +154,7 @@ class RDMRecordService(RecordService):
 
         self._pids.pid_manager.create_and_reserve(record)
         uow.register(RecordCommitOp(record, indexer=self.indexer))
-        uow.register(TaskOp(register_or_update_pid, record["id"], "doi", parent=False))
+        uow.register(PIDRegisterOrUpdateOp(record["id"], "doi", parent=False))
         # If the record was previously public it will still keep the parent PID
         if not record.parent.pids:
             self._pids.parent_pid_manager.create_and_reserve(record.parent)
@@ -154,9 +163,7 @@ class RDMRecordService(RecordService):
                     record.parent,
                 )
             )
-            uow.register(
-                TaskOp(register_or_update_pid, record["id"], "doi", parent=True)
-            )
+            uow.register(PIDRegisterOrUpdateOp(record["id"], "doi", parent=True))
 
     def scan_expired_embargos(self, identity):
         """Scan for records with an expired embargo."""
@@ -253,6 +260,76 @@ class RDMRecordService(RecordService):
             expand=expand,
         )
 
+    def _get_records(self, ids):
+        """Get the published records of the given PIDs, with a single query."""
+        model_cls = self.record_cls.model_cls
+        pid_type = self.record_cls.pid.field._pid_type
+        models = (
+            model_cls.query.join(
+                PersistentIdentifier, PersistentIdentifier.object_uuid == model_cls.id
+            )
+            .filter(
+                PersistentIdentifier.pid_type == pid_type,
+                PersistentIdentifier.pid_value.in_(ids),
+            )
+            .all()
+        )
+        return [self.record_cls(model.data, model=model) for model in models]
+
+    @unit_of_work()
+    def delete_records(self, identity, ids, data, uow=None):
+        """(Soft) delete many published records at once.
+
+        Bulk form of ``delete_record``, for moderation: the records are
+        tombstoned in the same transaction and bulk indexed after commit. The
+        records already deleted are skipped, and indexed again.
+
+        :param ids: the PIDs of the records.
+        :param data: the tombstone data of all the records.
+        :returns: the number of ``deleted`` and ``skipped`` records.
+        """
+        stats = {"deleted": 0, "skipped": 0}
+        to_index = []
+        deleted = []
+        for record in self._get_records(ids):
+            self.require_permission(identity, "delete", record=record)
+            to_index.append(record.id)
+            if record.deletion_status.is_deleted:
+                stats["skipped"] += 1
+                continue
+
+            tombstone, _ = self.schema_tombstone.load(
+                data,
+                context={"identity": identity, "pid": record.pid, "record": record},
+                raise_errors=True,
+            )
+            self.run_components(
+                "delete_record", identity, data=tombstone, record=record, uow=uow
+            )
+
+            if record.versions.is_latest is True:
+                # set latest to the previous non deleted record
+                new_latest = self.record_cls.next_latest_published_record_by_parent(
+                    record.parent
+                )
+                if new_latest:
+                    new_latest.versions.set_latest()
+                    new_latest.commit()
+                    to_index.append(new_latest.id)
+
+            # commit right away, for the next versions queries
+            record.commit()
+            deleted.append(record.id)
+            stats["deleted"] += 1
+
+        # delete the drafts of the deleted records from the index (not the ones
+        # of the new latest versions, which are still published)
+        for draft in self.draft_cls.get_records(deleted):
+            uow.register(RecordIndexDeleteOp(draft, indexer=self.draft_indexer))
+
+        uow.register(RecordBulkIndexOp(list(dict.fromkeys(to_index)), self.indexer))
+        return stats
+
     @unit_of_work()
     def request_deletion(self, identity, id_, data=None, uow=None, **kwargs):
         """Request deletion of a record."""
@@ -448,6 +525,56 @@ class RDMRecordService(RecordService):
             expand=expand,
         )
 
+    @unit_of_work()
+    def restore_records(self, identity, ids, uow=None):
+        """Restore many (soft) deleted records at once.
+
+        Bulk form of ``restore_record``, for moderation: the records are
+        restored in the same transaction and bulk indexed after commit. The
+        records which are not deleted are skipped, and indexed again.
+
+        :param ids: the PIDs of the records.
+        :returns: the number of ``restored`` and ``skipped`` records.
+        """
+        stats = {"restored": 0, "skipped": 0}
+        to_index = []
+        restored = []
+        records = self._get_records(ids)
+        # the latest published versions of all the parents, with one query
+        latest_by_parent = self.record_cls.get_latest_published_by_parents(
+            record.parent for record in records
+        )
+        for record in records:
+            self.require_permission(identity, "delete", record=record)
+            to_index.append(record.id)
+            if record.deletion_status != RecordDeletionStatusEnum.DELETED:
+                stats["skipped"] += 1
+                continue
+
+            self.run_components("restore_record", identity, record=record, uow=uow)
+
+            # set latest to the previous non deleted record
+            latest = latest_by_parent.get(record.parent.id)
+            if not latest or record.versions.index > latest.versions.index:
+                record.versions.set_latest()
+                latest_by_parent[record.parent.id] = record
+                if latest:
+                    # commit and reindex the old latest record
+                    latest.commit()
+                    to_index.append(latest.id)
+
+            # commit right away, for the next versions queries
+            record.commit()
+            restored.append(record.id)
+            stats["restored"] += 1
+
+        # reindex the drafts of the restored records
+        for draft in self.draft_cls.get_records(restored):
+            uow.register(RecordIndexOp(draft, indexer=self.draft_indexer))
+
+        uow.register(RecordBulkIndexOp(list(dict.fromkeys(to_index)), self.indexer))
+        return stats
+
     @unit_of_work()
     def mark_record_for_purge(self, identity, id_, expand=False, uow=None):
         """Mark a (soft) deleted record for purge."""
@@ -892,16 +1019,51 @@ class RDMRecordService(RecordService):
 
             return request
 
-    def search_revisions(self, identity, id_):
-        """Return a list of record revisions."""
+    def search_revisions(self, identity, id_, size=None, after=None, mode="metadata"):
+        """Return a page of record revisions, from the latest to the oldest.
+
+        The revisions are paginated on their transaction id: the next page starts
+        after the ``next_after`` transaction id of the result.
+
+        :param size: number of revisions per page.
+        :param after: transaction id after which the page starts.
+        :param mode: ``metadata`` to only list the revisions, ``full`` to include
+            their JSON, or ``diff`` to include the JSON patch from the previous
+            revision.
+        """
         record = self.record_cls.pid.resolve(id_)
         # Check permissions
         self.require_permission(identity, "search_revisions", record=record)
-        revisions = list(reversed(record.model.versions.all()))
+
+        if mode not in ("metadata", "full", "diff"):
+            raise ValidationError(
+                _("Invalid revisions mode: {mode}").format(mode=mode), "mode"
+            )
+        config = current_app.config
+        size = min(
+            size or config["RDM_RECORD_REVISIONS_DEFAULT_SIZE"],
+            config["RDM_RECORD_REVISIONS_MAX_SIZE"],
+        )
+
+        version_cls = version_class(record.model.__class__)
+        query = record.model.versions.order_by(version_cls.transaction_id.desc())
+        if after is not None:
+            query = query.filter(version_cls.transaction_id < after)
+        if mode == "metadata":
+            query = query.options(defer(version_cls.json))
+        # the extra revision tells if there is a next page, and is the base of
+        # the diff of the last revision of the page
+        revisions = query.limit(size + 1).all()
+        has_next = len(revisions) > size
+        previous = revisions[size] if has_next else None
+        revisions = revisions[:size]
 
         return self.config.revision_result_list_cls(
             identity,
             revisions,
+            mode=mode,
+            previous=previous,
+            next_after=revisions[-1].transaction_id if has_next else None,
         )
 
     def read_revision(self, identity, id_, revision_id, include_previous=False):
@@ -3,26 +3,25 @@
 
 """Storage Service."""
 
-import logging
 from math import ceil
 
 from flask import current_app
-from invenio_access.permissions import system_identity
 from invenio_accounts.models import User
+from invenio_base import invenio_url_for
 from invenio_db import db
 from invenio_files_rest.models import Bucket
-from invenio_search.engine import dsl
-from sqlalchemy import func
+from invenio_records_resources.services.uow import Operation
+from sqlalchemy import func, select, union_all
 
 from invenio_rdm_records.records.models import (
     RDMDraftMetadata,
+    RDMParentStorageUsage,
     RDMRecordMetadata,
     RDMRecordQuota,
     RDMUserQuota,
+    RDMVersionsState,
 )
 
-logger = logging.getLogger(__name__)
-
 
 class StorageService:
     """Service providing per-user storage quota information."""
@@ -123,61 +122,171 @@ class StorageService:
             0,
         )
 
-    def _search_user_resources(self, user, drafts=False):
-        """Fetch user records or drafts."""
-        filters = [dsl.Q("term", **{"parent.access.owned_by.user": user.id})]
+    def _usage_query(self, parent_ids=None):
+        """Aggregate the used bytes per parent, over all its versions and drafts.
+
+        The usage of a parent is the size of its largest bucket, as the versions
+        of a record usually share most of their files.
+        """
+        buckets = []
+        for model in (RDMRecordMetadata, RDMDraftMetadata):
+            query = select(
+                model.parent_id.label("parent_id"), Bucket.size.label("size")
+            ).join(Bucket, Bucket.id == model.bucket_id)
+            if parent_ids is not None:
+                query = query.where(model.parent_id.in_(parent_ids))
+            buckets.append(query)
+        buckets = union_all(*buckets).subquery()
+
+        return select(
+            buckets.c.parent_id, func.max(buckets.c.size).label("used_bytes")
+        ).group_by(buckets.c.parent_id)
+
+    def compute_usage(self, parent_ids=None):
+        """Compute the used bytes of the parents, with a single SQL aggregate."""
+        return {
+            parent_id: int(used_bytes or 0)
+            for parent_id, used_bytes in db.session.execute(
+                self._usage_query(parent_ids)
+            )
+        }
 
-        if drafts:
-            filters.append(dsl.Q("term", is_published=False))
-            search_fn = self.records_service.search_drafts
-        else:
-            search_fn = self.records_service.search
+    def _store_usage(self, owners):
+        """Store the storage usage of the parents, given their owners."""
+        usage = self.compute_usage(list(owners))
+        existing = {
+            u.parent_id: u
+            for u in RDMParentStorageUsage.query.filter(
+                RDMParentStorageUsage.parent_id.in_(list(owners))
+            )
+        }
+        for parent_id, user_id in owners.items():
+            entry = existing.get(parent_id)
+            if entry is None:
+                entry = RDMParentStorageUsage(parent_id=parent_id)
+                db.session.add(entry)
+            entry.user_id = user_id
+            entry.used_bytes = usage.get(parent_id, 0)
+
+    def update_usage(self, parents):
+        """Update the stored storage usage of the given parent records.
+
+        Called when files are committed or deleted, it only recomputes the
+        aggregate of the affected parents.
+        """
+        self._store_usage(
+            {parent.id: parent.access.owned_by.owner_id for parent in parents}
+        )
 
-        return search_fn(
-            system_identity,
-            extra_filter=dsl.Q("bool", must=filters),
+    def rebuild_usage(self):
+        """Recompute the stored storage usage of all the parent records."""
+        chunk_size = current_app.config["RDM_STORAGE_USAGE_REBUILD_CHUNK_SIZE"]
+        model_cls = self.records_service.record_cls.parent_record_cls.model_cls
+        query = db.session.query(model_cls.id, model_cls.json).filter(
+            model_cls.json.isnot(None)
         )
 
-    def _resolve_records_and_quotas(self, items, draft=False):
-        """Resolve search hits and fetch quotas."""
-        cls = (
-            self.records_service.draft_cls if draft else self.records_service.record_cls
+        owners = {}
+        for parent_id, data in query.yield_per(chunk_size):
+            owned_by = (data.get("access") or {}).get("owned_by") or {}
+            owners[parent_id] = owned_by.get("user")
+            if len(owners) >= chunk_size:
+                self._store_usage(owners)
+                owners = {}
+        if owners:
+            self._store_usage(owners)
+        db.session.commit()
+
+    def get_top_consumers(self, size=None):
+        """Get the users using the most storage, with their total usage."""
+        size = size or current_app.config["RDM_STORAGE_TOP_CONSUMERS_SIZE"]
+        total = func.sum(RDMParentStorageUsage.used_bytes)
+        rows = (
+            db.session.query(
+                RDMParentStorageUsage.user_id,
+                User.email,
+                total.label("used_bytes"),
+                func.count(RDMParentStorageUsage.parent_id).label("records"),
+            )
+            .outerjoin(User, User.id == RDMParentStorageUsage.user_id)
+            .filter(RDMParentStorageUsage.user_id.isnot(None))
+            .group_by(RDMParentStorageUsage.user_id, User.email)
+            .order_by(total.desc())
+            .limit(size)
         )
+        return [
+            {
+                "user_id": user_id,
+                "email": email,
+                "used_bytes": int(used_bytes or 0),
+                "records": records,
+            }
+            for user_id, email, used_bytes, records in rows
+        ]
+
+    def _get_display_records(self, parent_ids, include_drafts=True):
+        """Get the latest record (or draft) of each parent, without resolving PIDs."""
+        states = RDMVersionsState.query.filter(
+            RDMVersionsState.parent_id.in_(parent_ids)
+        ).all()
+        record_ids = {s.latest_id: s.parent_id for s in states if s.latest_id}
+        draft_ids = {
+            s.next_draft_id: s.parent_id
+            for s in states
+            if include_drafts and not s.latest_id and s.next_draft_id
+        }
 
-        records = []
-        parent_ids = set()
-
-        for item in items:
-            try:
-                record = cls.pid.resolve(item["id"], registered_only=not draft)
-                records.append((item, record))
-                parent_ids.add(record.parent.id)
-            except Exception as e:
-                logger.warning("Failed to resolve record %s: %s", item.get("id"), e)
-
-        quotas = {
-            q.parent_id: q.quota_size
-            for q in RDMRecordQuota.query.filter(
-                RDMRecordQuota.parent_id.in_(parent_ids)
-            ).all()
+        records = {}
+        for cls, ids in (
+            (self.records_service.record_cls, record_ids),
+            (self.records_service.draft_cls, draft_ids),
+        ):
+            if ids:
+                for record in cls.get_records(list(ids)):
+                    records[ids[record.id]] = record
+        return records
+
+    @staticmethod
+    def _record_item(record):
+        """Serialize the fields of a record needed to display its usage."""
+        endpoint = (
+            "invenio_app_rdm_records.deposit_edit"
+            if record.is_draft
+            else "invenio_app_rdm_records.record_detail"
+        )
+        return {
+            "id": record["id"],
+            "metadata": record.get("metadata", {}),
+            "links": {"self_html": invenio_url_for(endpoint, pid_value=record["id"])},
         }
 
-        return records, quotas
+    def get_user_storage_usage(self, user, include_drafts=True):
+        """Return raw storage usage data.
 
-    def _compute_usage(self, user, records, quotas):
-        """Compute quota usage."""
-        results = []
-        total_extra = 0
-        total_used = 0
+        Only the records with a quota increase are listed. Their usage is
+        computed with a single aggregate query, restricted to their parents.
+        """
         default_quota = self.default_quota(user)
-        for item, record in records:
-            pid = record.parent.id
-            quota = quotas.get(pid, default_quota)
+        rows = (
+            db.session.query(RDMRecordQuota.parent_id, RDMRecordQuota.quota_size)
+            .filter(
+                RDMRecordQuota.user_id == user.id,
+                RDMRecordQuota.quota_size > default_quota,
+            )
+            .all()
+        )
+        parent_ids = [parent_id for parent_id, _ in rows]
+        usage = self.compute_usage(parent_ids) if parent_ids else {}
+        records = self._get_display_records(parent_ids, include_drafts=include_drafts)
 
-            if quota <= default_quota:
+        entries = []
+        total_extra = 0
+        total_used = 0
+        for parent_id, quota in rows:
+            record = records.get(parent_id)
+            if record is None:
                 continue
-
-            used_bytes = record.files.total_bytes or 0
+            used_bytes = usage.get(parent_id, 0)
             extra_quota = quota - default_quota
             excess_usage = max(used_bytes - default_quota, 0)
             additional_used = min(excess_usage, extra_quota)
@@ -185,9 +294,9 @@ class StorageService:
             total_extra += extra_quota
             total_used += additional_used
 
-            results.append(
+            entries.append(
                 {
-                    "item": item,
+                    "item": self._record_item(record),
                     "record": record,
                     "quota": quota,
                     "used_bytes": used_bytes,
@@ -196,29 +305,27 @@ class StorageService:
                 }
             )
 
-        return results, total_extra, total_used
-
-    def _process_resources(self, user, items, draft=False):
-        """Resolve + compute in one step."""
-        resolved, quotas = self._resolve_records_and_quotas(items, draft=draft)
-        return self._compute_usage(user, resolved, quotas)
-
-    def get_user_storage_usage(self, user, include_drafts=True):
-        """Return raw storage usage data."""
-        record_data, extra_r, used_r = self._process_resources(
-            user, self._search_user_resources(user)
-        )
-
-        draft_data, extra_d, used_d = [], 0, 0
-        if include_drafts:
-            draft_data, extra_d, used_d = self._process_resources(
-                user, self._search_user_resources(user, drafts=True), draft=True
-            )
-        default_quota = self.default_quota(user)
         return {
             "default_quota": default_quota,
             "max_additional_quota": self.max_additional_quota,
-            "total_extra": extra_r + extra_d,
-            "total_used": used_r + used_d,
-            "entries": record_data + draft_data,
+            "total_extra": total_extra,
+            "total_used": total_used,
+            "entries": entries,
         }
+
+
+class StorageUsageOp(Operation):
+    """Update the storage usage of a parent record, in the same transaction."""
+
+    def __init__(self, service, parent):
+        """Constructor."""
+        super().__init__()
+        self._service = service
+        self._parent = parent
+
+    def on_register(self, uow):
+        """Recompute the usage, as the buckets sizes are already final.
+
+        The usage rows are then committed together with the file changes.
+        """
+        self._service.update_usage([self._parent])
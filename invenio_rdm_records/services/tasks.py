@@ -4,7 +4,6 @@
 
 """Celery tasks."""
 
-import math
 from datetime import datetime, timedelta, timezone
 
 from celery import shared_task
@@ -56,41 +55,113 @@ def update_expired_embargos():
 
 @shared_task(ignore_result=True)
 def reindex_stats(stats_indices):
-    """Reindex the documents where the stats have changed."""
+    """Reindex the documents where the stats have changed.
+
+    The parent ids of the updated statistics are collected page by page with a
+    composite aggregation, ordered by update time. Each page is reindexed by a
+    separate task, so that the pages are processed in parallel. After each page,
+    the bookmark is moved forward to the oldest update time that is still being
+    processed, so that an interrupted run resumes where it stopped.
+    """
     bm = BookmarkAPI(current_search_client, "stats_reindex", "day")
     last_run = bm.get_bookmark()
     if not last_run:
         # If this is the first time that we run, let's do it for the documents of the last week
-        last_run = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
-    reindex_start_time = datetime.now(timezone.utc).isoformat()
+        last_run = datetime.now(timezone.utc) - timedelta(days=7)
+    reindex_start_time = datetime.now(timezone.utc)
     indices = ",".join(map(lambda x: prefix_index(x) + "*", stats_indices))
+    chunk_size = current_app.config["RDM_STATS_REINDEX_CHUNK_SIZE"]
 
-    all_parents = set()
     query = dsl.Search(
         using=current_search_client,
         index=indices,
-    ).filter({"range": {"updated_timestamp": {"gte": last_run}}})
-
-    for result in query.scan():
-        parent_id = result.parent_recid
-        all_parents.add(parent_id)
-
-    if all_parents:
-        all_parents_list = list(all_parents)
-        step = 10000
-        end = len(list(all_parents))
-        for i in range(0, end, step):
-            records_q = dsl.Q("terms", parent__id=all_parents_list[i : i + step])
-            current_rdm_records.records_service.reindex(
-                params={"allversions": True},
-                identity=system_identity,
-                search_query=records_q,
-            )
-    bm.set_bookmark(reindex_start_time)
-    return "%d documents reindexed" % len(all_parents)
+    ).filter(
+        {
+            "range": {
+                "updated_timestamp": {"gte": last_run, "lt": reindex_start_time},
+            }
+        }
+    )
+    sources = [
+        {
+            "updated": {
+                "date_histogram": {
+                    "field": "updated_timestamp",
+                    "fixed_interval": current_app.config[
+                        "RDM_STATS_REINDEX_BOOKMARK_INTERVAL"
+                    ],
+                }
+            }
+        },
+        {"parent_recid": {"terms": {"field": "parent_recid"}}},
+    ]
+
+    num_parents = 0
+    num_chunks = 0
+    after_key = None
+    while True:
+        chunk_query = query.extra(size=0)
+        composite_kwargs = {"after": after_key} if after_key else {}
+        chunk_query.aggs.bucket(
+            "parents", "composite", size=chunk_size, sources=sources, **composite_kwargs
+        )
+        result = chunk_query.execute().aggregations.parents
+
+        # a parent is only listed once per time bucket, but it can be listed
+        # again in the following ones (and pages)
+        parent_ids = list({bucket.key.parent_recid for bucket in result.buckets})
+        if parent_ids:
+            reindex_stats_parents.delay(parent_ids)
+            num_parents += len(parent_ids)
+            num_chunks += 1
+
+        if len(result.buckets) < chunk_size:
+            break
+
+        after_key = result.after_key.to_dict()
+        # all statistics updated before the current time bucket have been handled
+        bm.set_bookmark(
+            datetime.fromtimestamp(
+                after_key["updated"] / 1000, timezone.utc
+            ).isoformat()
+        )
+
+    bm.set_bookmark(reindex_start_time.isoformat())
+
+    elapsed = (datetime.now(timezone.utc) - reindex_start_time).total_seconds()
+    current_app.logger.info(
+        f"Stats reindex: dispatched {num_parents} parents in {num_chunks} tasks "
+        f"in {elapsed:.2f}s"
+    )
+    return "%d parents dispatched for reindexing" % num_parents
+
+
+@shared_task(ignore_result=True)
+def reindex_stats_parents(parent_ids):
+    """Reindex all versions of the records of the given parents."""
+    records_q = dsl.Q("terms", parent__id=parent_ids)
+    current_rdm_records.records_service.reindex(
+        params={"allversions": True},
+        identity=system_identity,
+        search_query=records_q,
+    )
 
 
 @shared_task(ignore_result=True)
 def send_post_published_signal(pid):
     """Sends a signal for a published record."""
     post_publish_signal.send(current_app._get_current_object(), pid=pid)
+
+
+@shared_task(ignore_result=True)
+def bulk_add_to_community(community_id, record_ids, set_default=False):
+    """Add records to a community, reporting the progress in the logs."""
+    errors = current_rdm_records.record_communities_service.bulk_add(
+        system_identity, community_id, record_ids, set_default=set_default
+    )
+    for error in errors:
+        current_app.logger.warning(f"{error['record_id']}: {error['message']}")
+    current_app.logger.info(
+        f"Added {len(record_ids) - len(errors)}/{len(record_ids)} records to "
+        f"community {community_id}."
+    )
@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+
 from flask import current_app
 from invenio_access.permissions import authenticated_user, system_identity
 from invenio_access.utils import get_identity
@@ -16,6 +18,8 @@ from invenio_notifications.services.uow import NotificationOp
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_records_resources.services.uow import UnitOfWork
 from invenio_vcs.api import VCSRelease
+from invenio_vcs.contrib.github import GitHubProvider
+from invenio_vcs.contrib.gitlab import GitLabProvider
 from invenio_vcs.errors import CustomVCSReleaseNoRetryError
 from invenio_vcs.models import Release, ReleaseStatus
 from invenio_vcs.providers import RepositoryServiceProvider
@@ -32,8 +36,13 @@ from invenio_rdm_records.requests.community_submission import CommunitySubmissio
 
 from ...proxies import current_rdm_records_service
 from ...resources.serializers.ui import UIJSONSerializer
-from ..errors import CommunityRequiredError, RecordDeletedException
+from ..errors import (
+    CommunityRequiredError,
+    RecordDeletedException,
+    ZipballTransferError,
+)
 from .metadata import RDMReleaseMetadata
+from .stream import ZipballStream
 from .utils import retrieve_recid_by_uuid
 
 
@@ -44,6 +53,44 @@ def _get_user_identity(user):
     return identity
 
 
+@contextmanager
+def _github_request(provider, url, headers, timeout):
+    """Request a URL with the authenticated session of a GitHub provider."""
+    with provider._github.session.get(
+        url, headers=headers, stream=True, timeout=timeout
+    ) as resp:
+        yield resp.raw
+
+
+@contextmanager
+def _gitlab_request(provider, url, headers, timeout):
+    """Request a URL with the authenticated client of a GitLab provider."""
+    resp = provider._gitlab.http_get(
+        url, raw=True, streamed=True, timeout=timeout, extra_headers=headers
+    )
+    with resp:
+        yield resp.raw
+
+
+AUTHENTICATED_REQUESTS = {
+    GitHubProvider: _github_request,
+    GitLabProvider: _gitlab_request,
+}
+"""Authenticated requests of the VCS providers, used to resume the transfers."""
+
+
+def _range_request(provider, url, offset, timeout):
+    """Request the content of a zipball from a byte offset, as the provider does.
+
+    The providers without an authenticated request restart the transfer from
+    the beginning, and the bytes already received are skipped.
+    """
+    for provider_cls, request in AUTHENTICATED_REQUESTS.items():
+        if isinstance(provider, provider_cls):
+            return request(provider, url, {"Range": f"bytes={offset}-"}, timeout)
+    return contextmanager(provider.fetch_release_zipball)(url, timeout)
+
+
 def _format_error_message(ex):
     """Format an exception into a user-readable message."""
     if hasattr(ex, "message"):
@@ -69,6 +116,7 @@ class RDMVCSRelease(VCSRelease):
         """Constructor."""
         super().__init__(release, provider)
         self.warnings = []
+        self.transfer_stats = None
 
     def add_warning(self, warning: str):
         """Add a new non-fatal warning."""
@@ -185,29 +233,74 @@ class RDMVCSRelease(VCSRelease):
             db.session.commit()
             return published_record
 
-    def _upload_files_to_draft(self, identity, draft, uow):
-        """Upload files to draft."""
-        # Validate the release files are fetchable before initialising the draft files.
-        self.resolve_zipball_url()
-
-        draft_file_service = current_rdm_records_service.draft_files
+    def open_zipball(self, offset=0):
+        """Open the HTTP response of the release zipball, from a byte offset.
 
-        draft_file_service.init_files(
-            identity,
-            draft.id,
-            data=[{"key": self.release_file_name}],
-            uow=uow,
+        The transfer is started through the VCS provider, and resumed with an
+        HTTP range request on the resolved zipball URL, authenticated like the
+        provider's requests.
+        """
+        if not offset:
+            return self.fetch_zipball_file()
+        timeout = current_app.config.get("VCS_ZIPBALL_TIMEOUT", 300)
+        return _range_request(
+            self.provider, self.resolve_zipball_url(), offset, timeout
         )
 
-        with self.fetch_zipball_file() as file_stream:
-            draft_file_service.set_file_content(
+    def _upload_files_to_draft(self, identity, draft, uow):
+        """Upload files to draft.
+
+        The zipball is streamed to the draft file, checksummed on the fly, and
+        checked against the stored file.
+        """
+        draft_file_service = current_rdm_records_service.draft_files
+        config = current_app.config
+
+        # Open the transfer first, to validate the release files are fetchable
+        # before initialising the draft files.
+        with ZipballStream(
+            self.open_zipball,
+            buffer_size=config["RDM_VCS_ZIPBALL_BUFFER_SIZE"],
+            max_retries=config["RDM_VCS_ZIPBALL_MAX_RETRIES"],
+            retry_backoff=config["RDM_VCS_ZIPBALL_RETRY_BACKOFF"],
+        ) as file_stream:
+            draft_file_service.init_files(
+                identity,
+                draft.id,
+                data=[{"key": self.release_file_name}],
+                uow=uow,
+            )
+            result = draft_file_service.set_file_content(
                 identity,
                 draft.id,
                 self.release_file_name,
                 file_stream,
+                content_length=file_stream.content_length,
                 uow=uow,
             )
 
+        stats = file_stream.stats
+        current_app.logger.info(
+            "Release %s: transferred %s bytes in %.2fs (%s bytes/s, %s resumes).",
+            self.generic_release.id,
+            stats["bytes"],
+            stats["seconds"],
+            int(stats["bytes_per_second"] or 0),
+            stats["retries"],
+        )
+        self.transfer_stats = stats
+
+        if result.errors:
+            raise ZipballTransferError(
+                f"Failed to store the release zipball: {result.errors[0]}"
+            )
+        stored_checksum = result.to_dict().get("checksum")
+        if stored_checksum and stored_checksum != file_stream.checksum:
+            raise ZipballTransferError(
+                f"Checksum mismatch of the release zipball: received "
+                f"{file_stream.checksum}, stored {stored_checksum}."
+            )
+
     def publish(self):
         """Publish VCS release as record.
 
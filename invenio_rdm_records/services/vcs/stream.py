@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Streaming download of the release zipballs."""
+
+import hashlib
+import time
+from contextlib import ExitStack
+
+import requests
+from flask import current_app
+from urllib3.exceptions import HTTPError as URLLib3HTTPError
+
+from ..errors import ZipballTransferError
+
+TRANSIENT_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    URLLib3HTTPError,
+    OSError,
+)
+"""Errors after which the transfer is resumed."""
+
+
+class ZipballStream:
+    """Readable stream of a release zipball.
+
+    The bytes are read through a fixed-size buffer and checksummed on the fly.
+    After a transient failure, the transfer is resumed from the last received
+    byte with an HTTP range request. If the server ignores the range, the bytes
+    already received are skipped.
+
+    The stream is consumed by the files service, with ``read(size)`` calls.
+    """
+
+    def __init__(
+        self,
+        open_stream,
+        buffer_size=64 * 1024,
+        max_retries=3,
+        retry_backoff=1.0,
+        sleep=time.sleep,
+        clock=time.monotonic,
+    ):
+        """Constructor.
+
+        :param open_stream: function of the offset to start from, returning a
+            context manager of the HTTP response (with ``status``, ``headers``
+            and ``read(size)``).
+        :param buffer_size: maximum number of bytes read at once.
+        :param max_retries: number of resumes after transient failures.
+        :param retry_backoff: seconds to wait before the first resume, doubled
+            at each following resume.
+        """
+        self._open_stream = open_stream
+        self.buffer_size = buffer_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._sleep = sleep
+        self._clock = clock
+
+        self._md5 = hashlib.md5()
+        self._stack = ExitStack()
+        self._response = None
+        self._started = None
+        self._finished = None
+        self.bytes_read = 0
+        self.retries = 0
+        self.content_length = None
+
+    def __enter__(self):
+        """Open the transfer."""
+        self._started = self._clock()
+        self._open()
+        return self
+
+    def __exit__(self, *exc):
+        """Close the transfer."""
+        self.close()
+
+    def _open(self):
+        """Open (or resume) the HTTP response, from the current offset."""
+        self._stack.close()
+        self._stack = ExitStack()
+        offset = self.bytes_read
+        response = self._stack.enter_context(self._open_stream(offset))
+        status = getattr(response, "status", 200)
+        if status not in (200, 206):
+            raise ZipballTransferError(f"Unexpected HTTP status {status}.")
+
+        length = response.headers.get("Content-Length")
+        if status == 206:
+            if length is not None:
+                self.content_length = offset + int(length)
+        else:
+            if length is not None:
+                self.content_length = int(length)
+            # the range was ignored, skip the bytes already received
+            self._skip(response, offset)
+        self._response = response
+
+    def _skip(self, response, count):
+        """Read and drop ``count`` bytes of the response."""
+        while count > 0:
+            chunk = response.read(min(count, self.buffer_size))
+            if not chunk:
+                raise ZipballTransferError("Resumed transfer is shorter than before.")
+            count -= len(chunk)
+
+    def read(self, size=-1):
+        """Read at most ``size`` bytes, and at most the buffer size."""
+        if size is None or size < 0 or size > self.buffer_size:
+            size = self.buffer_size
+        while True:
+            try:
+                if self._response is None:
+                    # resume the transfer, which can fail as well
+                    self._open()
+                chunk = self._response.read(size)
+                break
+            except TRANSIENT_ERRORS as e:
+                if self.retries >= self.max_retries:
+                    raise ZipballTransferError(
+                        f"Transfer failed after {self.retries} resumes: {e}"
+                    ) from e
+                self._response = None
+                self._sleep(self.retry_backoff * 2**self.retries)
+                self.retries += 1
+                current_app.logger.warning(
+                    "Resuming the zipball transfer at byte %s (attempt %s): %s",
+                    self.bytes_read,
+                    self.retries,
+                    e,
+                )
+
+        if chunk:
+            self._md5.update(chunk)
+            self.bytes_read += len(chunk)
+        else:
+            self._check_complete()
+        return chunk
+
+    def _check_complete(self):
+        """Check that the whole announced content was received."""
+        if self._finished is None:
+            self._finished = self._clock()
+        if self.content_length is not None and self.bytes_read != self.content_length:
+            raise ZipballTransferError(
+                f"Received {self.bytes_read} bytes instead of {self.content_length}."
+            )
+
+    def close(self):
+        """Close the HTTP response."""
+        self._stack.close()
+        self._response = None
+
+    @property
+    def checksum(self):
+        """Checksum of the received bytes, in the files storage format."""
+        return f"md5:{self._md5.hexdigest()}"
+
+    @property
+    def stats(self):
+        """Transfer statistics: bytes, seconds, throughput and resumes."""
+        end = self._finished or self._clock()
+        seconds = max(end - (self._started or end), 0)
+        return {
+            "bytes": self.bytes_read,
+            "seconds": seconds,
+            "bytes_per_second": self.bytes_read / seconds if seconds else None,
+            "retries": self.retries,
+        }
@@ -8,8 +8,9 @@
 
 from types import SimpleNamespace
 
-from flask import Blueprint, abort, current_app, render_template
+from flask import Blueprint, abort, current_app, jsonify, render_template, request
 from flask_login import current_user, login_required
+from invenio_administration.permissions import administration_permission
 from invenio_records_resources.services.files.transfer import constants
 
 from .proxies import current_rdm_records_storage_service
@@ -143,7 +144,7 @@ def _format_storage(data):
                     (data["default_quota"] + e["extra_quota"]) / BYTES_TO_GB, 1
                 ),
                 "date": item.get("metadata", {}).get("publication_date", ""),
-                "status": "Draft" if not record.is_published else "Published",
+                "status": "Draft" if record.is_draft else "Published",
             }
         )
 
@@ -176,3 +177,18 @@ def storage_settings():
         "invenio_rdm_records/settings/storage.html",
         storage=storage,
     )
+
+
+@blueprint.route("/storage/top-consumers", endpoint="storage_top_consumers")
+@login_required
+@administration_permission.require(http_exception=403)
+def storage_top_consumers():
+    """List the users using the most storage."""
+    size = min(
+        request.args.get(
+            "size", current_app.config["RDM_STORAGE_TOP_CONSUMERS_SIZE"], type=int
+        ),
+        current_app.config["RDM_STORAGE_TOP_CONSUMERS_MAX_SIZE"],
+    )
+    hits = current_rdm_records_storage_service.get_top_consumers(size=size)
+    return jsonify({"hits": {"hits": hits, "total": len(hits)}})
@@ -30,9 +30,11 @@ except AttributeError:
 
     security.safe_str_cmp = hmac.compare_digest
 
+import threading
 from collections import namedtuple
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer
 from io import BytesIO
 from unittest import mock
 
@@ -117,7 +119,7 @@ from invenio_rdm_records.services.request_policies import (
 )
 
 from .fake_crossref_client import FakeCrossrefClient
-from .fake_datacite_client import FakeDataCiteClient
+from .fake_datacite_client import DataCiteHandler, FakeDataCiteClient
 
 
 class UserPreferencesNotificationsSchema(UserPreferencesSchema):
@@ -167,6 +169,34 @@ def mock_datacite_client():
     return FakeDataCiteClient
 
 
+@pytest.fixture()
+def datacite_server():
+    """Run a local stand-in DataCite server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DataCiteHandler)
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def datacite_providers(running_app, datacite_server, monkeypatch):
+    """Point the DataCite providers of the records service to the local server.
+
+    The pooled API clients of the providers are built anew, from the config.
+    """
+    config = running_app.app.config
+    monkeypatch.setitem(config, "DATACITE_TEST_MODE", False)
+    monkeypatch.setitem(config, "DATACITE_URL", datacite_server.url)
+    service = current_rdm_records_service
+    for manager in (service.pids.pid_manager, service.pids.parent_pid_manager):
+        provider = manager._get_provider("doi", "datacite")
+        monkeypatch.setattr(provider.client, "_pooled_api", None)
+
+
 @pytest.fixture(scope="module")
 def app_config(app_config, mock_datacite_client):
     """Override pytest-invenio app_config fixture.
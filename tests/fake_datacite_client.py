@@ -3,6 +3,8 @@
 
 """DataCite DOI Client."""
 
+import json
+from http.server import BaseHTTPRequestHandler
 from unittest.mock import Mock
 
 from idutils import normalize_doi
@@ -131,3 +133,36 @@ class FakeDataCiteClient(providers.DataCiteClient):
                 self.cfg("test_mode", True),
             )
         return self._api
+
+
+class DataCiteHandler(BaseHTTPRequestHandler):
+    """Local stand-in for the DataCite REST API."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self, status, doi):
+        body = json.dumps(
+            {"data": {"id": doi, "attributes": {"url": "https://example.org"}}}
+        ).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/vnd.api+json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, status):
+        length = int(self.headers.get("Content-Length", 0))
+        data = json.loads(self.rfile.read(length) or b"{}")
+        self.server.requests.append(
+            (self.command, self.path, data, self.client_address[1])
+        )
+        self._respond(status, self.path.split("/dois/")[-1])
+
+    def do_PUT(self):
+        self._handle(200)
+
+    def do_POST(self):
+        self._handle(201)
+
+    def log_message(self, *args):
+        pass
@@ -17,6 +17,7 @@ from invenio_vocabularies.proxies import current_service as vocabulary_service
 from sqlalchemy.exc import NoResultFound
 
 from invenio_rdm_records.fixtures import RecordsFixture, create_demo_record
+from invenio_rdm_records.fixtures.bulk import VocabularyRecordsLoader, chunked
 from invenio_rdm_records.fixtures.communities import CommunitiesFixture
 from invenio_rdm_records.fixtures.users import UsersFixture
 from invenio_rdm_records.fixtures.vocabularies import (
@@ -53,6 +54,42 @@ def test_load_languages(app, db, search_clear):
     assert item.id == "aae"
 
 
+def test_load_vocabulary_in_batches(app, db, search_clear, monkeypatch):
+    id_ = "languages"
+    languages = GenericVocabularyEntry(
+        Path(__file__).parent / "data",
+        id_,
+        {"pid-type": "lng", "data-file": "vocabularies/languages.yaml"},
+    )
+    monkeypatch.setitem(app.config, "RDM_FIXTURES_VOCABULARIES_BATCH_SIZE", 2)
+
+    languages.load(system_identity, delay=False)
+    item = vocabulary_service.read(system_identity, (id_, "aae"))
+    assert item.id == "aae"
+
+    # loading again updates the existing entries
+    entries = list(languages.iterate(set()))
+    loader = VocabularyRecordsLoader("vocabularies")
+    for batch in chunked(entries, 2):
+        loader.load(batch)
+    assert loader.created == 0
+    assert loader.updated == len(entries)
+    assert loader.errors == 0
+
+    # an invalid entry is skipped without aborting the rest of its batch
+    loader = VocabularyRecordsLoader("vocabularies")
+    loader.load(
+        [
+            {"id": "new", "type": id_, "title": {"en": "New"}},
+            {"id": "invalid", "type": id_, "title": "Invalid"},
+            {"id": "new", "type": id_, "title": {"en": "Newer"}},
+        ]
+    )
+    assert (loader.created, loader.updated, loader.errors) == (1, 1, 1)
+    item = vocabulary_service.read(system_identity, (id_, "new"))
+    assert item.data["title"] == {"en": "Newer"}
+
+
 def test_load_resource_types(app, db, search_clear):
     id_ = "resourcetypes"
     resource_types = GenericVocabularyEntry(
@@ -6,6 +6,12 @@
 import itertools
 
 from flask import url_for
+from invenio_access.permissions import system_identity
+from invenio_search import current_search_client
+
+from invenio_rdm_records import oai
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_rdm_records.records import RDMRecord
 
 
 def test_identify(running_app, client, search_clear):
@@ -89,3 +95,65 @@ def test_harvest(running_app, client, record_factory, search_clear):
         assert f"<identifier>{oai_id}</identifier>" in resp.text
         if record["id"] == community_record["id"]:
             assert "<setSpec>community-blr</setSpec>" in resp.text
+
+
+def test_harvest_cached_formats(
+    running_app, client, record_factory, search_clear, monkeypatch
+):
+    """Test harvesting records with pre-rendered metadata formats."""
+    cached_formats = ["oai_dc", "marcxml", "dcat", "datacite", "oai_datacite"]
+    monkeypatch.setitem(
+        running_app.app.config, "RDM_OAI_PMH_CACHED_FORMATS", cached_formats
+    )
+    record = record_factory.create_record(community=None, file="test.txt")
+    RDMRecord.index.refresh()
+
+    # the formats are only pre-rendered for the indexed document
+    assert "oai_cache" not in RDMRecord.get_record(record.id).dumps()
+    dump = current_search_client.get(
+        index=RDMRecord.index.search_alias, id=str(record.id)
+    )["_source"]
+    assert dump["oai_cache"]["version_id"] == dump["version_id"]
+    assert sorted(dump["oai_cache"]["formats"]) == sorted(cached_formats)
+    assert "oai_cache" not in RDMRecord.loads(dump)
+
+    # the pre-rendered formats are not returned by the records search
+    hits = current_rdm_records_service.search(system_identity)._results
+    assert all("oai_cache" not in hit.to_dict() for hit in hits)
+
+    oai_id = f"oai:inveniordm:{record['id']}"
+    for metadata_format in cached_formats:
+        resp = client.get(
+            url_for(
+                "invenio_oaiserver.response",
+                verb="GetRecord",
+                metadataPrefix=metadata_format,
+                identifier=oai_id,
+            )
+        )
+        assert resp.status_code == 200
+        assert f"<identifier>{oai_id}</identifier>" in resp.text
+
+    # the search hits of a harvest are served from the pre-rendered formats
+    def fail(*args, **kwargs):
+        raise AssertionError("The metadata format should not be rendered.")
+
+    for name in [
+        "render_dublincore",
+        "render_marcxml",
+        "render_dcat",
+        "render_datacite",
+        "render_oai_datacite",
+    ]:
+        monkeypatch.setattr(oai, name, fail)
+
+    for metadata_format in cached_formats:
+        resp = client.get(
+            url_for(
+                "invenio_oaiserver.response",
+                verb="ListRecords",
+                metadataPrefix=metadata_format,
+            )
+        )
+        assert resp.status_code == 200
+        assert f"<identifier>{oai_id}</identifier>" in resp.text
@@ -3,6 +3,7 @@
 
 """Test record."""
 
+from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.records.api import RDMDraft, RDMRecord
 
 
@@ -22,3 +23,34 @@ def test_idempotence_dumps_loads(running_app, minimal_record):
     draft = RDMDraft.create(minimal_record)
     loaded_draft = RDMDraft.loads(draft.dumps())
     assert dict(draft) == dict(loaded_draft)
+
+
+def test_versions_navigation(running_app, search_clear, minimal_record):
+    """Navigate the published versions of parents."""
+    service = current_rdm_records.records_service
+    identity = running_app.superuser_identity
+
+    draft = service.create(identity, minimal_record)
+    v1 = service.publish(identity, draft.id)
+    draft = service.new_version(identity, v1.id)
+    draft_data = draft.data
+    draft_data["metadata"]["publication_date"] = "2023-01-01"
+    draft = service.update_draft(identity, draft.id, data=draft_data)
+    v2 = service.publish(identity, draft.id)
+    other = service.publish(identity, service.create(identity, minimal_record).id)
+
+    record = RDMRecord.pid.resolve(v2.id)
+    parent = record.parent
+    assert RDMRecord.get_previous_published_by_parent(parent).pid.pid_value == v1.id
+    # the latest version is excluded
+    next_latest = RDMRecord.next_latest_published_record_by_parent(parent)
+    assert next_latest.pid.pid_value == v1.id
+
+    other_parent = RDMRecord.pid.resolve(other.id).parent
+    latest = RDMRecord.get_latest_published_by_parents([parent, other_parent])
+    assert {id_: r.pid.pid_value for id_, r in latest.items()} == {
+        parent.id: v2.id,
+        other_parent.id: other.id,
+    }
+    assert RDMRecord.get_previous_published_by_parent(other_parent) is None
+    assert RDMRecord.next_latest_published_record_by_parent(other_parent) is None
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Bulk indexer prefetching tests."""
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.dumpers import RelationsCache
+from invenio_rdm_records.records.stats import Statistics
+from invenio_rdm_records.records.systemfields.access.owners import Owner
+from invenio_rdm_records.records.systemfields.is_verified import IsVerifiedField
+
+STATS = {
+    "this_version": {
+        "views": 3,
+        "unique_views": 2,
+        "downloads": 1,
+        "unique_downloads": 1,
+        "data_volume": 1024,
+    },
+    "all_versions": {
+        "views": 6,
+        "unique_views": 4,
+        "downloads": 2,
+        "unique_downloads": 2,
+        "data_volume": 2048,
+    },
+}
+
+
+def _publish(identity, data):
+    service = current_rdm_records.records_service
+    draft = service.create(identity, data)
+    record = service.publish(identity, draft.id)
+    return service.record_cls.pid.resolve(record.id)
+
+
+def test_bulk_stats_fallback(running_app, minimal_record, superuser_identity):
+    """Records without statistics (or without stats indices) get zeros."""
+    record = _publish(superuser_identity, minimal_record)
+
+    stats = Statistics.get_records_stats([record["id"]], [record.parent["id"]])
+
+    assert stats[record["id"]]["this_version"]["views"] == 0
+    assert stats[record["id"]]["all_versions"]["data_volume"] == 0
+
+
+def test_dumper_uses_prefetched_stats(
+    running_app, minimal_record, superuser_identity, monkeypatch
+):
+    """The statistics dumper reads from the prefetched statistics."""
+    record = _publish(superuser_identity, minimal_record)
+
+    def get_records_stats(cls, recids, parent_recids):
+        return {recid: STATS for recid in recids}
+
+    def get_record_stats(cls, recid, parent_recid):
+        raise AssertionError("Statistics should have been prefetched.")
+
+    monkeypatch.setattr(Statistics, "get_records_stats", classmethod(get_records_stats))
+    monkeypatch.setattr(Statistics, "get_record_stats", classmethod(get_record_stats))
+
+    with Statistics.prefetch([record]):
+        dump = record.dumps()
+
+    assert dump["stats"] == STATS
+    assert Statistics.get_prefetched_stats(record["id"]) is None
+
+
+def test_relations_prefetched(running_app, minimal_record, superuser_identity):
+    """Relations are dereferenced from the cache shared by the bulk operation."""
+    minimal_record["metadata"]["languages"] = [{"id": "eng"}]
+    records = [
+        current_rdm_records.records_service.record_cls.get_record(
+            _publish(superuser_identity, minimal_record).id
+        )
+        for _ in range(2)
+    ]
+
+    with RelationsCache.scope() as cache:
+        cache.prefetch(records)
+        dumps = [record.dumps() for record in records]
+
+    for dump in dumps:
+        assert dump["metadata"]["languages"][0]["title"]["en"] == "English"
+        assert dump["metadata"]["resource_type"]["title"]["en"] == "Photo"
+    stats = cache.stats()
+    assert stats["languages"] == {"hits": 2, "misses": 0, "hit_ratio": 1.0}
+    assert stats["resource_type"]["misses"] == 0
+    assert RelationsCache.current() is None
+
+
+def test_owners_verification_prefetched(
+    running_app, minimal_record, uploader, monkeypatch
+):
+    """The verification of the owners is read from the prefetched users."""
+    record = _publish(uploader.identity, minimal_record)
+    parent = record.parent
+
+    verified = uploader.user.verified_at is not None
+
+    with IsVerifiedField.prefetch([parent]) as prefetched:
+        assert prefetched == {str(uploader.id): verified}
+
+        def resolve(self, raise_exc=False):
+            raise AssertionError("The owner should have been prefetched.")
+
+        monkeypatch.setattr(Owner, "resolve", resolve)
+        assert parent.dumps()["is_verified"] is verified
+        assert parent.is_verified is verified
@@ -1,11 +1,19 @@
 # SPDX-FileCopyrightText: 2025 TU Wien.
 # SPDX-License-Identifier: MIT
 
+from io import BytesIO
+
 from invenio_access.permissions import system_identity
+from invenio_accounts.models import User
 from invenio_db import db
 
 from invenio_rdm_records.proxies import current_rdm_records_service as records_service
-from invenio_rdm_records.records.models import RDMRecordQuota, RDMUserQuota
+from invenio_rdm_records.proxies import current_rdm_records_storage_service
+from invenio_rdm_records.records.models import (
+    RDMParentStorageUsage,
+    RDMRecordQuota,
+    RDMUserQuota,
+)
 
 
 def test_user_quota(app, identity_simple, minimal_record, location, resource_type_v):
@@ -81,3 +89,50 @@ def test_record_quota(app, identity_simple, minimal_record, location, resource_t
     draft = records_service.new_version(identity_simple, draft.pid.pid_value)._obj
     assert draft.bucket.quota_size == 1337
     assert draft.bucket.max_file_size == 420
+
+
+def test_storage_usage(app, identity_simple, minimal_record, location, resource_type_v):
+    """Test the storage usage accounting of the records."""
+    storage_service = current_rdm_records_storage_service
+    data = minimal_record.copy()
+    data["files"] = {"enabled": True}
+    draft = records_service.create(identity_simple, data)
+
+    # the usage is updated when the file is committed
+    records_service.draft_files.init_files(
+        identity_simple, draft.id, data=[{"key": "test.txt"}]
+    )
+    records_service.draft_files.set_file_content(
+        identity_simple, draft.id, "test.txt", BytesIO(b"test file")
+    )
+    records_service.draft_files.commit_file(identity_simple, draft.id, "test.txt")
+
+    # the usage is committed together with the file
+    parent_id = draft._record.parent.id
+    db.session.rollback()
+    usage = RDMParentStorageUsage.query.get(parent_id)
+    assert usage.user_id == identity_simple.id
+    assert usage.used_bytes == 9
+    assert storage_service.compute_usage([parent_id]) == {parent_id: 9}
+
+    top = storage_service.get_top_consumers(size=10)
+    assert top[0]["user_id"] == identity_simple.id
+    assert top[0]["used_bytes"] == 9
+    assert top[0]["records"] == 1
+
+    # only the records with a quota increase are listed
+    user = db.session.get(User, identity_simple.id)
+    assert storage_service.get_user_storage_usage(user)["entries"] == []
+    records_service.set_quota(
+        system_identity, draft.id, {"quota_size": 2000000, "max_file_size": 420}
+    )
+    result = storage_service.get_user_storage_usage(user)
+    assert result["total_extra"] == 1000000
+    (entry,) = result["entries"]
+    assert entry["item"]["id"] == draft.id
+    assert entry["used_bytes"] == 9
+
+    # a rebuild gives the same result
+    db.session.delete(usage)
+    storage_service.rebuild_usage()
+    assert RDMParentStorageUsage.query.get(parent_id).used_bytes == 9
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tiles processor tests."""
+
+from copy import deepcopy
+from io import BytesIO
+from types import SimpleNamespace
+
+from flask import Flask
+
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_rdm_records.records.api import RDMRecord
+from invenio_rdm_records.records.processors.tiles import TilesProcessor
+from invenio_rdm_records.services.iiif.storage import tiles_storage
+from invenio_rdm_records.services.iiif.tasks import (
+    generate_tiles_batch,
+    tiles_progress,
+)
+
+
+class _UnitOfWork:
+    def __init__(self):
+        self.operations = []
+
+    def register(self, op):
+        self.operations.append(op)
+
+
+class _Converter:
+    def convert(self, in_stream, out_stream):
+        out_stream.write(b"tiles")
+        return True
+
+
+def test_tiles_generated_in_batches(mocker):
+    """One tiles generation task is sent per batch of files."""
+    task_op = mocker.patch("invenio_rdm_records.records.processors.tiles.TaskOp")
+    app = Flask(__name__)
+    app.config["IIIF_TILES_BATCH_SIZE"] = 2
+    uow = _UnitOfWork()
+    files = [("a.png", "files"), ("b.png", "files"), ("c.png", "media_files")]
+
+    with app.app_context():
+        TilesProcessor()._generate_tiles({"id": "abcd-1234"}, files, uow)
+
+    assert task_op.call_args_list == [
+        mocker.call(generate_tiles_batch, record_id="abcd-1234", files=files[:2]),
+        mocker.call(generate_tiles_batch, record_id="abcd-1234", files=files[2:]),
+    ]
+    assert len(uow.operations) == 2
+
+
+def test_can_process_file():
+    """Only the files with pending or finished tiles are skipped."""
+    processor = TilesProcessor()
+    app = Flask(__name__)
+
+    def can_process(key, **processor_dict):
+        file_record = SimpleNamespace(
+            key=key,
+            file=SimpleNamespace(ext=key.rsplit(".", 1)[-1]),
+            processor=processor_dict or None,
+        )
+        with app.app_context():
+            return processor._can_process_file(file_record, None, None)
+
+    assert can_process("a.png")
+    assert can_process("a.pdf.first-page.png", type="first-page", status="finished")
+    assert can_process("a.png", type="image-tiles", status="failed")
+    assert not can_process("a.png", type="image-tiles", status="init")
+    assert not can_process("a.png", type="image-tiles", status="finished")
+    assert not can_process("a.txt")
+
+
+def test_generate_tiles_batch(
+    running_app, search_clear, minimal_record, superuser_identity, tmp_path, monkeypatch
+):
+    """The statuses of a batch are updated, with the progress of the record."""
+    config = running_app.app.config
+    monkeypatch.setitem(config, "IIIF_TILES_GENERATION_ENABLED", True)
+    monkeypatch.setitem(config, "IIIF_TILES_BATCH_SIZE", 2)
+    monkeypatch.setitem(config, "IIIF_TILES_STORAGE_BASE_PATH", str(tmp_path))
+    monkeypatch.setattr(tiles_storage, "_converter", _Converter())
+
+    service = current_rdm_records_service
+    data = deepcopy(minimal_record)
+    data["files"] = {"enabled": True}
+    draft = service.create(superuser_identity, data)
+    keys = ["a.png", "b.png", "c.png"]
+    for key in keys:
+        service.draft_files.init_files(superuser_identity, draft.id, [{"key": key}])
+        service.draft_files.set_file_content(
+            superuser_identity, draft.id, key, BytesIO(b"image")
+        )
+        service.draft_files.commit_file(superuser_identity, draft.id, key)
+    service.publish(superuser_identity, draft.id)
+
+    record = RDMRecord.pid.resolve(draft.id)
+    processors = {key: record.media_files[f"{key}.ptif"].processor for key in keys}
+    assert {p["status"] for p in processors.values()} == {"finished"}
+    # each batch stores the progress of the record at its commit
+    assert processors["a.png"]["progress"] == {"done": 2, "total": 3}
+    assert processors["b.png"]["progress"] == {"done": 2, "total": 3}
+    assert processors["c.png"]["progress"] == {"done": 3, "total": 3}
+    assert tiles_progress(record) == {"done": 3, "total": 3}
+    assert (tmp_path / "public").exists()
@@ -13,8 +13,14 @@ from invenio_requests.proxies import (
     current_requests_service,
     current_user_moderation_service,
 )
+from invenio_requests.records.models import RequestEventModel
 
 from invenio_rdm_records.proxies import current_rdm_records_service as records_service
+from invenio_rdm_records.records.api import RDMDraft
+from invenio_rdm_records.requests.user_moderation.tasks import (
+    delete_records,
+    restore_records,
+)
 
 
 class MockRequestModerationTask(Task):
@@ -126,6 +132,89 @@ def test_user_moderation_decline(
     assert record._record.deletion_status.is_deleted
     assert record._record.tombstone is not None
 
+    # The progress of the deletion is logged on the moderation request
+    events = RequestEventModel.query.filter_by(
+        request_id=mod_request["id"], type="L"
+    ).all()
+    payloads = [event.json["payload"] for event in events]
+    assert any(p["event"] == "records_deleted" for p in payloads)
+
+
+def test_delete_and_restore_records_in_batch(running_app, search_clear, minimal_record):
+    """Test the soft-deletion and restoration of a batch of records."""
+    recids = []
+    for _ in range(3):
+        draft = records_service.create(system_identity, minimal_record)
+        recids.append(records_service.publish(system_identity, draft.id).id)
+
+    tombstone_data = {"note": "spam"}
+    records_service.delete_record(system_identity, recids[0], tombstone_data)
+
+    res = records_service.delete_records(system_identity, recids, tombstone_data)
+    assert res == {"deleted": 2, "skipped": 1}
+    for recid in recids:
+        record = records_service.read(system_identity, recid, include_deleted=True)
+        assert record._record.deletion_status.is_deleted
+        assert record._record.tombstone.note == "spam"
+
+    res = records_service.restore_records(system_identity, recids[1:])
+    assert res == {"restored": 2, "skipped": 0}
+    for recid in recids[1:]:
+        record = records_service.read(system_identity, recid)
+        assert not record._record.deletion_status.is_deleted
+        assert record._record.tombstone is None
+
+
+def test_delete_and_restore_versions_in_batch(
+    running_app, search_clear, minimal_record
+):
+    """Test a batch with several versions of the same record."""
+    draft = records_service.create(system_identity, minimal_record)
+    versions = [records_service.publish(system_identity, draft.id)]
+    for _ in range(2):
+        draft = records_service.new_version(system_identity, versions[-1].id)
+        records_service.update_draft(system_identity, draft.id, minimal_record)
+        versions.append(records_service.publish(system_identity, draft.id))
+    v1, v2, v3 = [v.id for v in versions]
+    # an ongoing edit of the first version
+    records_service.edit(system_identity, v1)
+
+    res = records_service.delete_records(system_identity, [v3, v2], {"note": "spam"})
+    assert res == {"deleted": 2, "skipped": 0}
+    latest = records_service.read_latest(system_identity, v1)
+    assert latest.id == v1
+    # the draft of the new latest version is still indexed
+    RDMDraft.index.refresh()
+    drafts = records_service.search_drafts(system_identity, q=f"id:{v1}")
+    assert drafts.total == 1
+
+    res = records_service.restore_records(system_identity, [v2, v3])
+    assert res == {"restored": 2, "skipped": 0}
+    latest = records_service.read_latest(system_identity, v1)
+    assert latest.id == v3
+
+
+def test_delete_and_restore_records_hide_dois(
+    running_app, search_clear, minimal_record, datacite_server, datacite_providers
+):
+    """Test that the DOIs are hidden and shown once the batch is committed."""
+    draft = records_service.create(system_identity, minimal_record)
+    record = records_service.publish(system_identity, draft.id)
+    doi = record["pids"]["doi"]["identifier"]
+
+    delete_records([record.id], {"note": "spam"})
+    requests = {path: data for _, path, data, _ in datacite_server.requests}
+    assert requests[f"/dois/{doi}"]["data"]["attributes"]["event"] == "hide"
+    record = records_service.read(system_identity, record.id, include_deleted=True)
+    assert record._record.deletion_status.is_deleted
+
+    datacite_server.requests.clear()
+    restore_records([record.id])
+    requests = {path: data for _, path, data, _ in datacite_server.requests}
+    assert requests[f"/dois/{doi}"]["data"]["attributes"]["event"] == "publish"
+    record = records_service.read(system_identity, record.id)
+    assert not record._record.deletion_status.is_deleted
+
 
 def test_is_verified_system_user(running_app, minimal_record):
     """Test is_verified when create is system user."""
@@ -13,7 +13,11 @@ from invenio_rdm_records.resources.serializers import (
     CSLJSONSerializer,
     StringCitationSerializer,
 )
-from invenio_rdm_records.resources.serializers.csl import get_citation_string
+from invenio_rdm_records.resources.serializers.csl import (
+    CitationsCache,
+    get_citation_string,
+    get_citation_strings,
+)
 from invenio_rdm_records.resources.serializers.csl.schema import CSLJSONSchema
 
 
@@ -170,3 +174,37 @@ def test_citation_string_serializer_empty_record(running_app, empty_record):
     serialized_record = serializer.dump(empty_record)
 
     assert serialized_record == expected_data
+
+
+def test_citation_strings_batched(appctx, monkeypatch):
+    """Test that the citations are rendered in one bibliography, with cached styles."""
+    cache = CitationsCache()
+    monkeypatch.setattr(current_rdm_records, "citations_cache", cache)
+    style = get_style_filepath("ieee")
+
+    def entries():
+        return [
+            (
+                {
+                    "id": f"abcde-{i}",
+                    "type": "dataset",
+                    "title": f"Dataset {i}",
+                    "author": [{"family": "Doe", "given": "Jane"}],
+                    "issued": {"date-parts": [[2020]]},
+                    "DOI": f"10.1234/abcde-{i}",
+                    "_extras": {"links": {"doi": f"https://doi.test/abcde-{i}"}},
+                },
+                f"abcde-{i}",
+            )
+            for i in range(3)
+        ]
+
+    citations = get_citation_strings(entries(), style, "en-US")
+    assert [c[:3] for c in citations] == ["[1]", "[2]", "[3]"]
+    assert "Dataset 2" in citations[2]
+    assert cache.styles.stats()["misses"] == 1
+
+    # the parsed style is reused
+    json, id_ = entries()[1]
+    assert get_citation_string(json, id_, style, "en-US").startswith("[1]")
+    assert cache.styles.stats()["hits"] == 1
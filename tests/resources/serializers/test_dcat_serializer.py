@@ -3,7 +3,12 @@
 
 """Resources serializers tests."""
 
+import threading
+
+from lxml import etree
+
 from invenio_rdm_records.resources.serializers import DCATSerializer
+from invenio_rdm_records.resources.serializers.dcat import get_dcat_xslt
 
 
 def test_dcat_serializer(running_app, full_record_to_dict):
@@ -252,3 +257,33 @@ def test_dcat_serializer(running_app, full_record_to_dict):
     serializer = DCATSerializer()
     serialized_record = serializer.serialize_object(full_record_to_dict)
     assert serialized_record == expected_data
+
+
+def test_dcat_serializer_dump_etree(running_app, full_record_to_dict):
+    """The etree is the same as the one parsed from the serialized string."""
+    serializer = DCATSerializer()
+    parser = etree.XMLParser(remove_blank_text=True)
+    expected = etree.fromstring(
+        serializer.serialize_object(full_record_to_dict).encode("utf-8"), parser
+    )
+
+    root = serializer.dump_etree(full_record_to_dict)
+    # the XSLT output can hold whitespace-only text nodes
+    root = etree.fromstring(etree.tostring(root), parser)
+
+    assert etree.tostring(root) == etree.tostring(expected)
+
+
+def test_dcat_xslt_precompiled():
+    """Test that the XSLT is compiled once per thread."""
+    main_xslt = DCATSerializer().xslt_transform_func
+    assert DCATSerializer().xslt_transform_func is main_xslt
+
+    thread_xslts = []
+    thread = threading.Thread(
+        target=lambda: thread_xslts.append(get_dcat_xslt()),
+    )
+    thread.start()
+    thread.join()
+    assert thread_xslts[0] is not main_xslt
+    assert isinstance(thread_xslts[0], etree.XSLT)
@@ -5,11 +5,14 @@
 
 import pytest
 
+from invenio_rdm_records.oai import get_serializer
+from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.resources.serializers.dublincore import (
     DublinCoreJSONSerializer,
     DublinCoreXMLSerializer,
 )
 from invenio_rdm_records.resources.serializers.errors import VocabularyItemNotFoundError
+from invenio_rdm_records.resources.serializers.utils import VocabularyPropsCache
 
 
 @pytest.fixture(scope="function")
@@ -105,6 +108,54 @@ def test_vocabulary_type_error(running_app, updated_minimal_record):
         DublinCoreJSONSerializer().dump_obj(updated_minimal_record)
 
 
+def test_vocabulary_props_cached(running_app, updated_minimal_record):
+    """Test that vocabulary props are served from the process-local cache."""
+    cache = current_rdm_records.vocabulary_props_cache
+    cache.invalidate()
+
+    serializer = DublinCoreJSONSerializer()
+    expected = serializer.dump_obj(updated_minimal_record)
+    misses = cache.stats()["misses"]
+
+    assert serializer.dump_obj(updated_minimal_record) == expected
+    assert cache.stats()["misses"] == misses
+    assert cache.stats()["hits"] > 0
+
+
+def test_vocabulary_props_cache_lookups():
+    """Test that the items missing from the cached props are looked up once."""
+    reads = []
+
+    class Cache(VocabularyPropsCache):
+        def _read(self, vocabulary, fields, extra_filter="", max_records=150):
+            reads.append(extra_filter)
+            items = {"a": {"x": "1"}, "b": {"x": "2"}}
+            if not extra_filter:
+                return {"a": items["a"]}
+            id_ = extra_filter.to_dict()["term"]["id"]
+            return {id_: items[id_]} if id_ in items else {}
+
+    cache = Cache()
+    props_map = cache._cache.get_or_set(
+        ("languages", ("props.x",)),
+        lambda: cache._read("languages", ["props.x"]),
+    )
+
+    for _ in range(2):
+        assert cache.get("languages", ["props.x"], "a") == {"x": "1"}
+        assert cache.get("languages", ["props.x"], "b") == {"x": "2"}
+        assert cache.get("languages", ["props.x"], "c") is None
+
+    # the item and the missing id are only looked up the first time
+    assert len(reads) == 3
+    # the previously cached map is not mutated
+    assert props_map == {"a": {"x": "1"}}
+
+    cache.invalidate("languages")
+    assert cache.get("languages", ["props.x"], "c") is None
+    assert len(reads) == 5
+
+
 def test_dublincorexml_serializer(running_app, full_record_to_dict):
     """Test serializer to Dublin Core XML"""
     expected_data = (
@@ -230,3 +281,13 @@ def test_dublincorexml_serializer_list(
 
     for ed in expected_data_minimal:
         assert ed in serialized_records
+
+
+def test_oai_serializers_registry():
+    """Test that the OAI-PMH renderers reuse the serializer instances."""
+    serializer = get_serializer(DublinCoreXMLSerializer)
+    assert get_serializer(DublinCoreXMLSerializer) is serializer
+    assert get_serializer(DublinCoreJSONSerializer) is not serializer
+    assert get_serializer(DublinCoreXMLSerializer).object_schema is (
+        serializer.object_schema
+    )
@@ -313,3 +313,74 @@ def test_iiif_image_api(
         )
         assert response.status_code == 200
         assert response.headers["Content-Disposition"] == f"attachment; filename={name}"
+
+
+def test_iiif_image_api_cache(
+    running_app, search_clear, client, uploader, headers, minimal_record, tmp_path
+):
+    """Derivatives are cached, and conditional requests are answered."""
+    app = running_app.app
+    service = app.extensions["invenio-rdm-records"].iiif_service
+    app.config["IIIF_DERIVATIVES_CACHE_ENABLED"] = True
+    app.config["IIIF_DERIVATIVES_CACHE_BASE_PATH"] = str(tmp_path)
+    service.__dict__.pop("derivatives_cache", None)
+
+    try:
+        client = uploader.login(client)
+        file_id = "test_image.png"
+        recid = publish_record_with_images(client, file_id, minimal_record, headers)
+        url = f"/iiif/record:{recid}:{file_id}/full/!100,100/0/default.png"
+
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        last_modified = response.headers["Last-Modified"]
+        assert len(list(tmp_path.glob("*/*"))) == 1
+
+        # served from the cache
+        cached_response = client.get(url)
+        assert cached_response.status_code == 200
+        assert cached_response.data == response.data
+        assert cached_response.headers["ETag"] == etag
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        response = client.get(url, headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+    finally:
+        app.config["IIIF_DERIVATIVES_CACHE_ENABLED"] = False
+        service.__dict__.pop("derivatives_cache", None)
+
+
+def test_iiif_image_api_pdf_first_page(
+    running_app, search_clear, client, uploader, headers, minimal_record, monkeypatch
+):
+    """The first page of PDFs is rasterized once, and stored as a media file."""
+    from invenio_rdm_records.services.iiif import service, tasks
+
+    first_page = BytesIO()
+    Image.new("RGB", (100, 150), (255, 0, 0)).save(first_page, "png")
+    calls = []
+
+    def _rasterize(in_stream, max_memory):
+        calls.append(max_memory)
+        return first_page.getvalue()
+
+    monkeypatch.setattr(service, "HAS_VIPS", True)
+    monkeypatch.setattr(service, "rasterize_first_page", _rasterize)
+    monkeypatch.setattr(tasks, "rasterize_first_page", _rasterize)
+
+    client = uploader.login(client)
+    file_id = "test.pdf"
+    recid = publish_record_with_images(client, file_id, minimal_record, headers)
+    url = f"/iiif/record:{recid}:{file_id}/full/full/0/default.png"
+
+    # rasterized for the response, and in the task storing the first page
+    response = client.get(url)
+    assert response.status_code == 200
+    assert len(calls) == 2
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert Image.open(BytesIO(response.data)).size == (100, 150)
+    assert len(calls) == 2
@@ -3,8 +3,14 @@
 
 """RO-Crate resource tests."""
 
+import json
+
 import pytest
 
+from invenio_rdm_records.resources.deserializers.rocrate import (
+    ROCrateJSONDeserializer,
+)
+
 
 @pytest.fixture
 def headers(headers):
@@ -15,6 +21,94 @@ def headers(headers):
     }
 
 
+@pytest.fixture(scope="module")
+def large_rocrate():
+    """RO-Crate of a dataset with 50k file entities, sharing their authors."""
+    num_files = 50000
+    authors = [
+        {
+            "@id": f"#author-{i}",
+            "@type": "Person",
+            "familyName": [f"Family {i}"],
+            "givenName": ["Given"],
+            "affiliation": [{"@id": "https://ror.org/01ggx4157"}],
+        }
+        for i in range(10)
+    ]
+    files = [
+        {
+            "@id": f"data/file-{i}.csv",
+            "@type": "File",
+            "name": f"file-{i}.csv",
+            "author": [{"@id": f"#author-{i % 10}"}],
+        }
+        for i in range(num_files)
+    ]
+    graph = [
+        {
+            "@id": "ro-crate-metadata.json",
+            "@type": "CreativeWork",
+            "about": {"@id": "./"},
+            "conformsTo": {"@id": "https://w3id.org/ro/crate/1.1"},
+        },
+        {
+            "@id": "./",
+            "@type": "Dataset",
+            "name": "Large dataset",
+            "license": [{"@id": "#mit"}],
+            "datePublished": ["2026-01-01"],
+            "author": [{"@id": "#author-0"}],
+            "hasPart": [{"@id": f["@id"]} for f in files],
+        },
+        {"@id": "#mit", "@type": "CreativeWork", "name": "MIT"},
+        {
+            "@id": "https://ror.org/01ggx4157",
+            "@type": "Organization",
+            "name": "European Organization for Nuclear Research",
+        },
+        *authors,
+        *files,
+    ]
+    return json.dumps(
+        {"@context": "https://w3id.org/ro/crate/1.1/context", "@graph": graph}
+    )
+
+
+def test_rocrate_dereference_large(large_rocrate):
+    """Test that the entities of a large crate are resolved once and shared."""
+    graph = json.loads(large_rocrate)["@graph"]
+    dataset = ROCrateJSONDeserializer._dereference(graph)
+
+    parts = dataset["hasPart"]
+    assert len(parts) == 50000
+    assert parts[42]["name"] == "file-42.csv"
+    assert parts[42]["author"][0]["familyName"] == ["Family 2"]
+    # the same resolved author is shared by all the files referencing it
+    assert parts[2]["author"][0] is parts[42]["author"][0]
+    assert dataset["author"][0] is parts[0]["author"][0]
+    # the input graph is not modified
+    assert graph[1]["hasPart"][42] == {"@id": "data/file-42.csv"}
+
+    metadata = ROCrateJSONDeserializer().deserialize(large_rocrate)["metadata"]
+    assert metadata["title"] == "Large dataset"
+
+
+def test_rocrate_dereference_cycle():
+    """Test that the cyclic references are left as plain references."""
+    dataset = ROCrateJSONDeserializer._dereference(
+        [
+            {"@id": "./", "@type": "Dataset", "author": [{"@id": "#a"}]},
+            {"@id": "#a", "@type": "Person", "knows": {"@id": "#b"}},
+            {"@id": "#b", "@type": "Person", "knows": {"@id": "#a"}},
+        ]
+    )
+
+    author = dataset["author"][0]
+    assert author["@type"] == "Person"
+    assert author["knows"]["@type"] == "Person"
+    assert author["knows"]["knows"] == {"@id": "#a"}
+
+
 def test_rocrate_content_type(running_app, client_with_login, headers, search_clear):
     """Test draft creation via RO-Crate metadata payload."""
     client = client_with_login
@@ -8,7 +8,7 @@ from datetime import datetime, timedelta, timezone
 
 from invenio_db import db
 
-from invenio_rdm_records.secret_links.models import SecretLink
+from invenio_rdm_records.secret_links.models import SecretLink, verification_cache
 
 
 def test_secret_link_creation(app):
@@ -111,3 +111,52 @@ def test_secret_link_validate_token_expired(app):
         db.session.commit()
 
         assert not link.validate_token(link.token, expected_data={})
+
+
+def test_secret_link_validate_token_cache(app):
+    """Ensure that the token verification is cached until the link is revoked."""
+    with app.app_context():
+        link = SecretLink.create("view")
+        db.session.commit()
+        token = link.token
+
+        assert SecretLink.validate_token(token, {})
+        key = verification_cache.digest(token)
+        assert verification_cache.matches.get(key) is not None
+        assert verification_cache.links.get(key) == (True, None)
+
+        link.revoke()
+        db.session.commit()
+
+        assert verification_cache.links.get(key) is None
+        assert not SecretLink.validate_token(token, {})
+
+
+def test_secret_link_validate_token_cache_evicted_on_commit(app):
+    """Ensure that the token verification is evicted once the change is committed."""
+    with app.app_context():
+        link = SecretLink.create("view")
+        db.session.commit()
+        token = link.token
+        key = verification_cache.digest(token)
+
+        assert SecretLink.validate_token(token, {})
+        link.revoke()
+        # a concurrent request could still cache the committed link
+        assert verification_cache.links.get(key) == (True, None)
+        db.session.commit()
+        assert verification_cache.links.get(key) is None
+
+
+def test_secret_link_validate_token_cache_expiration_changed(app):
+    """Ensure that a shortened expiration date is seen right away."""
+    with app.app_context():
+        link = SecretLink.create("view")
+        db.session.commit()
+        token = link.token
+
+        assert SecretLink.validate_token(token, {})
+        link.expires_at = datetime.now(timezone.utc) - timedelta(minutes=10)
+        db.session.commit()
+
+        assert not SecretLink.validate_token(token, {})
@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""PIDs sync queue tests."""
+
+import pytest
+from invenio_access.permissions import system_identity
+from invenio_records_resources.services.uow import UnitOfWork
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.services.pids.providers.datacite import (
+    DataCiteClient,
+    DataCitePIDProvider,
+    PooledDataCiteRESTClient,
+)
+from invenio_rdm_records.services.pids.queue import RateLimiter, send_requests
+from invenio_rdm_records.services.pids.tasks import process_pids_sync_queue
+from invenio_rdm_records.services.pids.uow import PIDRegisterOrUpdateOp
+
+
+@pytest.fixture()
+def pooled_client(datacite_server):
+    """DataCite client sending its requests to the local server."""
+    return PooledDataCiteRESTClient(
+        "INVALID", "INVALID", "10.1234", test_mode=False, url=datacite_server.url
+    )
+
+
+def test_pooled_datacite_client(datacite_server, pooled_client):
+    """Test that the pooled client reuses its connection."""
+    pooled_client.update_doi(
+        "10.1234/abcd-1234", metadata={"titles": [{"title": "A"}]}, url="https://a"
+    )
+    pooled_client.hide_doi("10.1234/abcd-1234")
+
+    methods = [(method, path) for method, path, _, _ in datacite_server.requests]
+    assert methods == [("PUT", "/dois/10.1234/abcd-1234")] * 2
+    assert datacite_server.requests[1][2]["data"]["attributes"]["event"] == "hide"
+    # both requests went through the same connection
+    assert len({port for _, _, _, port in datacite_server.requests}) == 1
+
+
+def test_send_requests(appctx, datacite_server):
+    """Test that the requests are sent from the worker threads."""
+    client = DataCiteClient(
+        "datacite",
+        config_overrides={
+            "DATACITE_USERNAME": "INVALID",
+            "DATACITE_PASSWORD": "INVALID",
+            "DATACITE_PREFIX": "10.1234",
+            "DATACITE_TEST_MODE": False,
+            "DATACITE_URL": datacite_server.url,
+        },
+    )
+    provider = DataCitePIDProvider("datacite", client=client)
+    requests = [(provider, "hide_doi", {"doi": f"10.1234/abcd-{i}"}) for i in range(4)]
+
+    errors = send_requests(requests, concurrency=2)
+
+    assert errors == [None] * 4
+    paths = sorted(path for _, path, _, _ in datacite_server.requests)
+    assert paths == [f"/dois/10.1234/abcd-{i}" for i in range(4)]
+
+
+def test_rate_limiter():
+    """Test that the calls are evenly spaced."""
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+
+    limiter = RateLimiter(2, clock=lambda: now[0], sleep=sleep)
+    for _ in range(3):
+        limiter.acquire()
+    assert sleeps == [0.5, 1.0]
+
+    now[0] = 10.0
+    limiter.acquire()
+    assert sleeps == [0.5, 1.0]
+
+    # no limit
+    limiter = RateLimiter(None, sleep=sleep)
+    limiter.acquire()
+    assert sleeps == [0.5, 1.0]
+
+
+def test_register_or_update_many(
+    running_app,
+    search_clear,
+    minimal_record,
+    superuser_identity,
+    datacite_server,
+    datacite_providers,
+):
+    """Test that the pending updates of the same DOI are sent once."""
+    service = current_rdm_records.records_service
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+    recid = record["id"]
+    doi = record["pids"]["doi"]["identifier"]
+    parent_doi = record["parent"]["pids"]["doi"]["identifier"]
+
+    entries = [(recid, "doi", False)] * 3 + [(recid, "doi", True)] * 2
+    stats = service.pids.register_or_update_many(
+        system_identity, entries, concurrency=2
+    )
+
+    assert stats == {
+        "coalesced": 3,
+        "dispatched": 2,
+        "succeeded": 2,
+        "failed": 0,
+        "skipped": 0,
+    }
+    paths = sorted(path for _, path, _, _ in datacite_server.requests)
+    assert paths == sorted([f"/dois/{doi}", f"/dois/{parent_doi}"])
+    for _, _, data, _ in datacite_server.requests:
+        assert data["data"]["attributes"]["event"] == "publish"
+        assert data["data"]["attributes"]["titles"] == [{"title": "A Romans story"}]
+
+
+def test_pids_sync_queue(
+    running_app,
+    search_clear,
+    minimal_record,
+    superuser_identity,
+    datacite_server,
+    datacite_providers,
+    monkeypatch,
+    mocker,
+):
+    """Test that the queued PIDs are coalesced across messages, and requeued."""
+    monkeypatch.setitem(running_app.app.config, "RDM_PIDS_SYNC_QUEUE_ENABLED", True)
+    service = current_rdm_records.records_service
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+    recid = record["id"]
+    doi = record["pids"]["doi"]["identifier"]
+
+    queue = current_rdm_records.pids_sync_queue
+    process = mocker.spy(queue, "process")
+    # drain the messages published on publish
+    process_pids_sync_queue()
+    datacite_server.requests.clear()
+
+    def queue_updates():
+        with UnitOfWork() as uow:
+            for _ in range(3):
+                uow.register(PIDRegisterOrUpdateOp(recid, "doi"))
+            uow.commit()
+
+    # a failed batch is requeued, and synced by the next run
+    queue_updates()
+    sync = mocker.patch.object(
+        service.pids, "register_or_update_many", side_effect=Exception("down")
+    )
+    process_pids_sync_queue()
+    assert process.spy_return == {"requeued": 3}
+    assert datacite_server.requests == []
+    mocker.stop(sync)
+
+    process_pids_sync_queue()
+    assert process.spy_return == {
+        "coalesced": 2,
+        "dispatched": 1,
+        "succeeded": 1,
+        "failed": 0,
+        "skipped": 0,
+    }
+    assert [path for _, path, _, _ in datacite_server.requests] == [f"/dois/{doi}"]
+
+    # the queue is empty
+    process_pids_sync_queue()
+    assert process.spy_return == {}
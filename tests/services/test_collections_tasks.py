@@ -4,8 +4,11 @@
 """Test celery tasks of collections."""
 
 from copy import deepcopy
+from datetime import datetime, timedelta, timezone
 
 from invenio_collections.api import Collection, CollectionTree
+from invenio_search.proxies import current_search_client
+from invenio_stats.bookmark import BookmarkAPI
 
 from invenio_rdm_records.collections.tasks import update_collections_size
 
@@ -40,3 +43,74 @@ def test_update_collections_size(app, db, record_factory, minimal_record, commun
 
     collection = Collection.read(id_=collection.id)
     assert collection.num_records == 1
+
+
+def test_update_collections_size_skips_unchanged(
+    app, db, record_factory, minimal_record, community
+):
+    """Test that unchanged collections are only counted again when forced."""
+    tree = CollectionTree.create(
+        title="Tree 2",
+        order=10,
+        namespace_id=community.id,
+        slug="tree-2",
+    )
+    collection = Collection.create(
+        title="Other Collection",
+        search_query="metadata.title:bar",
+        slug="other-collection",
+        ctree=tree,
+    )
+    rec = deepcopy(minimal_record)
+    rec["metadata"]["title"] = "bar"
+    record_factory.create_record(record_dict=rec, community=community)
+
+    update_collections_size(force=True)
+    collection = Collection.read(id_=collection.id)
+    assert collection.num_records == 1
+
+    # neither the query nor the records changed, so the size is not counted again
+    model_cls = Collection.model_cls
+    db.session.execute(
+        model_cls.__table__.update()
+        .where(model_cls.id == collection.id)
+        .values(num_records=42, updated=model_cls.updated)
+    )
+    db.session.commit()
+    # move the last run after the creation of the record
+    bm = BookmarkAPI(current_search_client, "collections_size", "day")
+    bm.set_bookmark((datetime.now(timezone.utc) + timedelta(hours=1)).isoformat())
+    current_search_client.indices.refresh(index=bm.bookmark_index)
+
+    update_collections_size()
+    assert Collection.read(id_=collection.id).num_records == 42
+
+    update_collections_size(force=True)
+    assert Collection.read(id_=collection.id).num_records == 1
+
+
+def test_update_collections_size_failed(app, db, community, mocker):
+    """Test that the last run is not moved forward if a collection failed."""
+    tree = CollectionTree.create(
+        title="Tree 3",
+        order=10,
+        namespace_id=community.id,
+        slug="tree-3",
+    )
+    Collection.create(
+        title="Failing Collection",
+        search_query="metadata.title:baz",
+        slug="failing-collection",
+        ctree=tree,
+    )
+    set_bookmark = mocker.spy(BookmarkAPI, "set_bookmark")
+
+    update_collections_size(force=True)
+    assert set_bookmark.call_count == 1
+
+    mocker.patch(
+        "invenio_rdm_records.collections.tasks._count_search",
+        side_effect=Exception("boom"),
+    )
+    update_collections_size(force=True)
+    assert set_bookmark.call_count == 1
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""IIIF converter tests."""
+
+from io import BytesIO
+
+from invenio_rdm_records.services.iiif import converter
+
+
+class _Image:
+    """Stand-in for a Wand image, recording the memory limit it ran with."""
+
+    def __init__(self, blob=None, image=None):
+        self.sequence = [self]
+        self.memory = converter.limits["memory"]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def make_blob(self):
+        return f"png:{self.memory}".encode()
+
+
+def test_rasterize_first_page_restores_memory_limit(monkeypatch):
+    """The ImageMagick memory limit only applies to the rasterization."""
+    monkeypatch.setattr(converter, "HAS_VIPS", False)
+    monkeypatch.setattr(converter, "HAS_IMAGEMAGICK", True)
+    monkeypatch.setattr(converter, "Image", _Image, raising=False)
+    monkeypatch.setattr(converter, "limits", {"memory": 8000}, raising=False)
+
+    assert converter.rasterize_first_page(BytesIO(b"%PDF"), 100) == b"png:100"
+    assert converter.limits["memory"] == 8000
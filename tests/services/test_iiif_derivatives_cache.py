@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""IIIF derivatives cache tests."""
+
+import os
+
+from invenio_rdm_records.services.iiif.cache import (
+    DerivativesCache,
+    LocalDerivativesCache,
+)
+
+
+def test_derivatives_cache_key():
+    """The key depends on the checksum and on every parameter."""
+    params = ("md5:abc", "full", "full", "0", "default", "png")
+    key = DerivativesCache.make_key(*params)
+    assert key == DerivativesCache.make_key(*params)
+    for i in range(len(params)):
+        changed = list(params)
+        changed[i] += "x"
+        assert DerivativesCache.make_key(*changed) != key
+
+
+def test_local_derivatives_cache_lru(tmp_path):
+    """The least recently used derivatives are evicted first."""
+    cache = LocalDerivativesCache(base_path=str(tmp_path), max_size=30)
+    keys = [DerivativesCache.make_key(str(i), "", "", "", "", "") for i in range(3)]
+
+    assert cache.get(keys[0]) is None
+    cache.set(keys[0], b"0" * 10)
+    cache.set(keys[1], b"1" * 10)
+    # make the first derivative the least recently used one
+    path = cache._get_file_path(keys[1])
+    os.utime(path, (0, os.stat(path).st_mtime))
+
+    with cache.get(keys[0]) as fp:
+        assert fp.read() == b"0" * 10
+
+    # exceeding the size evicts down to the low watermark (27 bytes)
+    cache.set(keys[2], b"2" * 11)
+    assert cache.get(keys[1]) is None
+    with cache.get(keys[0]) as fp:
+        assert fp.read() == b"0" * 10
+    with cache.get(keys[2]) as fp:
+        assert fp.read() == b"2" * 11
+
+    cache.clear()
+    assert cache.get(keys[0]) is None
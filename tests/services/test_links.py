@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the precompiled links."""
+
+from flask import current_app
+from invenio_base import invenio_url_for
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.services.links import (
+    RDMConditionalLink,
+    RDMEndpointLink,
+    RDMLinksTemplate,
+    build_url,
+    compile_endpoint,
+)
+
+
+def test_build_url_compiled(appctx):
+    """Test that the compiled links are the same as the ones built by the app."""
+    values = [
+        ("records.read", {"pid_value": "abcd-1234"}),
+        ("records.read", {"pid_value": "a b/c?d#e%f:g@h é"}),
+        ("records.search_versions", {"pid_value": "abcd-1234", "page": 2}),
+        (
+            "iiif.image_api",
+            {
+                "image_format": "jpg",
+                "quality": "default",
+                "region": "full",
+                "rotation": "0",
+                "size": "^100,",
+                "uuid": "record:abcd-1234:my image.png",
+            },
+        ),
+    ]
+    for endpoint, vars in values:
+        assert build_url(endpoint, vars) == invenio_url_for(endpoint, **vars)
+
+    templates = current_rdm_records.link_templates
+    assert templates[("records.read", ("pid_value",))] is not None
+
+
+def test_build_url_fallback(appctx):
+    """Test that the links which cannot be compiled are built by the app."""
+    assert compile_endpoint("records.read", ["pid_value", "pid_value_2"]) is None
+    assert compile_endpoint("unknown.endpoint", ["pid_value"]) is None
+
+    vars = {"pid_value": "abcd-1234"}
+    assert build_url("records.read", vars, anchor="files") == invenio_url_for(
+        "records.read", _anchor="files", **vars
+    )
+
+    current_app.config["RDM_LINKS_COMPILED"] = False
+    try:
+        assert build_url("records.read", vars) == invenio_url_for(
+            "records.read", **vars
+        )
+    finally:
+        current_app.config["RDM_LINKS_COMPILED"] = True
+
+
+def test_links_template_shared_predicates(appctx):
+    """Test that the predicates are computed once, and that keys are filtered."""
+    calls = []
+
+    def is_even(obj, ctx):
+        calls.append(obj)
+        return obj["id"] % 2 == 0
+
+    def pid_vars(obj, vars):
+        vars["pid_value"] = str(obj["id"])
+
+    tpl = RDMLinksTemplate(
+        {
+            "self": RDMConditionalLink(
+                cond=is_even,
+                if_=RDMEndpointLink(
+                    "records.read", params=["pid_value"], vars=pid_vars
+                ),
+                else_=RDMEndpointLink(
+                    "records.read_draft", params=["pid_value"], vars=pid_vars
+                ),
+            ),
+            "latest": RDMEndpointLink(
+                "records.read_latest",
+                params=["pid_value"],
+                vars=pid_vars,
+                when=is_even,
+            ),
+        }
+    )
+
+    links = tpl.expand(None, {"id": 2})
+    assert links == {
+        "self": invenio_url_for("records.read", pid_value="2"),
+        "latest": invenio_url_for("records.read_latest", pid_value="2"),
+    }
+    assert len(calls) == 1
+
+    assert tpl.expand(None, {"id": 3}, keys=["self"]) == {
+        "self": invenio_url_for("records.read_draft", pid_value="3"),
+    }
+    assert len(calls) == 2
@@ -7,6 +7,7 @@
 
 from copy import deepcopy
 
+import jsonpatch
 import pytest
 from invenio_access.permissions import system_identity
 from invenio_pidstore.errors import PIDDoesNotExistError
@@ -462,3 +463,54 @@ def test_search_sort_verified_enabled(
 
     expected_order = [v_record.id, nv_record.id]
     assert expected_order == [h["id"] for h in hits]
+
+
+def test_search_revisions_paginated(running_app, search_clear, minimal_record):
+    """Test the keyset pagination and the modes of the revisions listing."""
+    superuser_identity = running_app.superuser_identity
+    service = current_rdm_records.records_service
+
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+    for title in ("Second title", "Third title"):
+        draft = service.edit(superuser_identity, record.id)
+        data = deepcopy(draft.data)
+        data["metadata"]["title"] = title
+        service.update_draft(superuser_identity, draft.id, data)
+        record = service.publish(superuser_identity, draft.id)
+
+    full = service.search_revisions(
+        superuser_identity, record.id, size=100, mode="full"
+    ).to_dict()
+    assert len(full) > 2
+    assert full[0]["json"]["metadata"]["title"] == "Third title"
+
+    # walk through the metadata-only pages
+    ids, after = [], None
+    while True:
+        page = service.search_revisions(
+            superuser_identity, record.id, size=2, after=after
+        )
+        items = page.to_dict()
+        assert len(items) <= 2
+        assert all("json" not in item for item in items)
+        ids += [item["revision_id"] for item in items]
+        after = page.next_after
+        if after is None:
+            break
+    assert ids == [item["revision_id"] for item in full]
+
+    # the patches rebuild the latest revision, from the oldest one
+    patches, after = [], None
+    while True:
+        page = service.search_revisions(
+            superuser_identity, record.id, size=2, after=after, mode="diff"
+        )
+        patches += [item["patch"] for item in page.to_dict()]
+        after = page.next_after
+        if after is None:
+            break
+    data = {}
+    for patch in reversed(patches):
+        data = jsonpatch.apply_patch(data, patch)
+    assert data == full[0]["json"]
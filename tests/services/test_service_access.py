@@ -5,6 +5,7 @@
 
 import pytest
 from invenio_records_resources.services.errors import PermissionDeniedError
+from marshmallow import ValidationError
 
 from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.services.errors import GrantExistsError
@@ -208,6 +209,50 @@ def test_create_multiple_grants_one_exists(running_app, minimal_record, users):
     }
 
 
+def test_batch_create_grants(running_app, minimal_record, users, roles):
+    """Test creating a batch of grants, larger than the bulk creation limit."""
+    superuser_identity = running_app.superuser_identity
+    records_service = current_rdm_records.records_service
+    draft = records_service.create(superuser_identity, minimal_record)
+    record = records_service.publish(superuser_identity, draft.id)
+    access_service = records_service.access
+
+    user_grants = [
+        {"subject": {"type": "user", "id": str(user.id)}, "permission": "preview"}
+        for user in users
+    ]
+    role_grant = {"subject": {"type": "role", "id": roles[0].id}, "permission": "view"}
+    unknown_grant = {"subject": {"type": "user", "id": "999999"}, "permission": "view"}
+
+    # the subjects are validated all at once, and nothing is added on failure
+    with pytest.raises(ValidationError):
+        access_service.batch_create_grants(
+            superuser_identity,
+            record.id,
+            {"grants": [*user_grants, role_grant, unknown_grant]},
+        )
+    assert len(access_service.read_all_grants(superuser_identity, record.id)) == 0
+
+    # the bulk creation is limited to 100 grants per call
+    grants_payload = {"grants": [*user_grants, role_grant] * 60}
+    with pytest.raises(ValidationError):
+        access_service.bulk_create_grants(superuser_identity, record.id, grants_payload)
+    access_service.batch_create_grants(superuser_identity, record.id, grants_payload)
+
+    grants = access_service.read_all_grants(superuser_identity, record.id)
+    assert len(grants) == len(users) + 1
+    assert {(g["subject"]["type"], g["subject"]["id"]) for g in grants} == {
+        *(("user", str(user.id)) for user in users),
+        ("role", roles[0].id),
+    }
+
+    # existing grants are detected
+    with pytest.raises(GrantExistsError):
+        access_service.batch_create_grants(
+            superuser_identity, record.id, {"grants": [role_grant]}
+        )
+
+
 def test_read_grant_by_subjectid_found(running_app, minimal_record, users):
     """Test read grant by user id."""
     # create record
@@ -68,6 +68,32 @@ def test_bulk_add_already_in_community(community, uploader, record_factory):
     ]
 
 
+def test_bulk_add_chunks(community, uploader, record_factory, set_app_config_fn_scoped):
+    """Test bulk add in several chunks, with records that can't be found."""
+    set_app_config_fn_scoped({"RDM_COMMUNITY_BULK_ADD_CHUNK_SIZE": 2})
+    recs = [
+        record_factory.create_record(uploader=uploader, community=None)
+        for _ in range(3)
+    ]
+    record_ids = [rec["id"] for rec in recs]
+
+    errors = current_record_communities_service.bulk_add(
+        system_identity, str(community.id), [*record_ids, "not-found"]
+    )
+
+    assert errors == [
+        {
+            "record_id": "not-found",
+            "community_id": str(community.id),
+            "message": "Record not found.",
+        }
+    ]
+    for record_id in record_ids:
+        _rec = current_rdm_records_service.record_cls.pid.resolve(record_id)
+        assert community.id in _rec.parent.communities.ids
+        assert str(_rec.parent.communities.default.id) == community.id
+
+
 def test_add_community_component_called(
     community, uploader, community_owner, record_factory, set_app_config_fn_scoped
 ):
@@ -3,11 +3,20 @@
 
 """Service tasks tests."""
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
+from invenio_search.proxies import current_search_client
+from invenio_search.utils import prefix_index
+from invenio_stats.bookmark import BookmarkAPI
 
 from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.records.api import RDMDraft
-from invenio_rdm_records.services.tasks import update_expired_embargos
+from invenio_rdm_records.services.tasks import (
+    reindex_stats,
+    reindex_stats_parents,
+    update_expired_embargos,
+)
 
 
 def test_embargo_lift_without_draft(embargoed_files_record, running_app, search_clear):
@@ -76,3 +85,62 @@ def test_embargo_lift_with_updated_draft(
     assert draft_lifted.access.embargo.active is False
     assert draft_lifted.access.protection.files == "restricted"
     assert draft_lifted.access.protection.record == "public"
+
+
+def test_reindex_stats_without_events(running_app, search_clear):
+    assert reindex_stats(("stats-record-view", "stats-file-download")) == (
+        "0 parents dispatched for reindexing"
+    )
+
+
+def test_reindex_stats_in_pages(running_app, search_clear, monkeypatch, mocker):
+    """Test that the changed stats are reindexed page by page."""
+    monkeypatch.setitem(running_app.app.config, "RDM_STATS_REINDEX_CHUNK_SIZE", 2)
+    delay = mocker.patch.object(reindex_stats_parents, "delay")
+    set_bookmark = mocker.spy(BookmarkAPI, "set_bookmark")
+
+    index = prefix_index("stats-record-view-test")
+    current_search_client.indices.create(
+        index=index,
+        body={
+            "mappings": {
+                "properties": {
+                    "updated_timestamp": {"type": "date"},
+                    "parent_recid": {"type": "keyword"},
+                }
+            }
+        },
+    )
+    now = datetime.now(timezone.utc)
+    events = [
+        ("parent-1", now - timedelta(hours=3)),
+        ("parent-2", now - timedelta(hours=3)),
+        ("parent-1", now - timedelta(hours=1)),
+        ("parent-3", now - timedelta(hours=1)),
+    ]
+    try:
+        for parent_id, updated in events:
+            current_search_client.index(
+                index=index,
+                body={"parent_recid": parent_id, "updated_timestamp": updated},
+            )
+        current_search_client.indices.refresh(index=index)
+
+        assert reindex_stats(("stats-record-view",)) == (
+            "4 parents dispatched for reindexing"
+        )
+    finally:
+        current_search_client.indices.delete(index=index)
+
+    # one task per page of the composite aggregation
+    assert [sorted(call.args[0]) for call in delay.call_args_list] == [
+        ["parent-1", "parent-2"],
+        ["parent-1", "parent-3"],
+    ]
+    # the bookmark moves forward after each full page, and to the run start
+    bookmarks = [call.args[1] for call in set_bookmark.call_args_list]
+    assert len(bookmarks) == 3
+    assert bookmarks == sorted(bookmarks)
+    assert bookmarks[0] <= (now - timedelta(hours=3)).isoformat()
+    assert bookmarks[1] <= (now - timedelta(hours=1)).isoformat()
+    assert bookmarks[2] >= now.isoformat()
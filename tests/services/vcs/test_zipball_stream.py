@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Release zipball streaming tests."""
+
+import hashlib
+import os
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+import requests
+from invenio_vcs.contrib.github import GitHubProvider
+
+from invenio_rdm_records.services.errors import ZipballTransferError
+from invenio_rdm_records.services.vcs.release import _range_request
+from invenio_rdm_records.services.vcs.stream import ZipballStream
+
+CONTENT = os.urandom(300 * 1024)
+
+
+class ZipballHandler(BaseHTTPRequestHandler):
+    """Local stand-in for a VCS zipball download."""
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(self.headers.get("Range"))
+        server.authorizations.append(self.headers.get("Authorization"))
+        start = 0
+        if server.ranges and self.headers.get("Range"):
+            start = int(self.headers["Range"][len("bytes=") :].rstrip("-"))
+
+        self.send_response(206 if start else 200)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Length", str(len(CONTENT) - start))
+        self.end_headers()
+
+        body = CONTENT[start:]
+        if server.failures:
+            # drop the connection in the middle of the transfer
+            server.failures -= 1
+            self.wfile.write(body[: len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def zipball_server():
+    """Run a local stand-in zipball server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ZipballHandler)
+    server.requests = []
+    server.authorizations = []
+    server.failures = 0
+    server.ranges = True
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/archive.zip"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _opener(url):
+    """Open the URL from an offset, with a range request."""
+
+    @contextmanager
+    def open_stream(offset):
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        with requests.get(url, headers=headers, stream=True, timeout=5) as resp:
+            yield resp.raw
+
+    return open_stream
+
+
+def _read_all(stream, size=8192):
+    """Consume the stream like the files storage does."""
+    chunks = []
+    while True:
+        chunk = stream.read(size)
+        if not chunk:
+            break
+        assert len(chunk) <= stream.buffer_size
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def test_zipball_stream(appctx, zipball_server):
+    """Test that the zipball is checksummed while it is read."""
+    with ZipballStream(_opener(zipball_server.url), buffer_size=4096) as stream:
+        assert stream.content_length == len(CONTENT)
+        assert _read_all(stream, size=-1) == CONTENT
+
+    assert stream.checksum == f"md5:{hashlib.md5(CONTENT).hexdigest()}"
+    assert stream.stats["bytes"] == len(CONTENT)
+    assert stream.stats["retries"] == 0
+    assert zipball_server.requests == [None]
+
+
+@pytest.mark.parametrize("ranges", [True, False])
+def test_zipball_stream_resume(appctx, zipball_server, ranges):
+    """Test that the transfer is resumed after a dropped connection."""
+    zipball_server.failures = 1
+    zipball_server.ranges = ranges
+    with ZipballStream(
+        _opener(zipball_server.url), retry_backoff=0, sleep=lambda s: None
+    ) as stream:
+        assert _read_all(stream) == CONTENT
+
+    assert stream.checksum == f"md5:{hashlib.md5(CONTENT).hexdigest()}"
+    assert stream.stats["retries"] == 1
+    assert zipball_server.requests[0] is None
+    assert zipball_server.requests[1].startswith("bytes=")
+
+
+def test_zipball_stream_failure(appctx, zipball_server):
+    """Test that the transfer fails after the last resume."""
+    zipball_server.failures = 2
+    with ZipballStream(
+        _opener(zipball_server.url),
+        max_retries=1,
+        retry_backoff=0,
+        sleep=lambda s: None,
+    ) as stream:
+        with pytest.raises(ZipballTransferError):
+            _read_all(stream)
+    assert stream.retries == 1
+
+
+def test_zipball_stream_resume_failure(appctx, zipball_server):
+    """Test that a failure to resume the transfer counts as a resume."""
+    zipball_server.failures = 1
+    open_stream = _opener(zipball_server.url)
+    opened = []
+
+    def flaky_open_stream(offset):
+        opened.append(offset)
+        if len(opened) == 2:
+            raise requests.exceptions.ConnectionError("Connection refused")
+        return open_stream(offset)
+
+    with ZipballStream(
+        flaky_open_stream, retry_backoff=0, sleep=lambda s: None
+    ) as stream:
+        assert _read_all(stream) == CONTENT
+
+    assert stream.retries == 2
+    assert len(opened) == 3
+
+
+def test_zipball_range_request_authenticated(appctx, zipball_server):
+    """Test that the transfer is resumed with the provider's session."""
+    session = requests.Session()
+    session.headers["Authorization"] = "token secret"
+    provider = GitHubProvider.__new__(GitHubProvider)
+    provider.__dict__["_github"] = SimpleNamespace(session=session)
+
+    with _range_request(provider, zipball_server.url, 1024, timeout=5) as resp:
+        assert resp.read() == CONTENT[1024:]
+    assert zipball_server.requests == ["bytes=1024-"]
+    assert zipball_server.authorizations == ["token secret"]
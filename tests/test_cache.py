@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Process-local cache tests."""
+
+from invenio_rdm_records.cache import TTLCache
+
+
+class FakeTimer:
+    """Manually advanced timer."""
+
+    def __init__(self):
+        """Constructor."""
+        self.now = 0
+
+    def __call__(self):
+        """Current time."""
+        return self.now
+
+
+def test_ttl_cache_lru_eviction():
+    cache = TTLCache(maxsize=2, ttl=None)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expiry():
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=10, ttl=5, timer=timer)
+    cache.set("a", 1)
+
+    timer.now = 4
+    assert cache.get("a") == 1
+    timer.now = 5
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_get_or_set_and_stats():
+    cache = TTLCache(maxsize=10, ttl=None)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_set("a", factory) == "value"
+    assert cache.get_or_set("a", factory) == "value"
+    assert len(calls) == 1
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_ttl_cache_invalidate():
+    cache = TTLCache(maxsize=10, ttl=None)
+    cache.set(("languages", "a"), 1)
+    cache.set(("licenses", "a"), 2)
+
+    cache.invalidate(lambda key: key[0] == "languages")
+    assert ("languages", "a") not in cache
+    assert cache.get(("licenses", "a")) == 2
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_ttl_cache_delete():
+    cache = TTLCache(maxsize=10, ttl=None)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.delete("a")
+    cache.delete("missing")
+    assert "a" not in cache
+    assert cache.get("b") == 2
+
+
+def test_ttl_cache_update():
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=10, ttl=5, timer=timer)
+    cache.set("a", {"x": 1})
+    value = cache.get("a")
+
+    timer.now = 4
+    cache.update("a", lambda cached: {**cached, "y": 2})
+    cache.update("missing", lambda cached: cached)
+    assert cache.get("a") == {"x": 1, "y": 2}
+    assert value == {"x": 1}  # the previous value is not mutated
+    assert "missing" not in cache
+
+    # the expiry is kept
+    timer.now = 5
+    assert "a" not in cache